@@ -0,0 +1,112 @@
+# blit_variants.py
+#
+# Blit throughput of each surface variant assets.bake can produce, and of
+# the pre-rendered primitive tiles against the draw calls they replace.
+#
+#   python -m benchmarks.blit_variants
+#   python -m benchmarks.blit_variants --seconds 0.5
+
+import argparse
+import time
+
+from src.headless import init_headless
+
+def rate(fn, seconds):
+    """Calls per second of fn() over roughly `seconds`."""
+    calls = 0
+    started = time.perf_counter()
+    deadline = started + seconds
+    while True:
+        for _ in range(200):
+            fn()
+        calls += 200
+        now = time.perf_counter()
+        if now >= deadline:
+            return calls / (now - started)
+
+def sprite_variants(path, width):
+    """(label, surface) for one sprite: as loaded, converted, colorkeyed, RLE."""
+    import pygame
+    from src.assets import COLORKEY, _rgba, bake, has_binary_alpha, scale_preserving_ratio
+
+    original = pygame.image.load(path)
+    plain = pygame.transform.scale(_rgba(original), scale_preserving_ratio(original, width).get_size())
+    smooth = scale_preserving_ratio(original, width)
+
+    alpha = smooth.convert_alpha()
+    alpha_rle = smooth.convert_alpha()
+    alpha_rle.set_alpha(255, pygame.RLEACCEL)
+
+    keyed = bake(smooth, binary_alpha=True)          # colorkey + RLE
+    keyed_plain = keyed.copy()
+    keyed_plain.set_colorkey(COLORKEY)               # same pixels, no RLE
+
+    return [
+        ("loaded, scale()", plain),
+        ("convert_alpha()", alpha),
+        ("convert_alpha() + RLE", alpha_rle),
+        ("colorkey", keyed_plain),
+        ("colorkey + RLE", keyed),
+        ("bake() default", bake(smooth, has_binary_alpha(original))),
+    ]
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Blit throughput per surface variant.")
+    parser.add_argument("--seconds", type=float, default=0.25, help="time per measurement")
+    args = parser.parse_args(argv)
+
+    init_headless()
+    import pygame
+    import src.config as c
+    from src.bubbles import bubble_surface
+    from src.game_platform import platform_surface
+    from src.player import player_surface
+    from src.spikes import Spikes
+
+    screen = pygame.display.get_surface()
+    pos = (200.5, 300.5)
+
+    print(f"{'sprite':<14} {'variant':<24} {'blits/s':>10}")
+    sprites = [("pikachu", "assets/pikachu.png", int(c.OBSTACLE_WIDTH_FRAC * c.WIDTH)),
+               ("star_coin", "assets/star_coin.gif", int(c.COIN_WIDTH_FRAC * c.WIDTH))]
+    for name, path, width in sprites:
+        for label, surf in sprite_variants(path, width):
+            print(f"{name:<14} {label:<24} {rate(lambda: screen.blit(surf, pos), args.seconds):>10.0f}")
+
+    print()
+    print(f"{'primitive':<14} {'variant':<24} {'calls/s':>10}")
+    w = int(c.PLATFORM_WIDTH_FRAC * c.WIDTH)
+    h = int(c.PLATFORM_HEIGHT_FRAC * c.HEIGHT)
+    side = int(c.SQUARE_WIDTH_FRAC * c.WIDTH)
+    radius = c.BUBBLE_MAX_RADIUS
+    spikes = Spikes()
+    plat, player, bubble = platform_surface(w, h), player_surface(side, side), bubble_surface(radius)
+
+    rows = [
+        ("platform", "draw.rect", lambda: pygame.draw.rect(screen, (0, 255, 0), (*pos, w, h))),
+        ("platform", "tile blit", lambda: screen.blit(plat, pos)),
+        ("player", "draw.rect", lambda: pygame.draw.rect(screen, (0, 0, 255), (*pos, side, side))),
+        ("player", "tile blit", lambda: screen.blit(player, pos)),
+        ("bubble", "draw.circle", lambda: pygame.draw.circle(screen, c.BUBBLE_COLOR, (200, 300), radius)),
+        ("bubble", "tile blit", lambda: screen.blit(bubble, pos)),
+        ("spikes", "polygons", lambda: _draw_spike_polygons(screen, spikes)),
+        ("spikes", "strip blit", lambda: spikes.draw(screen)),
+    ]
+    for name, label, fn in rows:
+        print(f"{name:<14} {label:<24} {rate(fn, args.seconds):>10.0f}")
+
+def _draw_spike_polygons(screen, spikes):
+    """Spikes as they were drawn before the strip: one polygon per spike."""
+    import pygame
+    import src.config as c
+    spike_width = c.WIDTH // c.SPIKE_COUNT
+    for i in range(c.SPIKE_COUNT):
+        left_x = i * spike_width
+        pygame.draw.polygon(screen, c.SPIKE_COLOR, [
+            (left_x, spikes.y + spikes.height),
+            (left_x + spike_width, spikes.y + spikes.height),
+            (left_x + spike_width // 2, spikes.y),
+        ])
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,78 @@
+# draw_batch.py
+#
+# Per-entity draw calls versus one batched (and culled) Surface.blits per
+# frame: first for the whole generated level 1, then at increasing counts of
+# on-screen entities.
+#
+#   python -m benchmarks.draw_batch
+#   python -m benchmarks.draw_batch --counts 50 200 800 --frames 300
+
+import argparse
+import random
+import time
+
+from src.headless import init_headless
+
+def _populate(lm, count, images):
+    """Fills the level manager with `count` platforms, obstacles and coins each."""
+    from src.game_platform import Platform
+    from src.obstacle import Obstacle
+    from src.coin import StarCoin
+    import src.config as c
+
+    rng = random.Random(0)
+    lm.platforms[:] = [Platform(rng.randint(-200, c.WIDTH), rng.randint(200, 700))
+                       for _ in range(count)]
+    lm.obstacles[:] = [Obstacle(rng.randint(-40, c.WIDTH), rng.randint(200, 700),
+                                images['pokemon_images']) for _ in range(count)]
+    StarCoin.set_image(images['coin_image'])
+    lm.star_coins[:] = [StarCoin(rng.randint(-30, c.WIDTH), rng.randint(200, 700))
+                        for _ in range(count)]
+
+def per_entity(screen, lm, scroll):
+    for platform in lm.platforms:
+        platform.draw(screen, scroll)
+    for obs in lm.obstacles:
+        obs.draw(screen, scroll)
+    for coin in lm.star_coins:
+        coin.draw(screen, scroll)
+
+def batched(screen, lm, scroll):
+    screen.blits(lm.draw_list(scroll), doreturn=False)
+
+def time_frames(draw, screen, lm, frames):
+    started = time.perf_counter()
+    for i in range(frames):
+        draw(screen, lm, (i % 10) * 0.5)
+    return (time.perf_counter() - started) / frames
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Per-entity draws vs Surface.blits.")
+    parser.add_argument("--counts", type=int, nargs="+", default=[10, 50, 200, 800],
+                        help="platforms, obstacles and coins each")
+    parser.add_argument("--frames", type=int, default=200)
+    args = parser.parse_args(argv)
+
+    init_headless()
+    import pygame
+    from src.assets import load_images
+    from src.level_manager import LevelManager
+
+    screen = pygame.display.get_surface()
+    images = load_images()
+    lm = LevelManager(images['pokemon_images'], images['coin_image'])
+
+    print(f"{'entities':>8} {'per-entity ms':>14} {'blits ms':>9} {'speedup':>8}")
+    total = len(lm.platforms) + len(lm.obstacles) + len(lm.star_coins)
+    slow = time_frames(per_entity, screen, lm, args.frames)
+    fast = time_frames(batched, screen, lm, args.frames)
+    print(f"{total:>8} {slow * 1000:>14.3f} {fast * 1000:>9.3f} {slow / fast:>7.2f}x  (level 1)")
+
+    for count in args.counts:
+        _populate(lm, count, images)
+        slow = time_frames(per_entity, screen, lm, args.frames)
+        fast = time_frames(batched, screen, lm, args.frames)
+        print(f"{3 * count:>8} {slow * 1000:>14.3f} {fast * 1000:>9.3f} {slow / fast:>7.2f}x")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,89 @@
+# entity_memory.py
+#
+# Memory held by the level entities, measured with tracemalloc: bytes per
+# instance of each entity class, then the whole footprint of every
+# level's generated layout and of long levels (as a long endless run
+# would accumulate if nothing were dropped).
+#
+#   python -m benchmarks.entity_memory
+#   python -m benchmarks.entity_memory --durations 600 3600 --count 20000
+
+import argparse
+import gc
+import tracemalloc
+
+from src.headless import init_headless
+
+def measure(build):
+    """(bytes still allocated after build(), its result)."""
+    gc.collect()
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    result = build()
+    gc.collect()
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    return after - before, result
+
+def empty_pools():
+    """Drops the pooled entities, so a layout is allocated from scratch."""
+    from src.pool import POOLS
+    for pool in POOLS.values():
+        pool.free.clear()
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Bytes per entity and per level layout.")
+    parser.add_argument("--count", type=int, default=10000, help="instances per class")
+    parser.add_argument("--durations", type=int, nargs="+", default=[600, 3600],
+                        help="LEVEL_DURATION of the long levels (one platform per second)")
+    args = parser.parse_args(argv)
+
+    init_headless()
+    import src.config as c
+    import src.levels_config as lvl
+    from src.assets import load_images
+    from src.bubbles import Bubble
+    from src.coin import StarCoin
+    from src.game_platform import Platform
+    from src.level_manager import LevelManager
+    from src.obstacle import Obstacle
+    from src.player import Player
+
+    images = load_images()
+    StarCoin.set_image(images['coin_image'])
+    Platform(0, 0)  # the shared surface is not counted against the instances
+    classes = [
+        ("Player", Player),
+        ("Platform", lambda: Platform(0, 0)),
+        ("Obstacle", lambda: Obstacle(0, 0, images['pokemon_images'])),
+        ("StarCoin", lambda: StarCoin(0, 0)),
+        ("Bubble", lambda: Bubble(0, 0)),
+    ]
+    print(f"{'entity':<10} {'bytes each':>10}")
+    for name, make in classes:
+        size, _ = measure(lambda: [make() for _ in range(args.count)])
+        # Less the list holding them (8 bytes a pointer)
+        print(f"{name:<10} {(size - 8 * args.count) / args.count:>10.1f}")
+
+    print()
+    print(f"{'level':<24} {'platforms':>9} {'obstacles':>9} {'coins':>6} {'KiB':>8}")
+
+    def footprint(label, params):
+        empty_pools()
+        size, lm = measure(lambda: LevelManager(images['pokemon_images'], images['coin_image'], params))
+        print(f"{label:<24} {len(lm.platforms):>9} {len(lm.obstacles):>9} "
+              f"{len(lm.star_coins):>6} {size / 1024:>8.1f}")
+        lm.release()
+
+    for i, params in enumerate(lvl.LEVELS):
+        footprint(f"{i + 1}: {params.get('name', '')}", params)
+    duration = c.LEVEL_DURATION
+    try:
+        for seconds in args.durations:
+            c.LEVEL_DURATION = seconds
+            footprint(f"1 lasting {seconds} s", lvl.LEVELS[0])
+    finally:
+        c.LEVEL_DURATION = duration
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,81 @@
+# ghost.py
+#
+# Cost of ghost racing per frame: recording the player's state after each
+# step, and streaming a stored run back from its file and drawing it. The
+# ghost is a bot's run through a level; playback is timed over the whole
+# file, repeatedly, against the budget of 0.1 ms per frame.
+#
+#   python -m benchmarks.ghost
+#   python -m benchmarks.ghost --level 3 --repeat 50
+
+import argparse
+import os
+import tempfile
+import time
+
+from src.headless import init_headless
+
+BUDGET_MS = 0.1
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Ghost recording and playback cost per frame.")
+    parser.add_argument("--level", type=int, default=1, help="1-based level the bot plays")
+    parser.add_argument("--repeat", type=int, default=20, help="playbacks of the stored run timed")
+    args = parser.parse_args(argv)
+
+    init_headless()
+    import src.config as c
+    import src.ghost as ghost
+    from src.bot import Bot
+    from src.game_manager import Game
+    from src.headless import level_frames
+
+    game = Game(args.level - 1)
+    bot = Bot(seed=0)
+    recorder = ghost.GhostRecorder()
+    record_time = 0.0
+    limit = level_frames()
+    death = None
+    while death is None and game.frames < limit:
+        bot.act(game)
+        death = game.step()
+        started = time.perf_counter()
+        recorder.record(game.player)
+        record_time += time.perf_counter() - started
+    steps = recorder.frames
+    print(f"Bot run: {steps} steps, {death or 'complete'}, {game.current_level_coins} coins")
+    print(f"record   {record_time / steps * 1e6:8.2f} us per step")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "level.ghost")
+        recorder.save(path, game.current_level_coins)
+        size = os.path.getsize(path)
+        # What the same run takes as float32 x, y and a charge byte per step
+        raw = steps * 9
+        print(f"file     {size:8d} bytes ({size / steps:.2f} per step; {raw} as raw floats)")
+
+        screen = game.renderer
+        width, height = game.player.width, game.player.height
+        advance = draw = 0.0
+        for _ in range(args.repeat):
+            g = ghost.load(path, width, height)
+            for _ in range(steps):
+                t0 = time.perf_counter()
+                g.advance()
+                t1 = time.perf_counter()
+                g.draw(screen, 0.5)
+                t2 = time.perf_counter()
+                advance += t1 - t0
+                draw += t2 - t1
+            g.close()
+        frames = steps * args.repeat
+        total_ms = (advance + draw) / frames * 1000
+        print(f"advance  {advance / frames * 1e6:8.2f} us per frame")
+        print(f"draw     {draw / frames * 1e6:8.2f} us per frame")
+        verdict = "within" if total_ms < BUDGET_MS else "OVER"
+        print(f"playback {total_ms * 1000:8.2f} us per frame: {verdict} the "
+              f"{BUDGET_MS * 1000:.0f} us budget ({c.WIDTH}x{c.HEIGHT})")
+    game.release()
+
+if __name__ == "__main__":
+    main()
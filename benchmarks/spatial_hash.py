@@ -0,0 +1,75 @@
+# spatial_hash.py
+#
+# LevelManager's grid lookups against scanning every obstacle: generating
+# long, obstacle-dense levels (each coin is checked against the obstacles
+# near it) and the per-step collision check.
+#
+#   python -m benchmarks.spatial_hash
+#   python -m benchmarks.spatial_hash --durations 100 1000 --obstacles 4
+
+import argparse
+import time
+
+from src.headless import init_headless
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Spatial hash vs linear scans.")
+    parser.add_argument("--durations", type=int, nargs="+", default=[40, 400, 2000],
+                        help="LEVEL_DURATION of the generated levels (one platform per second)")
+    parser.add_argument("--obstacles", type=int, default=3, help="obstacle_max_per_platform")
+    parser.add_argument("--queries", type=int, default=2000, help="collision checks timed")
+    args = parser.parse_args(argv)
+
+    init_headless()
+    import pygame
+    import src.config as c
+    import src.levels_config as lvl
+    from src.assets import load_images
+    from src.level_manager import LevelManager
+
+    images = load_images(convert=False)
+    params = dict(lvl.LEVELS[0], obstacle_spawn_chance=0.9, obstacle_max_per_platform=args.obstacles,
+                  coin_chance=0.9)
+    lm = LevelManager(images['pokemon_images'], images['coin_image'], params)
+
+    def linear(manager):
+        # What the grid replaces: every obstacle is a candidate
+        manager.obstacles_near = lambda rect: manager.obstacles
+
+    def timed_generation(use_grid):
+        if use_grid:
+            lm.__dict__.pop("obstacles_near", None)
+        else:
+            linear(lm)
+        started = time.perf_counter()
+        lm.generate_seeded_level(0, params)
+        return time.perf_counter() - started
+
+    def timed_collisions(use_grid):
+        if use_grid:
+            lm.__dict__.pop("obstacles_near", None)
+        else:
+            linear(lm)
+        rects = [pygame.Rect(p.x + 10, p.y - 40, 30, 30) for p in lm.platforms]
+        started = time.perf_counter()
+        for i in range(args.queries):
+            lm.check_obstacle_collisions(rects[i % len(rects)])
+        return (time.perf_counter() - started) / args.queries
+
+    duration = c.LEVEL_DURATION
+    print(f"{'platforms':>9} {'obstacles':>9} {'generate scan':>14} {'generate grid':>14} "
+          f"{'collide scan':>13} {'collide grid':>13}")
+    try:
+        for seconds in args.durations:
+            c.LEVEL_DURATION = seconds
+            gen_scan = timed_generation(False)
+            col_scan = timed_collisions(False)
+            gen_grid = timed_generation(True)
+            col_grid = timed_collisions(True)
+            print(f"{len(lm.platforms):>9} {len(lm.obstacles):>9} {gen_scan * 1000:>11.1f} ms "
+                  f"{gen_grid * 1000:>11.1f} ms {col_scan * 1e6:>10.1f} us {col_grid * 1e6:>10.1f} us")
+    finally:
+        c.LEVEL_DURATION = duration
+
+if __name__ == "__main__":
+    main()
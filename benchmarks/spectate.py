@@ -0,0 +1,96 @@
+# spectate.py
+#
+# What spectator streaming costs the game, and what it sends: a bot plays
+# a level with a Publisher serving one spectator that reads every frame and
+# one that never reads at all (with the smallest socket buffers, so it falls
+# behind within the level). The game thread's time in Publisher.frame() is
+# timed per step, and the bytes the reading spectator got are compared with
+# sending every player in full each step.
+#
+#   python -m benchmarks.spectate
+#   python -m benchmarks.spectate --level 3 --players 2
+#   python -m benchmarks.spectate --backlog 512     the stalled spectator misses frames
+
+import argparse
+import socket
+import statistics
+import time
+
+from src.headless import init_headless
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Spectator streaming cost and size per frame.")
+    parser.add_argument("--level", type=int, default=1, help="1-based level the bot plays")
+    parser.add_argument("--players", type=int, default=1, help="versus players (1: single player)")
+    parser.add_argument("--backlog", type=int, help="bytes unsent before a spectator misses frames")
+    args = parser.parse_args(argv)
+
+    init_headless()
+    from src.bot import Bot
+    from src.game_manager import Game
+    from src.headless import level_frames
+    from src.spectate import Publisher
+    from src.versus import VersusGame
+
+    publisher = Publisher(port=0, backlog=args.backlog)
+    # Inherited by the spectators' sockets on the publisher's side
+    publisher.listener.setsockopt(socket.SOL_SOCKET, socket.SO_SNDBUF, 1)
+    # Never read: the sender thread must leave it behind, not the game
+    stalled = socket.socket()
+    stalled.setsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF, 1)
+    stalled.connect(publisher.address)
+    reader = socket.create_connection(publisher.address)
+    reader.setblocking(False)
+
+    if args.players > 1:
+        game = VersusGame(args.level - 1, args.players)
+    else:
+        game = Game(args.level - 1)
+    bots = [Bot(seed=n) for n in range(args.players)]
+    publisher.level(game)
+    received = 0
+    # A frame's header, then per player flags, x and y as int16 and charge
+    full = 2 + 6 * len(game.seats)
+    times = []
+    limit = level_frames()
+    death = None
+    while death is None and game.frames < limit:
+        for seat, bot in zip(game.seats, bots):
+            bot.act(seat)
+        death = game.step()
+        started = time.perf_counter()
+        publisher.frame(game)
+        times.append(time.perf_counter() - started)
+        try:
+            while True:
+                data = reader.recv(65536)
+                if not data:
+                    break
+                received += len(data)
+        except BlockingIOError:
+            pass
+        # The game's own pace: the sender thread runs between steps
+        time.sleep(0.5 / 30)
+    publisher.end(game, death)
+    time.sleep(0.2)
+    try:
+        while data := reader.recv(65536):
+            received += len(data)
+    except BlockingIOError:
+        pass
+    publisher.close()
+
+    steps = len(times)
+    times.sort()
+    print(f"{steps} steps, {args.players} player(s), {death or 'complete'}")
+    print(f"frame()  mean {statistics.fmean(times) * 1e6:7.1f} us  p99 "
+          f"{times[int(steps * 0.99)] * 1e6:7.1f} us  max {times[-1] * 1e6:7.1f} us")
+    print(f"received {received / steps:7.2f} bytes per step ({received} in all, with the "
+          f"level messages); {full} with every player in full")
+    print(publisher.summary())
+    print(f"unsent   {', '.join(str(len(conn.out)) for conn in publisher.connections)} "
+          f"bytes per spectator (backlog {publisher.backlog})")
+    game.release()
+
+if __name__ == "__main__":
+    main()
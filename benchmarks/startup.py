@@ -0,0 +1,77 @@
+# startup.py
+#
+# Launches main.py headless until its first frame, several times, and
+# reports wall-clock time to first frame for cold starts (empty bytecode
+# cache) and warm starts (cache filled by the previous launch), with the
+# phase timeline of the last warm launch and the slowest imports from
+# python -X importtime.
+#
+#   python -m benchmarks.startup
+#   python -m benchmarks.startup --runs 10 --imports 25
+
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+
+def launch(pycache, importtime=False):
+    """One headless launch of main.py; returns (wall seconds, stdout, stderr)."""
+    env = dict(os.environ, SDL_VIDEODRIVER="dummy", SDL_AUDIODRIVER="dummy",
+               PYTHONPYCACHEPREFIX=pycache, PYGAME_HIDE_SUPPORT_PROMPT="1")
+    env.pop("PYTHONDONTWRITEBYTECODE", None)  # warm starts need the cache written
+    cmd = [sys.executable]
+    if importtime:
+        cmd += ["-X", "importtime"]
+    cmd += ["main.py", "--startup-stats", "--exit-after-first-frame"]
+    started = time.perf_counter()
+    done = subprocess.run(cmd, env=env, capture_output=True, text=True, check=True)
+    return time.perf_counter() - started, done.stdout, done.stderr
+
+def slowest_imports(stderr, count):
+    """(cumulative us, self us, module) of the slowest imports, slowest first."""
+    rows = []
+    for line in stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        self_us, cumulative_us, name = line[len("import time:"):].split("|")
+        rows.append((int(cumulative_us), int(self_us), name.rstrip()))
+    return sorted(rows, reverse=True)[:count]
+
+def summary(times):
+    ms = [t * 1000 for t in times]
+    return f"median {statistics.median(ms):7.1f} ms  min {min(ms):7.1f} ms  max {max(ms):7.1f} ms"
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Cold and warm time to first frame.")
+    parser.add_argument("--runs", type=int, default=5, help="launches of each kind")
+    parser.add_argument("--imports", type=int, default=15, help="slowest imports to list")
+    args = parser.parse_args(argv)
+
+    cold, warm = [], []
+    for _ in range(args.runs):
+        with tempfile.TemporaryDirectory() as pycache:
+            cold.append(launch(pycache)[0])
+            seconds, timeline, _ = launch(pycache)
+            warm.append(seconds)
+
+    print(f"Launch to first frame over {args.runs} runs (process start to exit):")
+    print(f"  cold (no bytecode cache)  {summary(cold)}")
+    print(f"  warm                      {summary(warm)}")
+    print()
+    print("Last warm launch, as main.py measures it (phase, duration, total):")
+    print("\n".join(line for line in timeline.splitlines() if line.startswith("  ")))
+
+    with tempfile.TemporaryDirectory() as pycache:
+        launch(pycache)
+        _, _, stderr = launch(pycache, importtime=True)
+    print()
+    print("Slowest imports (warm, -X importtime):")
+    print(f"  {'cumulative':>10} {'self':>8}  module")
+    for cumulative_us, self_us, name in slowest_imports(stderr, args.imports):
+        print(f"  {cumulative_us / 1000:8.1f}ms {self_us / 1000:6.1f}ms  {name}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,68 @@
+# versus.py
+#
+# What each extra versus player costs: a bot plays every seat through a
+# level, and the simulation step and the frame drawing are timed for one
+# player (Game) and for more (VersusGame), where the level's entities move
+# once per step and only the players' own work is repeated.
+#
+#   python -m benchmarks.versus
+#   python -m benchmarks.versus --players 1 2 4 --level 2
+
+import argparse
+import time
+
+from src.headless import init_headless
+
+def play(game, bots, limit):
+    """(seconds stepping, seconds drawing, steps) for one bot-played round."""
+    step_time = draw_time = 0.0
+    death = None
+    while death is None and game.frames < limit:
+        for seat, bot in zip(game.seats, bots):
+            bot.act(seat)
+        t0 = time.perf_counter()
+        death = game.step()
+        t1 = time.perf_counter()
+        game.draw_frame()
+        t2 = time.perf_counter()
+        step_time += t1 - t0
+        draw_time += t2 - t1
+    return step_time, draw_time, game.frames
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Step and draw cost per versus player count.")
+    parser.add_argument("--players", type=int, nargs="+", default=[1, 2, 4])
+    parser.add_argument("--level", type=int, default=1, help="1-based level played")
+    parser.add_argument("--rounds", type=int, default=3, help="rounds timed per player count")
+    args = parser.parse_args(argv)
+
+    init_headless()
+    from src.bot import Bot
+    from src.game_manager import Game
+    from src.headless import level_frames
+    from src.versus import VersusGame
+
+    limit = level_frames()
+    print(f"{'players':>7} {'step us':>9} {'draw us':>9} {'step x':>7} {'frame x':>8}")
+    base = None
+    for players in args.players:
+        step_time = draw_time = steps = 0
+        for r in range(args.rounds):
+            if players == 1:
+                game = Game(args.level - 1)
+            else:
+                game = VersusGame(args.level - 1, players)
+            bots = [Bot(seed=r * 10 + n) for n in range(players)]
+            s, d, n = play(game, bots, limit)
+            step_time += s
+            draw_time += d
+            steps += n
+            game.release()
+        step_us, draw_us = step_time / steps * 1e6, draw_time / steps * 1e6
+        if base is None:
+            base = (step_us, step_us + draw_us)
+        print(f"{players:>7} {step_us:>9.1f} {draw_us:>9.1f} {step_us / base[0]:>6.2f}x "
+              f"{(step_us + draw_us) / base[1]:>7.2f}x")
+
+if __name__ == "__main__":
+    main()
@@ -1,24 +1,119 @@
 # main.py
+import src.startup as startup
+import sys
 import pygame
 import src.config as c
 
+startup.mark("import pygame")
+
+if "--endless" in sys.argv:
+    c.ENDLESS_MODE = True
+if "--vsync" in sys.argv:
+    c.VSYNC = True
+if "--frame-stats" in sys.argv:
+    c.FRAME_STATS = True
+if "--input-latency" in sys.argv:
+    c.INPUT_LATENCY_STATS = True
+if "--audio-stats" in sys.argv:
+    c.AUDIO_STATS = True
+if "--gc-stats" in sys.argv:
+    c.GC_STATS = True
+if "--gc-policy" in sys.argv:
+    c.GC_POLICY = sys.argv[sys.argv.index("--gc-policy") + 1]
+if "--renderer" in sys.argv:
+    c.RENDERER = sys.argv[sys.argv.index("--renderer") + 1]
+if "--versus" in sys.argv:
+    i = sys.argv.index("--versus") + 1
+    c.VERSUS_PLAYERS = int(sys.argv[i]) if i < len(sys.argv) and sys.argv[i].isdigit() else 2
+if "--spectate" in sys.argv:
+    c.SPECTATE = True
+    i = sys.argv.index("--spectate") + 1
+    if i < len(sys.argv) and sys.argv[i].isdigit():
+        c.SPECTATE_PORT = int(sys.argv[i])
+if "--ghost" in sys.argv:
+    c.GHOSTS = True
+if "--record" in sys.argv:
+    c.RECORD_REPLAYS = True
+if "--level-pack" in sys.argv:
+    c.LEVEL_PACK = sys.argv[sys.argv.index("--level-pack") + 1]
+    # Only the pack's index: a bad pack fails here, before the window opens
+    from src.levelpack import LevelPackError, get_pack
+    try:
+        get_pack()
+    except LevelPackError as e:
+        sys.exit(f"Invalid level pack: {e}")
+
+if c.SPECTATE:
+    # Listening before the window opens, so a port in use fails right away
+    from src.spectate import get_publisher
+    try:
+        host, port = get_publisher().address
+    except OSError as e:
+        sys.exit(f"Cannot serve spectators on {c.SPECTATE_HOST}:{c.SPECTATE_PORT}: {e}")
+    print(f"Spectators can watch with: python -m src.spectate --host {host} --port {port}")
+
 pygame.mixer.pre_init(44100, -16, 2, 512)
 pygame.init()
 pygame.mixer.init()
+startup.mark("pygame.init")
 
-pygame.mixer.music.load("assets/signal.mp3")
-pygame.mixer.music.play(-1)
-
+# The window's size decides the sprites' size, so it is settled before preloading them
 if c.FULLSCREEN:
     info = pygame.display.Info()
-    screen = pygame.display.set_mode((info.current_w, info.current_h), pygame.FULLSCREEN)
+    size, flags = (info.current_w, info.current_h), pygame.FULLSCREEN
 else:
-    screen = pygame.display.set_mode((c.WIDTH, c.HEIGHT))
+    size, flags = (c.WIDTH, c.HEIGHT), 0
+
+# Decode images and sound effects on worker threads while the window opens
+from src.assets import preload
+from src.audio import get_audio
+preload(size[0])
+get_audio()
+
+def start_music():
+    try:
+        pygame.mixer.music.load("assets/signal.mp3")
+        pygame.mixer.music.play(-1)
+    except pygame.error as e:
+        print(f"Warning: no background music ({e}).")
+
+# Nothing to hear before there is something to see
+startup.after_first_frame(start_music)
+
+if "--startup-stats" in sys.argv:
+    startup.after_first_frame(lambda: print("Startup:\n" + "\n".join(startup.report())))
+if "--exit-after-first-frame" in sys.argv:
+    # For benchmarks.startup: measure a launch without playing
+    startup.after_first_frame(sys.exit)
+
+from src.renderer import init_renderer
+
+screen = None
+if c.RENDERER != "software":
+    # Opens its own window; falls back to software if it can't start
+    renderer = init_renderer(c.RENDERER, size, c.FULLSCREEN)
+    if renderer is not None:
+        c.WIDTH, c.HEIGHT = renderer.get_size()
+
+if c.RENDERER == "software":
+    if c.VSYNC:
+        # SDL only honours vsync through a renderer, which SCALED provides
+        try:
+            screen = pygame.display.set_mode(size, flags | pygame.SCALED, vsync=1)
+        except pygame.error as e:
+            print(f"Warning: vsync unavailable ({e}); pacing with the frame cap instead.")
+            c.VSYNC = False
+    if screen is None:
+        screen = pygame.display.set_mode(size, flags)
+    pygame.display.set_caption(c.WINDOW_TITLE)
+    init_renderer("software", size)
 
-# Store the final window size so other code sees it
-c.WIDTH, c.HEIGHT = screen.get_size()
+    # Store the final window size so other code sees it
+    c.WIDTH, c.HEIGHT = screen.get_size()
+startup.mark("window")
 
 from src.game_manager import main
+startup.mark("import game")
 
 if __name__ == "__main__":
     main()
@@ -1,34 +1,166 @@
 # assets.py
 import pygame
 import src.config as c
+from src.atlas import Atlas
+from src.gif import load_gif_frames
+
+# Transparent colour for colorkeyed surfaces (must not appear in any sprite)
+COLORKEY = (255, 0, 255)
+
+def _rgba(surf):
+    """32-bit per-pixel alpha copy (a colorkey becomes transparency); needs no display."""
+    out = pygame.Surface(surf.get_size(), pygame.SRCALPHA, 32)
+    out.blit(surf, (0, 0))
+    return out
+
+def scale_preserving_ratio(original_surf, new_width):
+    orig_w, orig_h = original_surf.get_size()
+    aspect = orig_h / float(orig_w)
+    new_height = int(new_width * aspect)
+    if original_surf.get_bitsize() < 24:
+        original_surf = _rgba(original_surf)  # smoothscale needs 24/32-bit pixels
+    return pygame.transform.smoothscale(original_surf, (new_width, new_height))
+
+def _threshold_alpha(surf):
+    """32-bit copy whose alpha is 0 or 255 (cut at 128), e.g. after smoothscale."""
+    out = _rgba(surf)
+    alpha = pygame.surfarray.pixels_alpha(out)
+    alpha[:] = (alpha >= 128) * 255
+    del alpha
+    return out
+
+def has_binary_alpha(surf):
+    """True if every pixel is fully opaque or fully transparent."""
+    if surf.get_colorkey() is not None or not surf.get_flags() & pygame.SRCALPHA:
+        return True
+    alpha = pygame.surfarray.pixels_alpha(surf)
+    binary = bool(((alpha == 0) | (alpha == 255)).all())
+    del alpha  # releases the surface lock
+    return binary
+
+def bake(surf, binary_alpha=None):
+    """
+    Display-format copy of surf for the fastest blits:
+      - opaque surfaces are converted to the display format
+      - binary alpha becomes a colorkeyed, RLE-accelerated surface (alpha of
+        a smoothscaled edge is thresholded at 128 to stay crisp)
+      - soft alpha keeps per-pixel alpha, also RLE-accelerated
+    binary_alpha defaults to has_binary_alpha(surf); pass the answer for the
+    unscaled source when surf has been smoothscaled. Without a display mode
+    (headless tools) surf is returned unchanged.
+    """
+    if pygame.display.get_surface() is None:
+        return surf
+    if binary_alpha is None:
+        binary_alpha = has_binary_alpha(surf)
+
+    if surf.get_colorkey() is None and not surf.get_flags() & pygame.SRCALPHA:
+        return surf.convert()
+
+    if binary_alpha:
+        src = _threshold_alpha(surf)
+        out = pygame.Surface(src.get_size()).convert()
+        out.fill(COLORKEY)
+        out.blit(src, (0, 0))
+        out.set_colorkey(COLORKEY, pygame.RLEACCEL)
+        return out
+
+    out = surf.convert_alpha()
+    out.set_alpha(255, pygame.RLEACCEL)
+    return out
+
+POKEMON = ["pikachu", "charmander", "bulbasaur", "squirtle"]
+
+# Set by preload(): the worker decoding the Pokemon sprites
+_preload = None
+# load_assets() result, shared by every Game (a restart reuses it)
+_assets = None
+
+def _load_scaled(path, width):
+    original = pygame.image.load(path)
+    scaled = scale_preserving_ratio(original, width)
+    if has_binary_alpha(original):
+        return _threshold_alpha(scaled)  # keep hard edges crisp
+    return scaled
+
+def decode_pokemon(window_width=None):
+    """
+    The Pokemon sprites decoded and smoothscaled to their in-game size
+    (for a window window_width wide, c.WIDTH by default), {name: surface}.
+    Needs no display mode, and pygame's PNG decoder and smoothscale release
+    the GIL, so preload() runs this on a worker thread.
+    """
+    width = int(c.OBSTACLE_WIDTH_FRAC * (window_width or c.WIDTH))
+    return {name: _load_scaled(f"assets/{name}.png", width) for name in POKEMON}
+
+def decode_coin_frames():
+    """
+    Every frame of the animated coin at its in-game size, {atlas name:
+    surface}, and the frame durations in ms. The GIF decoder is pure Python
+    (unless Pillow is installed), so this stays on the main thread: on a
+    worker it would only contend for the GIL.
+    """
+    width = int(c.COIN_WIDTH_FRAC * c.WIDTH)
+    frames = load_gif_frames("assets/star_coin.gif")
+    # GIF transparency is binary: keep the scaled edge hard
+    sources = {f"star_coin_{i}": _threshold_alpha(scale_preserving_ratio(frame, width))
+               for i, (frame, _) in enumerate(frames)}
+    return sources, [ms for _, ms in frames]
+
+def load_images(convert=True, pokemon=None):
+    """
+    Packs the sprites into one atlas. pokemon_images and coin_image are
+    atlas Sprites (sheet + rect); the atlas sheet is baked unless
+    convert=False (headless tools without a display mode). Sizes are
+    identical either way.
+
+    Every frame of the animated coin is decoded and scaled once:
+    coin_frames lists their Sprites (coin_image is the first) and
+    coin_frame_ms their durations. pokemon is a decode_pokemon() result
+    to use instead of decoding here.
+    """
+    sources = dict(pokemon or decode_pokemon())
+    coin_sources, frame_ms = decode_coin_frames()
+    sources.update(coin_sources)
+    atlas = Atlas(sources, finish=(lambda sheet: bake(sheet, False)) if convert else None)
+
+    images = {}
+    images['atlas'] = atlas
+    images['pokemon_images'] = [atlas.sprites[name] for name in POKEMON]
+    images['coin_frames'] = [atlas.sprites[name] for name in coin_sources]
+    images['coin_frame_ms'] = frame_ms
+    images['coin_image'] = images['coin_frames'][0]
+    return images
+
+def preload(window_width=None):
+    """
+    Starts decoding the Pokemon sprites on a worker thread, so the work
+    overlaps window creation and imports (main.py calls this right after
+    pygame.init, with the width the window will open at: c.WIDTH only
+    takes it once the window is open). load_assets() picks up the result.
+    """
+    global _preload
+    if _preload is not None:
+        return
+    from concurrent.futures import ThreadPoolExecutor
+    worker = ThreadPoolExecutor(1, thread_name_prefix="assets")
+    window_width = window_width or c.WIDTH
+    _preload = {"width": window_width, "pokemon": worker.submit(decode_pokemon, window_width)}
+    worker.shutdown(wait=False)
 
 def load_assets():
-    assets = {}
-
-    def scale_preserving_ratio(original_surf, new_width):
-        orig_w, orig_h = original_surf.get_size()
-        aspect = orig_h / float(orig_w)
-        new_height = int(new_width * aspect)
-        return pygame.transform.scale(original_surf, (new_width, new_height))
-
-    pikachu_original = pygame.image.load("assets/pikachu.png").convert_alpha()
-    charmander_original = pygame.image.load("assets/charmander.png").convert_alpha()
-    bulbasaur_original = pygame.image.load("assets/bulbasaur.png").convert_alpha()
-    squirtle_original = pygame.image.load("assets/squirtle.png").convert_alpha()
-
-    obstacle_desired_w = int(c.OBSTACLE_WIDTH_FRAC * c.WIDTH)
-    assets['pokemon_images'] = [
-        scale_preserving_ratio(pikachu_original, obstacle_desired_w),
-        scale_preserving_ratio(charmander_original, obstacle_desired_w),
-        scale_preserving_ratio(bulbasaur_original, obstacle_desired_w),
-        scale_preserving_ratio(squirtle_original, obstacle_desired_w)
-    ]
-
-    coin_original = pygame.image.load("assets/star_coin.gif").convert_alpha()
-    coin_desired_w = int(c.COIN_WIDTH_FRAC * c.WIDTH)
-    assets['coin_image'] = scale_preserving_ratio(coin_original, coin_desired_w)
-
-    assets['boing_sound'] = pygame.mixer.Sound("assets/boing.mp3")
-    assets['coin_sound'] = pygame.mixer.Sound("assets/coin.mp3")
-
-    return assets
+    """
+    Images for the game, baked, in the atlas (sound effects are in
+    src/audio.py). Loaded once per process; every later call returns the
+    same dict.
+    """
+    global _assets
+    if _assets is not None:
+        return _assets
+    preloaded = _preload or {}
+
+    pokemon = preloaded.get("pokemon")
+    if preloaded.get("width") != c.WIDTH:
+        pokemon = None  # the window size changed after preload(); sprites scale with it
+    _assets = load_images(pokemon=pokemon.result() if pokemon else None)
+    return _assets
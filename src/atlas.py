@@ -0,0 +1,69 @@
+# atlas.py
+
+import pygame
+
+ATLAS_MAX_WIDTH = 1024
+ATLAS_PADDING = 1   # transparent px between sprites, so smoothed edges never bleed
+
+class Sprite:
+    """One image inside an atlas: the shared sheet surface and its rect."""
+
+    def __init__(self, sheet, rect):
+        self.sheet = sheet
+        self.rect = rect
+
+    def get_size(self):
+        return self.rect.size
+
+    def draw(self, screen, pos):
+        screen.blit(self.sheet, pos, self.rect)
+
+def pack(sizes, max_width=ATLAS_MAX_WIDTH, padding=ATLAS_PADDING):
+    """
+    Shelf packing, tallest first. Returns (rects in the order of sizes,
+    (width, height) of the sheet).
+    """
+    order = sorted(range(len(sizes)), key=lambda i: -sizes[i][1])
+    rects = [None] * len(sizes)
+    x = y = shelf_h = width = 0
+    for i in order:
+        w, h = sizes[i]
+        if x and x + w > max_width:
+            y += shelf_h + padding
+            x = shelf_h = 0
+        rects[i] = pygame.Rect(x, y, w, h)
+        x += w + padding
+        shelf_h = max(shelf_h, h)
+        width = max(width, x - padding)
+    return rects, (width, y + shelf_h)
+
+class Atlas:
+    """
+    Named images packed into one per-pixel-alpha sheet. sprites[name] is a
+    Sprite; draw it with screen.blit(sprite.sheet, pos, sprite.rect) or as
+    a (sheet, pos, rect) item of Surface.blits. (Subsurfaces of the sheet
+    would be simpler, but blitting them bypasses the sheet's RLE encoding
+    and is far slower.)
+
+    finish, if given, is applied to the packed sheet before the sprites are
+    made (load_images passes assets.bake).
+    """
+
+    def __init__(self, images, finish=None):
+        names = list(images)
+        rects, size = pack([images[n].get_size() for n in names])
+
+        sheet = pygame.Surface(size, pygame.SRCALPHA, 32)
+        sheet.fill((0, 0, 0, 0))
+        rgb = pygame.surfarray.pixels3d(sheet)
+        alpha = pygame.surfarray.pixels_alpha(sheet)
+        for name, rect in zip(names, rects):
+            # Copied, not blitted: blending onto the transparent sheet would
+            # darken every partly transparent edge pixel
+            img = images[name]
+            rgb[rect.left:rect.right, rect.top:rect.bottom] = pygame.surfarray.pixels3d(img)
+            alpha[rect.left:rect.right, rect.top:rect.bottom] = pygame.surfarray.pixels_alpha(img)
+        del rgb, alpha
+
+        self.sheet = finish(sheet) if finish else sheet
+        self.sprites = {name: Sprite(self.sheet, rect) for name, rect in zip(names, rects)}
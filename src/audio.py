@@ -0,0 +1,132 @@
+# audio.py
+#
+# Sound effects. Every effect in c.SOUND_EFFECTS is decoded once, on a
+# worker thread, into a mixer Sound (PCM in the mixer's format) and kept
+# for the whole session. Each effect category gets its own reserved mixer
+# channels, so a burst of coins can only take coin channels, never the
+# jump's. Game plays effects by name through get_audio().play(name).
+
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+
+import pygame
+import src.config as c
+
+HISTORY = 600   # frames kept for the stats (~10 s at 60 Hz)
+
+def _decode(path):
+    return pygame.mixer.Sound(path)
+
+class AudioManager:
+    """
+    Plays the effects on their category's channels: a free one if there is
+    one, otherwise the category's channel that started longest ago is cut
+    off (the same choice every time, unlike Sound.play's channel stealing).
+    The same effect plays at most c.AUDIO_MAX_PER_FRAME times per frame;
+    more coins in one frame would only sound like one louder coin.
+
+    An effect that has not finished decoding is skipped rather than waited
+    for, so MP3 decoding never runs on or blocks the gameplay thread. With
+    no mixer (no audio device) every play is a no-op.
+
+    Game calls new_frame() at the start of every simulation step (a
+    "frame", as the tools count them); it closes the previous frame's
+    counts for stats().
+    """
+
+    def __init__(self, effects=None, channels=None, max_per_frame=None):
+        self.effects = dict(c.SOUND_EFFECTS if effects is None else effects)
+        self.max_per_frame = c.AUDIO_MAX_PER_FRAME if max_per_frame is None else max_per_frame
+        self.enabled = pygame.mixer.get_init() is not None
+        self.sounds = {}     # name -> Sound, once decoded
+        self.pending = {}    # name -> Future of the Sound
+        self.channels = {}   # category -> [Channel]
+        self.started = {}    # Channel -> frame it last started playing on
+
+        self.frame = 0
+        self.frame_plays = {}        # name -> plays this frame
+        self.counts = {"played": 0, "limited": 0, "stolen": 0, "not_ready": 0}
+        self.busy = deque(maxlen=HISTORY)   # busy channels at the end of each frame
+        if not self.enabled:
+            return
+
+        categories = c.AUDIO_CHANNELS if channels is None else channels
+        total = sum(categories.values())
+        if pygame.mixer.get_num_channels() < total:
+            pygame.mixer.set_num_channels(total)
+        # Reserved channels are never picked by Sound.play() or find_channel()
+        pygame.mixer.set_reserved(total)
+        first = 0
+        for category, count in categories.items():
+            self.channels[category] = [pygame.mixer.Channel(i) for i in range(first, first + count)]
+            first += count
+
+        worker = ThreadPoolExecutor(1, thread_name_prefix="audio")
+        for name, (path, _) in self.effects.items():
+            self.pending[name] = worker.submit(_decode, path)
+        worker.shutdown(wait=False)
+
+    def sound(self, name):
+        """The decoded Sound, or None while it is still decoding."""
+        sound = self.sounds.get(name)
+        if sound is None:
+            future = self.pending.get(name)
+            if future is None or not future.done():
+                return None
+            sound = self.sounds[name] = future.result()
+            del self.pending[name]
+        return sound
+
+    def play(self, name):
+        if not self.enabled:
+            return
+        plays = self.frame_plays.get(name, 0)
+        if plays >= self.max_per_frame:
+            self.counts["limited"] += 1
+            return
+        sound = self.sound(name)
+        if sound is None:
+            self.counts["not_ready"] += 1
+            return
+
+        channels = self.channels[self.effects[name][1]]
+        channel = next((ch for ch in channels if not ch.get_busy()), None)
+        if channel is None:
+            channel = min(channels, key=lambda ch: self.started.get(ch, -1))
+            self.counts["stolen"] += 1
+        channel.play(sound)
+        self.started[channel] = self.frame
+        self.frame_plays[name] = plays + 1
+        self.counts["played"] += 1
+
+    def new_frame(self):
+        if self.enabled:
+            self.busy.append(sum(ch.get_busy() for chs in self.channels.values() for ch in chs))
+        self.frame_plays.clear()
+        self.frame += 1
+
+    def stats(self):
+        """Play counts since the start, and busy channels over recent frames."""
+        total = sum(len(chs) for chs in self.channels.values())
+        busy = list(self.busy) or [0]
+        return {
+            **self.counts,
+            "channels": total,
+            "mean_busy": sum(busy) / len(busy),
+            "peak_busy": max(busy),
+        }
+
+    def summary(self):
+        s = self.stats()
+        return (f"{s['played']} played, {s['limited']} rate-limited, {s['stolen']} stolen, "
+                f"{s['not_ready']} not decoded yet; channels busy mean {s['mean_busy']:.1f} "
+                f"peak {s['peak_busy']} of {s['channels']}")
+
+_audio = None
+
+def get_audio():
+    """The session's AudioManager; the first call starts decoding the effects."""
+    global _audio
+    if _audio is None:
+        _audio = AudioManager()
+    return _audio
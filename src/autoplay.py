@@ -0,0 +1,111 @@
+# autoplay.py
+#
+# Runs bot sessions headlessly in parallel and reports how each level plays.
+#
+#   python -m src.autoplay --sessions 50
+#   python -m src.autoplay --level 5 --sessions 200 --noise 2 --vary-seeds
+
+import argparse
+import os
+import time
+from multiprocessing import Pool
+
+def _init_worker():
+    from src.headless import init_headless
+    init_headless()
+
+def play_session(args):
+    """
+    Plays one level with the bot until death or the timer.
+    Returns a dict with outcome ('complete', 'spikes' or 'obstacle'),
+    frames, coins and wall-clock seconds spent simulating.
+    """
+    level_index, session, noise, seed = args
+
+    from src.game_manager import Game
+    from src.bot import Bot
+    from src.headless import level_frames
+    from src.levelpack import get_pack
+
+    game = Game(level_index)
+    if seed is not None:
+        params = dict(get_pack().level(level_index), seed=seed)
+        game.level_manager.generate_seeded_level(level_index, params)
+    bot = Bot(noise=noise, seed=session)
+
+    limit = level_frames()
+    outcome = None
+    started = time.perf_counter()
+    while outcome is None and game.frames < limit:
+        bot.act(game)
+        outcome = game.step()
+    elapsed = time.perf_counter() - started
+
+    return {
+        "level": level_index,
+        "outcome": outcome or "complete",
+        "frames": game.frames,
+        "coins": game.current_level_coins,
+        "seconds": elapsed,
+    }
+
+def summarize(results):
+    """Aggregates session dicts for one level."""
+    n = len(results)
+    deaths = {}
+    for r in results:
+        if r["outcome"] != "complete":
+            deaths[r["outcome"]] = deaths.get(r["outcome"], 0) + 1
+    frames = sum(r["frames"] for r in results)
+    seconds = sum(r["seconds"] for r in results)
+    return {
+        "sessions": n,
+        "completion_rate": sum(r["outcome"] == "complete" for r in results) / n,
+        "deaths": deaths,
+        "mean_coins": sum(r["coins"] for r in results) / n,
+        "mean_frames": frames / n,
+        "sim_fps": frames / seconds if seconds else 0.0,
+    }
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Headless bot sessions per level.")
+    parser.add_argument("--level", type=int, action="append",
+                        help="1-based level number (repeatable, default: all)")
+    parser.add_argument("--sessions", type=int, default=20, help="sessions per level")
+    parser.add_argument("--noise", type=int, default=1,
+                        help="random +/- frames on each charge hold (varies sessions)")
+    parser.add_argument("--vary-seeds", action="store_true",
+                        help="session i plays the level generated with seed + i")
+    parser.add_argument("--workers", type=int, default=os.cpu_count())
+    args = parser.parse_args(argv)
+
+    from src.levelpack import get_pack
+    pack = get_pack()
+    levels = [n - 1 for n in (args.level or range(1, len(pack) + 1))]
+
+    jobs = []
+    for index in levels:
+        base_seed = pack.level(index).get("seed", 0)
+        for session in range(args.sessions):
+            seed = base_seed + session if args.vary_seeds else None
+            jobs.append((index, session, args.noise, seed))
+
+    started = time.perf_counter()
+    with Pool(processes=args.workers, initializer=_init_worker) as pool:
+        results = pool.map(play_session, jobs, chunksize=max(1, len(jobs) // (4 * args.workers)))
+    wall = time.perf_counter() - started
+
+    print(f"{'level':<16} {'runs':>5} {'complete':>9} {'spikes':>7} {'obstacle':>9} "
+          f"{'coins':>6} {'frames':>7} {'sim fps':>8}")
+    for index in levels:
+        s = summarize([r for r in results if r["level"] == index])
+        print(f"{pack.name_of(index):<16} {s['sessions']:>5} "
+              f"{s['completion_rate']:>8.0%} {s['deaths'].get('spikes', 0):>7} "
+              f"{s['deaths'].get('obstacle', 0):>9} {s['mean_coins']:>6.1f} "
+              f"{s['mean_frames']:>7.0f} {s['sim_fps']:>8.0f}")
+    total_frames = sum(r["frames"] for r in results)
+    print(f"{len(results)} sessions, {total_frames} frames in {wall:.1f}s "
+          f"({total_frames / max(wall, 1e-9):.0f} frames/s across {args.workers} workers)")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,232 @@
+# bot.py
+
+import random
+import numpy as np
+
+import src.config as c
+from src.jump_tables import get_jump_table, arc_heights, arc_velocities
+
+HORIZON = 100        # frames predicted ahead for every candidate jump
+SAFE_WAIT = 6        # keep walking only if that many frames ahead are safe
+MIN_RUNWAY = 60      # px of safe ground wanted after a landing
+RUNWAY_CAP = 200     # more runway than this is not worth trading progress for
+
+class Bot:
+    """
+    Scripted player. act(game) is called once per frame in place of
+    process_events and drives the same hooks: handle_charged_jump_press /
+    release, handle_instant_jump (also the double jump) and
+    game.virtual_charge_held for the held charge button.
+
+    Every frame on the ground it predicts, with the jump tables, all
+    "press now, release after n frames" jumps against the platforms and
+    obstacles ahead, and commits to the best safe one that clears the next
+    hazard. In the air it double-jumps only when the current arc would die.
+    """
+
+    def __init__(self, noise=0, seed=None):
+        self.table = get_jump_table()
+        self.rng = random.Random(seed)
+        self.noise = noise  # random +/- frames added to each charge hold
+        self.release_in = None
+        self.max_hold = int(np.ceil((c.MAX_JUMP_STRENGTH - c.MIN_JUMP_STRENGTH) / c.CHARGE_RATE))
+
+        # Plan n: n = 0 is an instant jump now, n >= 1 holds charge for n frames
+        holds = np.arange(self.max_hold + 1)
+        speeds = np.minimum(c.MIN_JUMP_STRENGTH + holds * c.CHARGE_RATE, c.MAX_JUMP_STRENGTH)
+        rows = np.array([self.table.row(v) for v in speeds])
+        j = np.arange(HORIZON)
+        k = np.clip(j[None, :] - holds[:, None] + 1, 0, self.table.frames - 1)
+        airborne = j[None, :] >= holds[:, None]
+        self.holds = holds
+        self.plan_heights = np.where(airborne, self.table.heights[rows[:, None], k], 0.0)
+        self.plan_falling = airborne & (self.table.velocities[rows[:, None], k] > 0)
+        self.plan_launch = holds
+
+    # -----------------------------------------------------------------
+    # INPUT
+    # -----------------------------------------------------------------
+    def act(self, game):
+        player = game.player
+        if self.release_in is not None:
+            if self.release_in <= 0:
+                game.virtual_charge_held = False
+                game.handle_charged_jump_release()
+                self.release_in = None
+            else:
+                self.release_in -= 1
+            return
+
+        if player.on_ground:
+            self._act_on_ground(game)
+        elif player.can_double_jump:
+            self._act_in_air(game)
+
+    def _act_on_ground(self, game):
+        world = _World(game)
+        outcome = world.predict(self.plan_heights, self.plan_falling, self.plan_launch)
+        support = world.support()
+
+        walk_ok = support[:SAFE_WAIT].all() and world.walk_death() >= SAFE_WAIT
+        best = None
+        for n in range(len(self.holds)):
+            if n > 0 and not support[:n].all():
+                continue  # would walk off the edge while still charging
+            safe, progress, runway = outcome[n]
+            key = (safe, progress, runway >= MIN_RUNWAY, min(runway, RUNWAY_CAP), -n)
+            if best is None or key > best[0]:
+                best = (key, n)
+
+        if best is None:
+            return
+        (safe, progress, runway_ok, _, _), n = best
+        if safe and progress and (runway_ok or not walk_ok):
+            self._jump(game, n)
+        elif not walk_ok:
+            # Nothing good: take the best remaining option before the hazard
+            self._jump(game, n)
+
+    def _act_in_air(self, game):
+        world = _World(game)
+        vel = game.player.vel_y
+        idle_h = arc_heights(-vel, HORIZON + 1)[1:]
+        idle_v = arc_velocities(-vel, HORIZON + 1)[1:]
+        dj_h = arc_heights(c.MIN_JUMP_STRENGTH, HORIZON + 1)[1:]
+        dj_v = arc_velocities(c.MIN_JUMP_STRENGTH, HORIZON + 1)[1:]
+        heights = np.stack([idle_h, dj_h])
+        falling = np.stack([idle_v > 0, dj_v > 0])
+        (idle_safe, _, idle_runway), (dj_safe, _, dj_runway) = world.predict(
+            heights, falling, np.zeros(2, dtype=int))
+
+        if idle_safe and (idle_runway >= MIN_RUNWAY or not dj_safe or dj_runway <= idle_runway):
+            return
+        if dj_safe or world.first_death(heights[0], falling[0]) <= 1:
+            game.handle_instant_jump()
+
+    def _jump(self, game, n):
+        if n == 0:
+            game.handle_instant_jump()
+            return
+        if self.noise:
+            n += self.rng.randint(-self.noise, self.noise)
+            n = max(1, min(n, self.max_hold))
+        game.handle_charged_jump_press()
+        game.virtual_charge_held = True
+        self.release_in = n - 1
+
+class _World:
+    """Snapshot of the entities near the player, as NumPy arrays."""
+
+    def __init__(self, game):
+        player = game.player
+        self.x = player.x
+        self.y = player.y
+        self.side = player.width
+        self.spike_top = c.HEIGHT - int(c.SPIKE_HEIGHT_FRAC * c.HEIGHT)
+        self.shift = (np.arange(HORIZON) + 1) * c.SPEED
+
+        right = self.x + self.side + HORIZON * c.SPEED
+        lm = game.level_manager
+        plats = [p for p in lm.platforms if p.x < right and p.x + p.width > 0]
+        obs = [o for o in lm.obstacles if o.x < right and o.x + o.width > 0]
+
+        tol = c.PLATFORM_EDGE_TOLERANCE
+        ct = c.COLLISION_TOLERANCE
+        self.p_left = np.array([p.x - tol for p in plats], dtype=float)
+        self.p_right = np.array([p.x + p.width + tol for p in plats], dtype=float)
+        self.p_top = np.array([p.y for p in plats], dtype=float)
+        self.p_bottom = np.array([p.y + p.height for p in plats], dtype=float)
+        self.o_left = np.array([o.x + ct for o in obs], dtype=float)
+        self.o_right = np.array([o.x + o.width - ct for o in obs], dtype=float)
+        self.o_top = np.array([o.y + ct for o in obs], dtype=float)
+        self.o_bottom = np.array([o.y + o.height - ct for o in obs], dtype=float)
+
+        # Platforms the player is standing on right now
+        standing = ((self.x < self.p_right) & (self.x + self.side > self.p_left)
+                    & (self.p_top == self.y + self.side))
+        self.current = set(np.flatnonzero(standing).tolist())
+
+        # [step, entity] horizontal overlap with the player
+        s = self.shift[:, None]
+        self.p_overlap_x = (self.x < self.p_right - s) & (self.x + self.side > self.p_left - s)
+        self.o_overlap_x = (self.x < self.o_right - s) & (self.x + self.side > self.o_left - s)
+
+    def _obstacle_hit(self, ys):
+        """ys: [..., step] player top y -> [..., step] bool."""
+        y = ys[..., None]
+        hit = (y < self.o_bottom) & (y + self.side > self.o_top) & self.o_overlap_x
+        return hit.any(axis=-1)
+
+    def support(self):
+        """[step] whether walking on keeps the player on a platform."""
+        y = self.y + c.GRAVITY
+        under = (y < self.p_bottom) & (y + self.side > self.p_top) & self.p_overlap_x
+        return under.any(axis=-1)
+
+    def walk_death(self):
+        hit = self._obstacle_hit(np.full(HORIZON, self.y))
+        return int(hit.argmax()) if hit.any() else HORIZON
+
+    def first_death(self, heights, falling):
+        ys = self.y - heights
+        dead = self._obstacle_hit(ys) | (ys + self.side >= self.spike_top)
+        return int(dead.argmax()) if dead.any() else HORIZON
+
+    def predict(self, heights, falling, launch):
+        """
+        heights/falling: [plan, step]; launch: [plan] first airborne step.
+        Returns a list of (safe, progress, runway_px) per plan.
+        """
+        ys = self.y - heights
+        y = ys[..., None]
+        on_plat = ((y < self.p_bottom) & (y + self.side > self.p_top)
+                   & self.p_overlap_x[None, :, :])
+        lands = falling & on_plat.any(axis=-1)
+        dead = self._obstacle_hit(ys) | (ys + self.side >= self.spike_top)
+
+        results = []
+        for p in range(len(heights)):
+            land_steps = np.flatnonzero(lands[p])
+            death_steps = np.flatnonzero(dead[p])
+            land = land_steps[0] if len(land_steps) else HORIZON
+            death = death_steps[0] if len(death_steps) else HORIZON
+            if death < land or land == HORIZON:
+                results.append((False, False, 0))
+                continue
+
+            # Snap onto the first platform touched in list order, as
+            # Player.move's collidelist does
+            q = np.flatnonzero(on_plat[p, land])[0]
+            top = self.p_top[q] - self.side
+            if self._hit_at(top, land):
+                results.append((False, False, 0))
+                continue
+
+            runway = self._runway(q, top, land)
+            progress = launch[p] < land and (q not in self.current or self._cleared_hazard(land))
+            results.append((True, bool(progress), runway))
+        return results
+
+    def _hit_at(self, top, step):
+        hit = ((top < self.o_bottom) & (top + self.side > self.o_top)
+               & self.o_overlap_x[step])
+        return bool(hit.any())
+
+    def _runway(self, q, top, step):
+        """Px the player can keep walking after landing on platform q."""
+        shift = self.shift[step]
+        end = self.p_right[q] - shift - self.x
+        ahead = ((top < self.o_bottom) & (top + self.side > self.o_top)
+                 & (self.o_left - shift >= self.x + self.side))
+        if ahead.any():
+            end = min(end, (self.o_left[ahead] - shift).min() - (self.x + self.side))
+        return max(0, end)
+
+    def _cleared_hazard(self, step):
+        """True if an obstacle that blocked the walk is behind the player at step."""
+        band = (self.y < self.o_bottom) & (self.y + self.side > self.o_top)
+        ahead_now = band & (self.o_left > self.x)
+        if not ahead_now.any():
+            return False
+        passed = self.o_right[ahead_now] - self.shift[step] <= self.x
+        return bool(passed.any())
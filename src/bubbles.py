@@ -2,9 +2,30 @@
 import pygame
 import random
 import src.config as c
+from src.assets import bake, COLORKEY
+from src.pool import Pool
+
+# Pre-rendered circle per radius
+_surfaces = {}
+
+def bubble_surface(radius):
+    surf = _surfaces.get(radius)
+    if surf is None:
+        surf = pygame.Surface((2 * radius + 1, 2 * radius + 1))
+        surf.fill(COLORKEY)
+        pygame.draw.circle(surf, c.BUBBLE_COLOR, (radius, radius), radius)
+        surf.set_colorkey(COLORKEY)
+        surf = bake(surf)
+        _surfaces[radius] = surf
+    return surf
 
 class Bubble:
+    __slots__ = ("x", "y", "radius", "speed")
+
     def __init__(self, x, y):
+        self.reset(x, y)
+
+    def reset(self, x, y):
         self.x = x
         self.y = y
         # random radius
@@ -16,8 +37,13 @@ class Bubble:
         # Move bubble upward
         self.y -= self.speed
 
-    def draw(self, screen):
-        pygame.draw.circle(screen, c.BUBBLE_COLOR, (int(self.x), int(self.y)), self.radius)
+    def draw(self, screen, alpha=1.0):
+        # alpha: fraction of the current step elapsed (see Game.run)
+        y = self.y + self.speed * (1.0 - alpha)
+        r = self.radius
+        screen.blit(bubble_surface(r), (int(self.x) - r, int(y) - r))
 
     def off_screen(self):
         return (self.y + self.radius) < 0
+
+bubble_pool = Pool("bubble", Bubble)
@@ -1,15 +1,50 @@
 # coin.py
+import math
+from functools import reduce
 import pygame
+from src.pool import Pool
+
+class CoinAnimation:
+    """
+    The coin's frames, shared by every StarCoin and driven by one clock:
+    frame_at(ms) is a table lookup, so coins carry no animation state and
+    nothing is decoded or scaled while playing.
+    """
+
+    def __init__(self, frames, durations_ms):
+        self.frames = frames
+        # GIF delays are multiples of 10 ms; one table slot per common step
+        self.step_ms = reduce(math.gcd, durations_ms)
+        self.timeline = [i for i, ms in enumerate(durations_ms)
+                         for _ in range(ms // self.step_ms)]
+
+    def frame_at(self, ms):
+        return self.frames[self.timeline[int(ms // self.step_ms) % len(self.timeline)]]
 
 class StarCoin:
-    def __init__(self, x, y, coin_image):
-        self.coin_image = coin_image
-        self.width, self.height = coin_image.get_size()
+    __slots__ = ("x", "y", "id")
+
+    # The image (an atlas Sprite) and size every coin shares
+    image = None
+    width = height = 0
+
+    @classmethod
+    def set_image(cls, coin_image):
+        cls.image = coin_image
+        cls.width, cls.height = coin_image.get_size()
+
+    def __init__(self, x, y):
+        self.reset(x, y)
+
+    def reset(self, x, y):
         self.x = x
         self.y = y
 
-    def draw(self, screen):
-        screen.blit(self.coin_image, (self.x, self.y))
+    def draw(self, screen, offset_x=0, image=None):
+        # image: the current CoinAnimation frame (all frames share one size)
+        (image or self.image).draw(screen, (self.x + offset_x, self.y))
 
     def get_rect(self):
         return pygame.Rect(self.x, self.y, self.width, self.height)
+
+coin_pool = Pool("coin", StarCoin)
@@ -1,6 +1,8 @@
 # config.py
 
 FULLSCREEN = True
+RENDERER = "software"   # or "gpu" (pygame._sdl2); python main.py --renderer gpu
+WINDOW_TITLE = "Geometry Pokemon Dash"
 
 WIDTH = 1200
 HEIGHT = 800
@@ -24,19 +26,68 @@ COIN_WIDTH_FRAC = 30 / WIDTH
 SQUARE_WIDTH_FRAC = 30 / WIDTH
 
 ###############################################################################
-# Other game constants
+# Timing
 ###############################################################################
-GRAVITY = 1
-MIN_JUMP_STRENGTH = 15
-MAX_JUMP_STRENGTH = 45
-CHARGE_RATE = 1
+SIM_FPS = 30           # simulation steps per second (Game.step advances one step)
+RENDER_FPS = 60        # frame cap for drawing, independent of SIM_FPS; 0 = uncapped
+VSYNC = False          # python main.py --vsync: present in step with the monitor refresh
+PRECISE_PACING = False # busy-wait the frame cap instead of sleeping (exact, costs a core)
+MAX_FRAME_TIME = 0.25  # s of real time simulated per rendered frame at most
+FRAME_STATS = False    # python main.py --frame-stats: frame rate and pacing jitter in the HUD
+INPUT_LATENCY_STATS = False  # python main.py --input-latency: jump input-to-frame latency
+AUDIO_STATS = False    # python main.py --audio-stats: sound effect mixing summary after each run
+GC_POLICY = "tuned"    # python main.py --gc-policy NAME: "default", "tuned" or "screens" (src/gc_policy.py)
+GC_THRESHOLDS = (10000, 50, 100)  # gc.set_threshold during play with the "tuned" policy
+GC_STATS = False       # python main.py --gc-stats: collections and their pauses after each run
 
-COYOTE_FRAMES = 3
-JUMP_BUFFER_FRAMES = 2
+FPS = SIM_FPS  # the tools count in simulation steps as "frames"
 
-SPEED = 6
+###############################################################################
+# Other game constants (per second; converted to per-step values below)
+###############################################################################
+GRAVITY_PER_S2 = 900        # px/s^2
+MIN_JUMP_SPEED = 450        # px/s
+MAX_JUMP_SPEED = 1350       # px/s
+CHARGE_RATE_PER_S2 = 900    # px/s gained per second of holding the charge button
+
+COYOTE_TIME = 0.1           # s
+JUMP_BUFFER_TIME = 0.07     # s
+
+SCROLL_SPEED = 180          # px/s
 LEVEL_DURATION = 40  # seconds
 
+# Per simulation step, as Player.move / Game.step integrate them
+GRAVITY = GRAVITY_PER_S2 / (SIM_FPS * SIM_FPS)
+MIN_JUMP_STRENGTH = MIN_JUMP_SPEED / SIM_FPS
+MAX_JUMP_STRENGTH = MAX_JUMP_SPEED / SIM_FPS
+CHARGE_RATE = CHARGE_RATE_PER_S2 / (SIM_FPS * SIM_FPS)
+
+COYOTE_FRAMES = round(COYOTE_TIME * SIM_FPS)
+JUMP_BUFFER_FRAMES = round(JUMP_BUFFER_TIME * SIM_FPS)
+
+SPEED = SCROLL_SPEED / SIM_FPS
+
+ENDLESS_MODE = False          # python main.py --endless
+ENDLESS_CHUNK_PLATFORMS = 8   # platforms generated per chunk
+ENDLESS_LOOKAHEAD = 1200      # px of level kept generated past the right edge
+
+LEVEL_PACK = None             # python main.py --level-pack DIR (see src/levelpack.py)
+
+RECORD_REPLAYS = False        # python main.py --record: save each run's inputs (src/replay.py)
+REPLAY_DIR = "replays"
+
+VERSUS_PLAYERS = 1            # python main.py --versus [N]: N players on one level (src/versus.py)
+
+SPECTATE = False              # python main.py --spectate [PORT]: stream each step to spectators (src/spectate.py)
+SPECTATE_HOST = "127.0.0.1"   # "0.0.0.0" lets spectators on other machines connect
+SPECTATE_PORT = 47800
+SPECTATE_QUEUE = 64           # snapshots waiting for the sender thread; the game drops more
+SPECTATE_BACKLOG = 16384      # bytes unsent to one spectator before it misses frames
+
+GHOSTS = False                # python main.py --ghost: race the best run on each level (src/ghost.py)
+GHOST_DIR = "ghosts"
+GHOST_ALPHA = 96              # 0-255 opacity of the ghost square
+
 WHITE = (255, 255, 255)
 RED   = (255,   0,   0)
 BLUE  = (  0,   0, 255)
@@ -48,17 +99,26 @@ COLLISION_TOLERANCE = 7
 
 JOYSTICK_NUDGE_RANGE = 50   # How far (in pixels) we can nudge left/right
 JOYSTICK_NUDGE_DEADZONE = 0.1
-JOYSTICK_NUDGE_SPEED = 0.15  # 0.0 -> never moves, 1.0 -> instant snap
+JOYSTICK_NUDGE_RATE = 0.15  # per 1/30 s: 0.0 -> never moves, 1.0 -> instant snap
+JOYSTICK_NUDGE_SPEED = 1 - (1 - JOYSTICK_NUDGE_RATE) ** (30 / SIM_FPS)  # per step
 
 BUBBLE_COLOR = (0, 255, 0)        # Green bubbles
 BUBBLE_MIN_RADIUS = 5
 BUBBLE_MAX_RADIUS = 10
 
-BUBBLE_SPEED_MIN = 1
-BUBBLE_SPEED_MAX = 3
+BUBBLE_SPEED_MIN = 30 / SIM_FPS   # px per step (30-90 px/s)
+BUBBLE_SPEED_MAX = 90 / SIM_FPS
 
-BUBBLE_SPAWN_RATE = 0.03         # Probability each frame that a new bubble spawns
+BUBBLE_SPAWN_RATE = 0.9 / SIM_FPS  # Probability each step that a new bubble spawns
 BUBBLE_MAX_COUNT = 15            # Max bubbles on screen
 
 SPIKE_BG_COLOR = (0, 0, 0)
-SPIKE_BG_OVERLAP = 30
\ No newline at end of file
+SPIKE_BG_OVERLAP = 30
+# Sound effects: name -> (file, category); each category plays on its own
+# reserved mixer channels (see src/audio.py)
+SOUND_EFFECTS = {
+    "boing": ("assets/boing.mp3", "jump"),
+    "coin":  ("assets/coin.mp3", "coin"),
+}
+AUDIO_CHANNELS = {"jump": 2, "coin": 4}   # channels reserved per category
+AUDIO_MAX_PER_FRAME = 1   # plays of one effect per frame; the rest are dropped
@@ -0,0 +1,293 @@
+# env.py
+#
+# Gym-style environments around the game rules, for training agents on CPU.
+# No gym/gymnasium dependency: the API simply follows the gymnasium shape
+#   obs, info = env.reset(seed)
+#   obs, reward, terminated, truncated, info = env.step(action)
+
+import numpy as np
+import pygame
+import multiprocessing as mp
+
+import src.config as c
+
+# Actions
+IDLE = 0          # charge button up (releases a held charge)
+HOLD_CHARGE = 1   # charge button down (press on the first frame, then hold)
+INSTANT_JUMP = 2  # X key / button 2: instant jump or double jump
+NUM_ACTIONS = 3
+
+# Observation layout
+NEAR_PLATFORMS = 3
+NEAR_OBSTACLES = 3
+NEAR_COINS = 2
+PLAYER_FEATURES = 8
+OBS_SIZE = PLAYER_FEATURES + 3 * NEAR_PLATFORMS + 2 * NEAR_OBSTACLES + 2 * NEAR_COINS
+
+# Rewards
+REWARD_DEATH = -1.0
+REWARD_COIN = 0.1
+REWARD_COMPLETE = 1.0
+
+class GameEnv:
+    """
+    One game, stepped one frame per action (or frame_skip frames).
+
+    Observation: float32 vector of OBS_SIZE features -
+        player y, vel_y, jump_charge, on_ground, can_double_jump, charging,
+        charge held, level progress; then (dx, dy, width) of the next
+        platforms and (dx, dy) of the next obstacles and coins, all scaled
+        by the screen size and padded with (1, 0, ...) when absent.
+    With pixels=True the observation is a dict with "features" and
+    "pixels" (downscaled RGB uint8 frame of shape (h, w, 3)).
+
+    Reward: progress per frame (1.0 over a full level), REWARD_COIN per
+    coin, REWARD_DEATH on death and REWARD_COMPLETE when the timer runs out.
+
+    Layout: reset(seed) plays the level generated from seed, and the seed
+    is kept (self.seed): later resets without one, such as the vector
+    environments' auto-resets, replay the same layout. Until a seed is
+    given it is the level's own.
+    """
+
+    def __init__(self, level=0, pixels=False, pixel_size=(84, 84), frame_skip=1):
+        from src.headless import init_headless, level_frames
+        init_headless()
+        from src.game_manager import Game
+        from src.levelpack import get_pack
+
+        self.level_params = dict(get_pack().level(level))
+        self.game = Game(level)
+        self.pixels = pixels
+        self.pixel_size = pixel_size
+        self.frame_skip = frame_skip
+        self.limit = level_frames()
+        self.holding = False
+        self.obs = np.zeros(OBS_SIZE, dtype=np.float32)
+        self.seed = None   # layout seed in use; None for the level's own
+
+    def reset(self, seed=None):
+        """Starts the level again; seed overrides the level's layout seed from now on."""
+        if seed is not None:
+            self.seed = seed
+        params = self.level_params if self.seed is None else dict(self.level_params, seed=self.seed)
+        self.game.reset(params)
+        self.holding = False
+        return self._observation(), {}
+
+    def step(self, action):
+        game = self.game
+        reward = 0.0
+        terminated = False
+        outcome = None
+
+        for _ in range(self.frame_skip):
+            self._apply(action)
+            coins_before = game.current_level_coins
+            outcome = game.step()
+            reward += 1.0 / self.limit
+            reward += REWARD_COIN * (game.current_level_coins - coins_before)
+            if outcome is not None:
+                reward += REWARD_DEATH
+                terminated = True
+                break
+            if game.frames >= self.limit:
+                reward += REWARD_COMPLETE
+                outcome = "complete"
+                terminated = True
+                break
+
+        info = {"frames": game.frames, "coins": game.current_level_coins}
+        if outcome is not None:
+            info["outcome"] = outcome
+        return self._observation(), reward, terminated, False, info
+
+    def _apply(self, action):
+        """Same hooks as process_events for the keyboard/joystick."""
+        game = self.game
+        if action == HOLD_CHARGE:
+            if not self.holding:
+                game.handle_charged_jump_press()
+            self.holding = True
+        else:
+            if self.holding:
+                game.handle_charged_jump_release()
+            self.holding = False
+            if action == INSTANT_JUMP:
+                game.handle_instant_jump()
+        game.virtual_charge_held = self.holding
+
+    def _observation(self):
+        features = self._features()
+        if not self.pixels:
+            return features
+        return {"features": features, "pixels": self.render()}
+
+    def _features(self):
+        game = self.game
+        player = game.player
+        lm = game.level_manager
+        obs = self.obs
+        w, h = float(c.WIDTH), float(c.HEIGHT)
+        feet = player.y + player.height
+
+        obs[0] = player.y / h
+        obs[1] = player.vel_y / c.MAX_JUMP_STRENGTH
+        obs[2] = player.jump_charge / c.MAX_JUMP_STRENGTH
+        obs[3] = player.on_ground
+        obs[4] = player.can_double_jump
+        obs[5] = player.charging
+        obs[6] = self.holding
+        obs[7] = game.frames / self.limit
+
+        i = PLAYER_FEATURES
+        i = _fill(obs, i, NEAR_PLATFORMS, lm.platforms, player.x, feet, w, h, with_width=True)
+        i = _fill(obs, i, NEAR_OBSTACLES, lm.obstacles, player.x, feet, w, h)
+        _fill(obs, i, NEAR_COINS, lm.star_coins, player.x, feet, w, h)
+        return obs.copy()
+
+    def render(self):
+        """Draws the frame and returns it downscaled as (h, w, 3) uint8."""
+        game = self.game
+        game.draw_frame()
+        small = pygame.transform.smoothscale(game.renderer.to_surface(), self.pixel_size)
+        return pygame.surfarray.array3d(small).transpose(1, 0, 2)
+
+def _fill(obs, i, count, entities, px, feet, w, h, with_width=False):
+    """Writes the next `count` entities to the right of the player from obs[i]."""
+    n = 0
+    for e in entities:
+        if e.x + e.width <= px:
+            continue
+        obs[i] = (e.x - px) / w
+        obs[i + 1] = (e.y - feet) / h
+        if with_width:
+            obs[i + 2] = e.width / w
+        i += 3 if with_width else 2
+        n += 1
+        if n == count:
+            return i
+    for _ in range(count - n):
+        obs[i] = 1.0
+        obs[i + 1] = 0.0
+        if with_width:
+            obs[i + 2] = 0.0
+        i += 3 if with_width else 2
+    return i
+
+# ---------------------------------------------------------------------
+# VECTORIZED ENVIRONMENTS
+# ---------------------------------------------------------------------
+class SyncVectorEnv:
+    """
+    K environments stepped in lockstep in this process. Finished
+    environments reset automatically, on the layout seed they were last
+    reset with (see GameEnv); their last observation is returned in
+    infos[i]["final_observation"].
+    """
+
+    def __init__(self, num_envs, **env_kwargs):
+        self.envs = [GameEnv(**env_kwargs) for _ in range(num_envs)]
+        self.num_envs = num_envs
+
+    def reset(self, seed=None):
+        seeds = _seeds(seed, self.num_envs)
+        results = [env.reset(s) for env, s in zip(self.envs, seeds)]
+        return _stack([obs for obs, _ in results]), [info for _, info in results]
+
+    def step(self, actions):
+        obs_list, infos = [], []
+        rewards = np.zeros(self.num_envs, dtype=np.float32)
+        terminated = np.zeros(self.num_envs, dtype=bool)
+        truncated = np.zeros(self.num_envs, dtype=bool)
+        for i, (env, action) in enumerate(zip(self.envs, actions)):
+            obs, rewards[i], terminated[i], truncated[i], info = env.step(int(action))
+            if terminated[i] or truncated[i]:
+                info["final_observation"] = obs
+                obs, _ = env.reset()
+            obs_list.append(obs)
+            infos.append(info)
+        return _stack(obs_list), rewards, terminated, truncated, infos
+
+    def close(self):
+        pass
+
+def _worker(conn, num_envs, env_kwargs):
+    env = SyncVectorEnv(num_envs, **env_kwargs)
+    while True:
+        cmd, data = conn.recv()
+        if cmd == "step":
+            conn.send(env.step(data))
+        elif cmd == "reset":
+            conn.send(env.reset(data))
+        elif cmd == "close":
+            conn.close()
+            return
+
+class SubprocVectorEnv:
+    """
+    K environments split across worker processes. Each worker steps its
+    share in-process, so there is one message round trip per worker per
+    step rather than one per environment.
+    """
+
+    def __init__(self, num_envs, workers=None, **env_kwargs):
+        workers = min(num_envs, workers or mp.cpu_count())
+        sizes = [num_envs // workers + (i < num_envs % workers) for i in range(workers)]
+        self.num_envs = num_envs
+        self.slices = []
+        self.conns = []
+        self.procs = []
+        start = 0
+        for size in sizes:
+            parent, child = mp.Pipe()
+            proc = mp.Process(target=_worker, args=(child, size, env_kwargs), daemon=True)
+            proc.start()
+            child.close()
+            self.conns.append(parent)
+            self.procs.append(proc)
+            self.slices.append(slice(start, start + size))
+            start += size
+
+    def reset(self, seed=None):
+        seeds = _seeds(seed, self.num_envs)
+        for conn, sl in zip(self.conns, self.slices):
+            conn.send(("reset", seeds[sl] if seed is not None else None))
+        results = [conn.recv() for conn in self.conns]
+        return (_concat([obs for obs, _ in results]),
+                [info for _, infos in results for info in infos])
+
+    def step(self, actions):
+        actions = np.asarray(actions)
+        for conn, sl in zip(self.conns, self.slices):
+            conn.send(("step", actions[sl]))
+        results = [conn.recv() for conn in self.conns]
+        return (_concat([r[0] for r in results]),
+                np.concatenate([r[1] for r in results]),
+                np.concatenate([r[2] for r in results]),
+                np.concatenate([r[3] for r in results]),
+                [info for r in results for info in r[4]])
+
+    def close(self):
+        for conn in self.conns:
+            conn.send(("close", None))
+        for proc in self.procs:
+            proc.join()
+
+def _seeds(seed, n):
+    """None, a base seed (env i gets seed + i) or an explicit list."""
+    if seed is None:
+        return [None] * n
+    if isinstance(seed, (list, tuple)):
+        return list(seed)
+    return [seed + i for i in range(n)]
+
+def _stack(items):
+    if isinstance(items[0], dict):
+        return {k: np.stack([o[k] for o in items]) for k in items[0]}
+    return np.stack(items)
+
+def _concat(parts):
+    if isinstance(parts[0], dict):
+        return {k: np.concatenate([p[k] for p in parts]) for k in parts[0]}
+    return np.concatenate(parts)
@@ -0,0 +1,85 @@
+# frame_pacing.py
+
+import math
+import time
+from collections import deque
+
+import pygame
+import src.config as c
+
+HISTORY = 600       # frame intervals kept for the stats (~10 s at 60 Hz)
+LATE_FACTOR = 1.5   # a frame taking this many target intervals counts as late
+
+class FramePacer:
+    """
+    Caps the render rate after each presented frame and records the real
+    interval between frames, so pacing jitter can be shown and reported.
+
+    The pacer does the same with or without vsync: after a vsynced flip
+    Clock.tick simply returns at once unless RENDER_FPS is below the
+    refresh rate. precise=True uses
+    Clock.tick_busy_loop, which spins instead of sleeping: a steadier cadence
+    at the cost of a busy core.
+    """
+
+    def __init__(self, render_fps=None, precise=None):
+        self.render_fps = c.RENDER_FPS if render_fps is None else render_fps
+        self.precise = c.PRECISE_PACING if precise is None else precise
+        self.clock = pygame.time.Clock()
+        self.intervals = deque(maxlen=HISTORY)
+        self.frames = 0
+        self.late = 0
+        self.last = None
+
+    def wait(self):
+        """Call once per frame, right after pygame.display.update()."""
+        if self.precise:
+            self.clock.tick_busy_loop(self.render_fps)
+        else:
+            self.clock.tick(self.render_fps)
+
+        now = time.perf_counter()
+        if self.last is not None:
+            interval = now - self.last
+            self.intervals.append(interval)
+            target = self.target_interval()
+            if target and interval > LATE_FACTOR * target:
+                self.late += 1
+        self.last = now
+        self.frames += 1
+
+    def target_interval(self):
+        """Seconds per frame the pacing aims for (None when uncapped)."""
+        return 1.0 / self.render_fps if self.render_fps else None
+
+    def stats(self):
+        """
+        Summary of the recent frame intervals (milliseconds):
+            fps        frames per second
+            mean_ms    mean interval
+            jitter_ms  standard deviation of the interval
+            p99_ms     99th percentile interval
+            max_ms     worst interval
+            late       frames over LATE_FACTOR x the target, since creation
+        """
+        n = len(self.intervals)
+        if n == 0:
+            return {"fps": 0.0, "mean_ms": 0.0, "jitter_ms": 0.0,
+                    "p99_ms": 0.0, "max_ms": 0.0, "late": self.late}
+        ordered = sorted(self.intervals)
+        mean = sum(ordered) / n
+        var = sum((x - mean) ** 2 for x in ordered) / n
+        return {
+            "fps": 1.0 / mean if mean else 0.0,
+            "mean_ms": mean * 1000,
+            "jitter_ms": math.sqrt(var) * 1000,
+            "p99_ms": ordered[min(n - 1, int(n * 0.99))] * 1000,
+            "max_ms": ordered[-1] * 1000,
+            "late": self.late,
+        }
+
+    def summary(self):
+        s = self.stats()
+        return (f"{s['fps']:.0f} fps, frame {s['mean_ms']:.1f} ms, "
+                f"jitter {s['jitter_ms']:.2f} ms, p99 {s['p99_ms']:.1f} ms, "
+                f"max {s['max_ms']:.1f} ms, late {s['late']}")
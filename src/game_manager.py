@@ -3,6 +3,7 @@
 import pygame
 import sys
 import random
+import time
 
 import src.config as c
 import src.levels_config as lvl
@@ -10,13 +11,26 @@ from src.assets import load_assets
 from src.player import Player
 from src.spikes import Spikes
 from src.level_manager import LevelManager
-from src.bubbles import Bubble
+from src.bubbles import bubble_pool
+import src.pool as pool
+import src.gc_policy as gc_policy
+import src.replay as replay
+import src.ghost as ghost
+import src.spectate as spectate
+from src.coin import CoinAnimation
+from src.frame_pacing import FramePacer
+from src.input_latency import InputLatency
+from src.renderer import get_renderer
+from src.audio import get_audio
+import src.startup as startup
 
 # We'll assume your UI and Screens code is in other files
 from src.ui import (
     draw_black_bar_behind_spikes,
     draw_powerup_bar,
-    draw_hud_text
+    draw_hud_text,
+    draw_frame_stats,
+    draw_input_latency
 )
 from src.screens import (
     show_completion_screen,
@@ -24,14 +38,235 @@ from src.screens import (
     show_out_of_lives_screen
 )
 
-# Check for joystick
-if pygame.joystick.get_count() > 0:
-    joystick = pygame.joystick.Joystick(0)
-    joystick.init()
-else:
-    joystick = None
+_joysticks = None   # not looked up yet
+
+def get_joysticks():
+    """Every connected joystick; looked up on first use rather than at import."""
+    global _joysticks
+    if _joysticks is None:
+        _joysticks = [pygame.joystick.Joystick(i) for i in range(pygame.joystick.get_count())]
+        for joystick in _joysticks:
+            joystick.init()
+    return _joysticks
+
+def get_joystick():
+    """The first joystick, or None."""
+    joysticks = get_joysticks()
+    return joysticks[0] if joysticks else None
+
+class PlayerControls:
+    """
+    One player's part of the game: the Player, coyote-time and jump-buffer
+    timers, the charge buttons held, the joystick nudge and the coins
+    picked up this attempt, plus the rules that act on them. Game is the
+    first player's controls; versus mode (src/versus.py) adds a Seat for
+    each other player, all sharing the Game's level.
+
+    Expects self.audio, self.latency, self.joystick, self.recorder and
+    self.level_manager.
+    """
+
+    def make_player(self):
+        return Player()
+
+    def reset_controls(self) -> None:
+        """Fresh player, timers, held buttons and coins for a new attempt."""
+        self.player = self.make_player()
+
+        # Timers for coyote time & jump buffer
+        self.coyote_frames_charged = 0
+        self.jump_buffer_frames_charged = 0
+        self.coyote_frames_instant = 0
+        self.jump_buffer_frames_instant = 0
+
+        # This is the partial coins for the level attempt
+        self.current_level_coins = 0
+        # Ids of the coins collected, in order, for spectators (src/spectate.py)
+        self.collected_coins = []
+
+        # Charge buttons currently held, tracked from events ("key", "joy")
+        self.charge_held = set()
+        # Charge button held by scripted input (bots), alongside keyboard/joystick
+        self.virtual_charge_held = False
+        # Joystick nudge axis after the deadzone; replays set it directly
+        self.nudge_axis = 0.0
+
+    # -----------------------------------------------------------------
+    # BUTTONS
+    # -----------------------------------------------------------------
+    def charge_pressed(self, source, now) -> None:
+        """A charge button ("key" or "joy") went down at perf_counter() time now."""
+        self.latency.press(now)
+        self.charge_held.add(source)
+        self.record_input("press", True)
+        self.handle_charged_jump_press()
+
+    def charge_released(self, source, now) -> None:
+        self.latency.press(now)
+        self.charge_held.discard(source)
+        self.record_input("release", bool(self.charge_held))
+        self.handle_charged_jump_release()
+
+    def instant_pressed(self, now) -> None:
+        self.latency.press(now)
+        self.record_input("instant")
+        self.handle_instant_jump()
+
+    def record_input(self, action, value=None) -> None:
+        if self.recorder is not None:
+            self.recorder.input(self, action, value)
 
-class Game:
+    # -----------------------------------------------------------------
+    # UPDATING INPUT
+    # -----------------------------------------------------------------
+    def update_input(self) -> None:
+        # Charged jump logic: one step of charge while any charge button is held
+        if self.charge_held or self.virtual_charge_held:
+            self.accumulate_charge()
+
+        # Joystick nudge
+        if self.joystick is not None:
+            horizontal_input = self.joystick.get_axis(0)
+            if abs(horizontal_input) < c.JOYSTICK_NUDGE_DEADZONE:
+                horizontal_input = 0
+            if horizontal_input != self.nudge_axis:
+                self.record_input("axis", horizontal_input)
+                self.nudge_axis = horizontal_input
+        target_x = self.player.default_x + self.nudge_axis * c.JOYSTICK_NUDGE_RANGE
+
+        self.player.x += c.JOYSTICK_NUDGE_SPEED * (target_x - self.player.x)
+
+    def accumulate_charge(self) -> None:
+        """One frame of holding the charge button."""
+        if self.player.charging and self.player.on_ground:
+            self.player.jump_charge += c.CHARGE_RATE
+            if self.player.jump_charge > c.MAX_JUMP_STRENGTH:
+                self.player.jump_charge = c.MAX_JUMP_STRENGTH
+
+    # -----------------------------------------------------------------
+    # PLAYER STEP
+    # -----------------------------------------------------------------
+    def step_player(self):
+        """
+        This player's part of a simulation step, after the level has moved:
+        input state, movement, coyote/jump buffer, coins and deaths.
+        Returns 'obstacle' or 'spikes' if the player died, else None.
+        """
+        self.player.prev_x = self.player.x
+        self.player.prev_y = self.player.y
+        self.update_input()
+
+        # Move the player
+        self.player.move(self.level_manager.platforms, self.level_manager.landing_rects)
+
+        # Coyote + Jump Buffer
+        if self.player.on_ground:
+            self.set_coyote_ground_frames('charged', c.COYOTE_FRAMES)
+            if self.jump_buffer_frames_for('charged') > 0:
+                self.handle_charged_jump_press()
+                self.set_jump_buffer_frames('charged', 0)
+
+            self.set_coyote_ground_frames('instant', c.COYOTE_FRAMES)
+            if self.jump_buffer_frames_for('instant') > 0:
+                self.handle_instant_jump()
+                self.set_jump_buffer_frames('instant', 0)
+        else:
+            self.dec_coyote_ground_frames('charged')
+            self.dec_coyote_ground_frames('instant')
+
+        # Coin collection
+        player_rect = pygame.Rect(
+            self.player.x, self.player.y,
+            self.player.width, self.player.height
+        )
+        for coin in self.level_manager.coins_near(player_rect):
+            if player_rect.colliderect(coin.get_rect()):
+                self.collected_coins.append(coin.id)
+                self.level_manager.remove_coin(coin)
+                self.current_level_coins += 1
+                self.audio.play("coin")
+
+        # Collisions => death
+        if self.level_manager.check_obstacle_collisions(player_rect):
+            return 'obstacle'
+
+        # Spikes => death
+        spike_height = int(c.SPIKE_HEIGHT_FRAC * c.HEIGHT)
+        if (self.player.y + self.player.height) >= (c.HEIGHT - spike_height):
+            return 'spikes'
+
+        return None
+
+    # -----------------------------------------------------------------
+    # CHARGED + INSTANT JUMP
+    # -----------------------------------------------------------------
+    def handle_charged_jump_press(self) -> None:
+        if self.coyote_ground_frames_for('charged') > 0:
+            self.player.charging = True
+            self.player.jump_charge = c.MIN_JUMP_STRENGTH
+            self.latency.effect()
+            self.set_jump_buffer_frames('charged', 0)
+        else:
+            self.set_jump_buffer_frames('charged', c.JUMP_BUFFER_FRAMES)
+
+    def handle_charged_jump_release(self) -> None:
+        if self.player.charging:
+            if self.player.on_ground:
+                self.player.vel_y = -self.player.jump_charge
+                self.audio.play("boing")
+                self.latency.effect()
+            self.player.charging = False
+            self.player.jump_charge = 0
+
+    def handle_instant_jump(self) -> None:
+        if self.coyote_ground_frames_for('instant') > 0:
+            self.player.vel_y = -c.MIN_JUMP_STRENGTH
+            self.audio.play("boing")
+            self.latency.effect()
+            self.set_jump_buffer_frames('instant', 0)
+        else:
+            if not self.player.on_ground and self.player.can_double_jump:
+                self.player.vel_y = -c.MIN_JUMP_STRENGTH
+                self.player.can_double_jump = False
+                self.audio.play("boing")
+                self.latency.effect()
+            else:
+                self.set_jump_buffer_frames('instant', c.JUMP_BUFFER_FRAMES)
+
+    # -----------------------------------------------------------------
+    # COYOTE & JUMP BUFFER
+    # -----------------------------------------------------------------
+    def coyote_ground_frames_for(self, which_type: str) -> int:
+        if which_type == 'charged':
+            return self.coyote_frames_charged
+        return self.coyote_frames_instant
+
+    def set_coyote_ground_frames(self, which_type: str, value: int) -> None:
+        if which_type == 'charged':
+            self.coyote_frames_charged = value
+        else:
+            self.coyote_frames_instant = value
+
+    def dec_coyote_ground_frames(self, which_type: str) -> None:
+        if which_type == 'charged':
+            if self.coyote_frames_charged > 0:
+                self.coyote_frames_charged -= 1
+        else:
+            if self.coyote_frames_instant > 0:
+                self.coyote_frames_instant -= 1
+
+    def jump_buffer_frames_for(self, which_type: str) -> int:
+        if which_type == 'charged':
+            return self.jump_buffer_frames_charged
+        return self.jump_buffer_frames_instant
+
+    def set_jump_buffer_frames(self, which_type: str, value: int) -> None:
+        if which_type == 'charged':
+            self.jump_buffer_frames_charged = value
+        else:
+            self.jump_buffer_frames_instant = value
+
+class Game(PlayerControls):
     # -----------------------------------------------------------------
     # Shared "Persistent" Class Variables
     # -----------------------------------------------------------------
@@ -39,108 +274,127 @@ class Game:
     # your baseline_coins or lives each time you restart the game loop.
     persistent_baseline_coins = 0  # locked in from completed levels
     persistent_lives = 10         # total lives left
+    persistent_level_index = 0    # level being played, in the session's level pack
+    # Replays and ghosts follow a single player
+    records_runs = True
 
-    def __init__(self) -> None:
+    def __init__(self, level_index=None) -> None:
         # Load assets
         self.assets = load_assets()
         self.pokemon_images = self.assets['pokemon_images']
         self.coin_image = self.assets['coin_image']
-        self.boing_sound = self.assets['boing_sound']
-        self.coin_sound = self.assets['coin_sound']
+        self.coin_animation = CoinAnimation(self.assets['coin_frames'], self.assets['coin_frame_ms'])
+        self.audio = get_audio()
+        self.joystick = get_joystick()
+        startup.mark("assets")
         
         # Rendering
-        self.screen = pygame.display.get_surface()
-        self.clock = pygame.time.Clock()
+        self.renderer = get_renderer()
+        self.pacer = FramePacer()
         self.font = pygame.font.Font(None, 36)
         
         # Level manager
-        self.level_manager = LevelManager(self.pokemon_images, self.coin_image)
+        level_data = lvl.ENDLESS_LEVEL if c.ENDLESS_MODE else None
+        if level_index is None:
+            level_index = Game.persistent_level_index
+        self.level_manager = LevelManager(self.pokemon_images, self.coin_image, level_data,
+                                          level_index)
         self.current_level_index = self.level_manager.level_index
 
-        # Player & spikes
-        self.player = Player()
+        # Player (with its timers and coins) & spikes
+        self.reset_controls()
+        # Everyone playing: just this player, except in versus mode
+        self.seats = [self]
         self.spikes = Spikes()
 
         # Bubbles
         self.bubbles = []
 
-        # Timers for coyote time & jump buffer
-        self.coyote_frames_charged = 0
-        self.jump_buffer_frames_charged = 0
-        self.coyote_frames_instant = 0
-        self.jump_buffer_frames_instant = 0
-
         # For each new Game instance, read the persistent variables
         self.lives = Game.persistent_lives
         self.baseline_coins = Game.persistent_baseline_coins
 
-        # This is the partial coins for the level attempt
-        self.current_level_coins = 0
         self.final_coins_for_scoreboard = 0
 
         # Timers
         self.start_ticks = pygame.time.get_ticks()
         self.level_complete = False
+        self.frames = 0
+
+        # Records this run's inputs when c.RECORD_REPLAYS is set (see run)
+        self.recorder = None
+        # The best run on this level, raced with c.GHOSTS (see run)
+        self.ghost = None
+
+        self.latency = InputLatency()
+        startup.mark("game setup")
+
+    def reset(self, level_data=None) -> None:
+        """
+        Restarts the current level in place: fresh layout, player and
+        per-attempt state, without reloading assets. Headless tools use this
+        instead of building a new Game for every attempt.
+        """
+        if level_data is None and c.ENDLESS_MODE:
+            level_data = lvl.ENDLESS_LEVEL
+        self.level_manager.generate_seeded_level(self.current_level_index, level_data)
+        self.reset_controls()
+        bubble_pool.release_all(self.bubbles)
+        self.bubbles.clear()
+
+        self.start_ticks = pygame.time.get_ticks()
+        self.level_complete = False
+        self.frames = 0
+
+    def release(self) -> None:
+        """
+        Returns the level's entities and the bubbles to their pools, so the
+        next Game's layout reuses them. The screens call this once the
+        finished game has been drawn for the last time.
+        """
+        self.level_manager.release()
+        bubble_pool.release_all(self.bubbles)
+        self.bubbles.clear()
 
     # -----------------------------------------------------------------
     # EVENT PROCESSING
     # -----------------------------------------------------------------
     def process_events(self) -> None:
+        """
+        Reads the event queue; run() calls this right before every
+        simulation step so input is as fresh as possible. The charge buttons'
+        held state is tracked here too, instead of polling the devices.
+        """
+        now = time.perf_counter()
         for event in pygame.event.get():
             if event.type == pygame.QUIT:
                 pygame.quit()
                 sys.exit()
-
-            if event.type == pygame.KEYDOWN:
-                if event.key == pygame.K_ESCAPE:
-                    pygame.quit()
-                    sys.exit()
-                elif event.key == pygame.K_SPACE:
-                    self.handle_charged_jump_press()
-                elif event.key == pygame.K_x:
-                    self.handle_instant_jump()
-
-            if event.type == pygame.KEYUP:
-                if event.key == pygame.K_SPACE:
-                    self.handle_charged_jump_release()
-
-            # Joystick
-            if event.type == pygame.JOYBUTTONDOWN:
-                if event.button == 0:
-                    self.handle_charged_jump_press()
-                elif event.button == 2:
-                    self.handle_instant_jump()
-            if event.type == pygame.JOYBUTTONUP:
-                if event.button == 0:
-                    self.handle_charged_jump_release()
-
-    # -----------------------------------------------------------------
-    # UPDATING INPUT
-    # -----------------------------------------------------------------
-    def update_input(self) -> None:
-        keys = pygame.key.get_pressed()
-
-        # Charged jump logic
-        if keys[pygame.K_SPACE] and self.player.charging and self.player.on_ground:
-            self.player.jump_charge += c.CHARGE_RATE
-            if self.player.jump_charge > c.MAX_JUMP_STRENGTH:
-                self.player.jump_charge = c.MAX_JUMP_STRENGTH
-
-        if joystick is not None and joystick.get_button(0) and self.player.charging and self.player.on_ground:
-            self.player.jump_charge += c.CHARGE_RATE
-            if self.player.jump_charge > c.MAX_JUMP_STRENGTH:
-                self.player.jump_charge = c.MAX_JUMP_STRENGTH
-
-        # Joystick nudge
-        if joystick is not None:
-            horizontal_input = joystick.get_axis(0)
-            if abs(horizontal_input) < c.JOYSTICK_NUDGE_DEADZONE:
-                horizontal_input = 0
-            target_x = self.player.default_x + horizontal_input * c.JOYSTICK_NUDGE_RANGE
-        else:
-            target_x = self.player.default_x
-
-        self.player.x += c.JOYSTICK_NUDGE_SPEED * (target_x - self.player.x)
+            if event.type == pygame.KEYDOWN and event.key == pygame.K_ESCAPE:
+                pygame.quit()
+                sys.exit()
+            self.handle_event(event, now)
+
+    def handle_event(self, event, now) -> None:
+        """Keyboard (Space charges, X jumps) and any joystick (A charges, X jumps)."""
+        if event.type == pygame.KEYDOWN:
+            if event.key == pygame.K_SPACE:
+                self.charge_pressed("key", now)
+            elif event.key == pygame.K_x:
+                self.instant_pressed(now)
+        elif event.type == pygame.KEYUP:
+            if event.key == pygame.K_SPACE:
+                self.charge_released("key", now)
+
+        # Joystick
+        elif event.type == pygame.JOYBUTTONDOWN:
+            if event.button == 0:
+                self.charge_pressed("joy", now)
+            elif event.button == 2:
+                self.instant_pressed(now)
+        elif event.type == pygame.JOYBUTTONUP:
+            if event.button == 0:
+                self.charge_released("joy", now)
 
     # -----------------------------------------------------------------
     # BUBBLES
@@ -152,17 +406,18 @@ class Game:
                 y_position = random.randint(c.HEIGHT - spike_height - 10,
                                             c.HEIGHT - spike_height + 10)
                 x_position = random.randint(0, c.WIDTH)
-                new_bubble = Bubble(x_position, y_position)
+                new_bubble = bubble_pool.acquire(x_position, y_position)
                 self.bubbles.append(new_bubble)
 
         for bubble in self.bubbles[:]:
             bubble.update()
             if bubble.off_screen():
                 self.bubbles.remove(bubble)
+                bubble_pool.release(bubble)
 
-    def draw_bubbles(self):
+    def draw_bubbles(self, alpha=1.0):
         for bubble in self.bubbles:
-            bubble.draw(self.screen)
+            bubble.draw(self.renderer, alpha)
 
     # -----------------------------------------------------------------
     # UPDATE OBJECTS
@@ -171,81 +426,128 @@ class Game:
         self.level_manager.update_platforms()
         self.level_manager.update_obstacles()
         self.level_manager.update_coins()
+        self.level_manager.stream_chunks()
+        self.level_manager.update_landing_rects()
+
+    # -----------------------------------------------------------------
+    # SIMULATION STEP
+    # -----------------------------------------------------------------
+    def step(self):
+        """
+        Advances the game rules by one frame: the level's entities, then the
+        player (step_player). Events, bubbles, drawing and the level timer
+        stay in run(), so headless tools can call this directly.
+        Returns 'obstacle' or 'spikes' if the player died this frame, else None.
+        """
+        self.audio.new_frame()
+        self.update_objects()
+        death = self.step_player()
+        self.frames += 1
+        return death
 
     # -----------------------------------------------------------------
     # MAIN RUN
     # -----------------------------------------------------------------
     def run(self) -> None:
-        """A single "game run". If the player completes the level or dies, we end and call screens."""
+        """
+        A single "game run". If the player completes the level or dies, we end and call screens.
+
+        The rules advance in fixed steps of 1 / c.SIM_FPS seconds, as many as the
+        real time since the last frame allows, and drawing happens once per
+        loop, interpolated between the last two steps. A slow machine draws
+        fewer frames instead of slowing the game down, and the level timer
+        counts simulated time (self.frames) rather than wall-clock time.
+        """
         self.current_level_coins = 0
         self.level_complete = False
         self.start_ticks = pygame.time.get_ticks()
 
+        sim_dt = 1.0 / c.SIM_FPS
+        level_steps = int(c.LEVEL_DURATION * c.SIM_FPS)
+        accumulator = 0.0
+        gc_monitor = gc_policy.GCMonitor() if c.GC_STATS else None
+        gc_policy.level_start()
+        if c.RECORD_REPLAYS and self.records_runs:
+            self.recorder = replay.Recorder(self)
+        publisher = spectate.get_publisher() if c.SPECTATE else None
+        if publisher is not None:
+            publisher.level(self)
+        ghost_recorder = None
+        if c.GHOSTS and self.records_runs:
+            ghost_file = ghost.ghost_path(self.current_level_index, self.level_manager.endless)
+            self.ghost = ghost.load(ghost_file, self.player.width, self.player.height)
+            ghost_recorder = ghost.GhostRecorder()
+        previous = time.perf_counter()
+
+        death = None
         running = True
         while running:
-            self.screen.fill(c.LIGHT_BLUE)
-            self.update_bubbles()
-            self.draw_bubbles()
-
-            elapsed_time = (pygame.time.get_ticks() - self.start_ticks) / 1000.0
-            remaining_time = max(0, c.LEVEL_DURATION - elapsed_time)
-
-            self.process_events()
-            self.update_input()
-            self.update_objects()
-
-            # Move the player
-            self.player.move(self.level_manager.platforms)
-
-            # Coyote + Jump Buffer
-            if self.player.on_ground:
-                self.set_coyote_ground_frames('charged', c.COYOTE_FRAMES)
-                if self.jump_buffer_frames_for('charged') > 0:
-                    self.handle_charged_jump_press()
-                    self.set_jump_buffer_frames('charged', 0)
-
-                self.set_coyote_ground_frames('instant', c.COYOTE_FRAMES)
-                if self.jump_buffer_frames_for('instant') > 0:
-                    self.handle_instant_jump()
-                    self.set_jump_buffer_frames('instant', 0)
-            else:
-                self.dec_coyote_ground_frames('charged')
-                self.dec_coyote_ground_frames('instant')
-
-            # Coin collection
-            player_rect = pygame.Rect(
-                self.player.x, self.player.y,
-                self.player.width, self.player.height
-            )
-            for coin in self.level_manager.star_coins[:]:
-                if player_rect.colliderect(coin.get_rect()):
-                    self.level_manager.star_coins.remove(coin)
-                    self.current_level_coins += 1
-                    self.coin_sound.play()
-
-            # Draw everything
-            self.draw_game(remaining_time)
-
-            # Collisions => death
-            if self.level_manager.check_obstacle_collisions(player_rect):
-                running = False
-                self.level_complete = False
-
-            # Spikes => death
-            spike_height = int(c.SPIKE_HEIGHT_FRAC * c.HEIGHT)
-            if (self.player.y + self.player.height) >= (c.HEIGHT - spike_height):
-                running = False
-                self.level_complete = False
-
-            # Timer => level complete
-            if remaining_time <= 0:
-                running = False
-                self.level_complete = True
-
-            pygame.display.update()
-            self.clock.tick(30)
-
-        # End of main loop => either we died or completed
+            now = time.perf_counter()
+            # Clamped so a stall (window drag, breakpoint) doesn't replay seconds of game
+            accumulator += min(now - previous, c.MAX_FRAME_TIME)
+            previous = now
+
+            while running and accumulator >= sim_dt:
+                accumulator -= sim_dt
+                self.process_events()
+                self.update_bubbles()
+                death = self.step()
+                if ghost_recorder is not None:
+                    ghost_recorder.record(self.player)
+                    if self.ghost is not None:
+                        self.ghost.advance()
+                if publisher is not None:
+                    publisher.frame(self)
+
+                if death is not None:
+                    running = False
+                    self.level_complete = False
+
+                # Timer => level complete (endless runs only end on death)
+                elif self.frames >= level_steps and not self.level_manager.endless:
+                    running = False
+                    self.level_complete = True
+
+            # Draw everything, part way between the last two steps
+            self.draw_frame(min(accumulator / sim_dt, 1.0))
+            self.renderer.present()
+            self.latency.presented(time.perf_counter())
+            startup.first_frame()
+            self.pacer.wait()
+            if gc_monitor is not None:
+                gc_monitor.end_frame()
+
+        if c.FRAME_STATS:
+            print(f"Frame pacing: {self.pacer.summary()}")
+            print(f"Pool hit rates: {pool.summary()}")
+            if publisher is not None:
+                print(f"Spectators: {publisher.summary()}")
+        if c.INPUT_LATENCY_STATS and self.latency.samples:
+            s = self.latency.stats()
+            print(f"Input latency: {s['count']} inputs, mean {s['mean_ms']:.1f} ms, "
+                  f"p50 {s['p50_ms']:.1f} ms, p95 {s['p95_ms']:.1f} ms, max {s['max_ms']:.1f} ms")
+            print("\n".join(self.latency.histogram()))
+        if c.AUDIO_STATS:
+            print(f"Audio: {self.audio.summary()}")
+        if gc_monitor is not None:
+            print(f"Garbage collector: {gc_monitor.summary(self.pacer)}")
+            gc_monitor.close()
+        gc_policy.level_end()
+        if publisher is not None:
+            publisher.end(self, death)
+        if self.recorder is not None:
+            print(f"Replay saved to {replay.save(self.recorder.finish(self, death))}")
+            self.recorder = None
+        if ghost_recorder is not None:
+            if self.ghost is not None:
+                self.ghost.close()
+            if ghost.save_if_best(ghost_recorder, ghost_file, self.current_level_coins):
+                print(f"New best run saved as the ghost for {self.level_manager.level_name}")
+
+        self.finish_level()
+
+    def finish_level(self) -> None:
+        """The run is over: bank the coins or lose a life, then show the screen for it."""
         if self.level_complete:
             # Lock in partial coins from this level
             self.baseline_coins += self.current_level_coins
@@ -271,90 +573,62 @@ class Game:
     # -----------------------------------------------------------------
     # DRAW GAME
     # -----------------------------------------------------------------
-    def draw_game(self, remaining_time: float) -> None:
-        """Draws black bar, player, spikes, platforms, coins, plus HUD and power-up bar."""
-        draw_black_bar_behind_spikes(self)
-        self.player.draw(self.screen)
-        self.spikes.draw(self.screen)
-
-        for platform in self.level_manager.platforms:
-            platform.draw(self.screen)
-        for obs in self.level_manager.obstacles:
-            obs.draw(self.screen)
-        for coin in self.level_manager.star_coins:
-            coin.draw(self.screen)
-
-        draw_hud_text(self, remaining_time)
-        draw_powerup_bar(self)
-
-    # -----------------------------------------------------------------
-    # CHARGED + INSTANT JUMP
-    # -----------------------------------------------------------------
-    def handle_charged_jump_press(self) -> None:
-        if self.coyote_ground_frames_for('charged') > 0:
-            self.player.charging = True
-            self.player.jump_charge = c.MIN_JUMP_STRENGTH
-            self.set_jump_buffer_frames('charged', 0)
-        else:
-            self.set_jump_buffer_frames('charged', c.JUMP_BUFFER_FRAMES)
+    def draw_frame(self, alpha: float = 1.0) -> None:
+        """
+        Background, bubbles and draw_game. Screens redraw this under their
+        text rather than reusing the last frame, since a GPU renderer's back
+        buffer is undefined after present().
+        """
+        remaining_time = max(0, c.LEVEL_DURATION - self.frames / c.SIM_FPS)
+        self.renderer.fill(c.LIGHT_BLUE)
+        self.draw_bubbles(alpha)
+        self.draw_game(remaining_time, alpha)
+
+    def draw_game(self, remaining_time: float, alpha: float = 1.0) -> None:
+        """
+        Draws black bar, player, spikes, platforms, coins, plus HUD and power-up bar.
+        alpha is how far into the next step to draw (0 = previous, 1 = current).
+        """
+        # The world scrolled c.SPEED px left during the last step
+        scroll = (1.0 - alpha) * c.SPEED
 
-    def handle_charged_jump_release(self) -> None:
-        if self.player.charging:
-            if self.player.on_ground:
-                self.player.vel_y = -self.player.jump_charge
-                self.boing_sound.play()
-            self.player.charging = False
-            self.player.jump_charge = 0
+        draw_black_bar_behind_spikes(self)
+        self.draw_players(alpha)
+        self.spikes.draw(self.renderer)
 
-    def handle_instant_jump(self) -> None:
-        if self.coyote_ground_frames_for('instant') > 0:
-            self.player.vel_y = -c.MIN_JUMP_STRENGTH
-            self.boing_sound.play()
-            self.set_jump_buffer_frames('instant', 0)
-        else:
-            if not self.player.on_ground and self.player.can_double_jump:
-                self.player.vel_y = -c.MIN_JUMP_STRENGTH
-                self.player.can_double_jump = False
-                self.boing_sound.play()
-            else:
-                self.set_jump_buffer_frames('instant', c.JUMP_BUFFER_FRAMES)
+        # Coins animate on the simulation clock, so they pause with the game
+        anim_ms = (self.frames - 1 + alpha) * 1000 / c.SIM_FPS
+        coin_frame = self.coin_animation.frame_at(max(0.0, anim_ms))
 
-    # -----------------------------------------------------------------
-    # COYOTE & JUMP BUFFER
-    # -----------------------------------------------------------------
-    def coyote_ground_frames_for(self, which_type: str) -> int:
-        if which_type == 'charged':
-            return self.coyote_frames_charged
-        return self.coyote_frames_instant
+        # Platforms, obstacles and coins in one batched call
+        self.renderer.blits(self.level_manager.draw_list(scroll, coin_frame), doreturn=False)
 
-    def set_coyote_ground_frames(self, which_type: str, value: int) -> None:
-        if which_type == 'charged':
-            self.coyote_frames_charged = value
-        else:
-            self.coyote_frames_instant = value
+        self.draw_hud(remaining_time)
+        if c.FRAME_STATS:
+            draw_frame_stats(self)
+        if c.INPUT_LATENCY_STATS:
+            draw_input_latency(self)
 
-    def dec_coyote_ground_frames(self, which_type: str) -> None:
-        if which_type == 'charged':
-            if self.coyote_frames_charged > 0:
-                self.coyote_frames_charged -= 1
-        else:
-            if self.coyote_frames_instant > 0:
-                self.coyote_frames_instant -= 1
+    def seat_out(self, n) -> bool:
+        """Whether player n is out of the round; only versus rounds go on without someone."""
+        return False
 
-    def jump_buffer_frames_for(self, which_type: str) -> int:
-        if which_type == 'charged':
-            return self.jump_buffer_frames_charged
-        return self.jump_buffer_frames_instant
+    def draw_players(self, alpha: float = 1.0) -> None:
+        if self.ghost is not None:
+            self.ghost.draw(self.renderer, alpha)
+        self.player.draw(self.renderer, alpha)
 
-    def set_jump_buffer_frames(self, which_type: str, value: int) -> None:
-        if which_type == 'charged':
-            self.jump_buffer_frames_charged = value
-        else:
-            self.jump_buffer_frames_instant = value
+    def draw_hud(self, remaining_time: float) -> None:
+        draw_hud_text(self, remaining_time)
+        draw_powerup_bar(self)
 
 def main() -> None:
     while True:
-        game = Game()
+        if c.VERSUS_PLAYERS > 1:
+            from src.versus import VersusGame
+            game = VersusGame()
+        else:
+            game = Game()
         game.run()
 
 if __name__ == "__main__":
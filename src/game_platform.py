@@ -1,20 +1,51 @@
 # game_platform.py
 import pygame
 import src.config as c
+from src.assets import bake
+from src.pool import Pool
+
+PLATFORM_COLOR = (0, 255, 0)
+
+# One pre-rendered surface per platform size, shared by every platform
+_surfaces = {}
+
+def platform_surface(width, height):
+    surf = _surfaces.get((width, height))
+    if surf is None:
+        surf = pygame.Surface((width, height))
+        surf.fill(PLATFORM_COLOR)
+        surf = bake(surf)
+        _surfaces[(width, height)] = surf
+    return surf
 
 class Platform:
+    __slots__ = ("x", "y")
+
+    # Every platform has the same size and surface, sized for the window
+    # the first time one is made after it changed (main.py sets the size)
+    width = height = 0
+    image = None
+    _window = None
+
     def __init__(self, x, y):
-        self.width = int(c.PLATFORM_WIDTH_FRAC * c.WIDTH)
-        self.height = int(c.PLATFORM_HEIGHT_FRAC * c.HEIGHT)
+        self.reset(x, y)
+
+    def reset(self, x, y):
+        if Platform._window != (c.WIDTH, c.HEIGHT):
+            Platform._window = (c.WIDTH, c.HEIGHT)
+            Platform.width = int(c.PLATFORM_WIDTH_FRAC * c.WIDTH)
+            Platform.height = int(c.PLATFORM_HEIGHT_FRAC * c.HEIGHT)
+            Platform.image = platform_surface(Platform.width, Platform.height)
         self.x = x
         self.y = y
-        self.speed = c.SPEED
 
     def move(self):
-        self.x -= self.speed
+        self.x -= c.SPEED
 
-    def draw(self, screen):
-        pygame.draw.rect(screen, (0, 255, 0), (self.x, self.y, self.width, self.height))
+    def draw(self, screen, offset_x=0):
+        screen.blit(self.image, (self.x + offset_x, self.y))
 
     def off_screen(self):
         return (self.x + self.width) < 0
+
+platform_pool = Pool("platform", Platform)
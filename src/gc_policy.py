@@ -0,0 +1,119 @@
+# gc_policy.py
+#
+# When Python's cyclic garbage collector may run. The game loop makes many
+# short-lived objects (Rects, list copies, rendered text) and a collection
+# that lands mid-level is a frame spike, so Game.run tells this module
+# when a level starts and ends:
+#
+#   default   leave the collector alone
+#   tuned     (default) gc.freeze() after the level is loaded, so assets,
+#             modules and the layout are never scanned again, and raise the
+#             thresholds to c.GC_THRESHOLDS
+#   screens   also freeze, but no automatic collection during play at all:
+#             one full collection runs on the screen after each level
+#
+#   python main.py --gc-policy screens --gc-stats
+
+import gc
+import time
+from collections import deque
+
+import src.config as c
+from src.frame_pacing import LATE_FACTOR
+
+POLICIES = ("default", "tuned", "screens")
+HISTORY = 600   # frames kept, as in frame_pacing
+
+_default_thresholds = gc.get_threshold()
+
+def level_start():
+    """Game.run calls this when the level is loaded, right before its first frame."""
+    if c.GC_POLICY not in POLICIES:
+        raise ValueError(f"Unknown GC policy {c.GC_POLICY!r}; choose from {', '.join(POLICIES)}")
+    if c.GC_POLICY == "default":
+        return
+    gc.freeze()
+    if c.GC_POLICY == "tuned":
+        gc.set_threshold(*c.GC_THRESHOLDS)
+    else:
+        gc.disable()
+
+def level_end():
+    """
+    Game.run calls this when the level is over, before its screen: frozen
+    objects become collectable again (the next level_start freezes the
+    survivors), and the "screens" policy collects now, while nothing moves.
+    """
+    if c.GC_POLICY == "default":
+        return
+    gc.unfreeze()
+    gc.set_threshold(*_default_thresholds)
+    gc.enable()
+    if c.GC_POLICY == "screens":
+        gc.collect()
+
+class GCMonitor:
+    """
+    Records every collection through gc.callbacks: its generation and
+    pause, and which frame it landed in. Game.run calls end_frame() right
+    after FramePacer.wait(), so pauses line up with the pacer's frame
+    intervals and slow frames can be matched to collections.
+    """
+
+    def __init__(self):
+        self.started = None
+        self.frame_pause = 0.0
+        self.pauses = deque(maxlen=HISTORY)   # seconds of collection per frame
+        self.collections = [0, 0, 0]           # per generation
+        self.total = 0.0
+        self.longest = 0.0
+        gc.callbacks.append(self.callback)
+
+    def close(self):
+        if self.callback in gc.callbacks:
+            gc.callbacks.remove(self.callback)
+
+    def callback(self, phase, info):
+        if phase == "start":
+            self.started = time.perf_counter()
+        elif self.started is not None:
+            pause = time.perf_counter() - self.started
+            self.started = None
+            self.collections[info["generation"]] += 1
+            self.frame_pause += pause
+            self.total += pause
+            self.longest = max(self.longest, pause)
+
+    def end_frame(self):
+        self.pauses.append(self.frame_pause)
+        self.frame_pause = 0.0
+
+    def stats(self, pacer=None):
+        """
+        Collections per generation, total and longest pause (ms) since
+        creation. With the game's FramePacer, also how many recent late
+        frames (see frame_pacing.LATE_FACTOR) had a collection in them.
+        """
+        s = {
+            "collections": list(self.collections),
+            "total_ms": self.total * 1000,
+            "max_ms": self.longest * 1000,
+            "frames_with_gc": sum(1 for p in self.pauses if p),
+        }
+        if pacer is not None and pacer.target_interval():
+            limit = LATE_FACTOR * pacer.target_interval()
+            # Both deques gain one entry per frame; pair them from the newest
+            pairs = list(zip(reversed(pacer.intervals), reversed(self.pauses)))
+            late = [pause for interval, pause in pairs if interval > limit]
+            s["late_frames"] = len(late)
+            s["late_with_gc"] = sum(1 for pause in late if pause)
+        return s
+
+    def summary(self, pacer=None):
+        s = self.stats(pacer)
+        gen = "/".join(str(n) for n in s["collections"])
+        text = (f"{gen} collections (gen 0/1/2), {s['total_ms']:.1f} ms total, "
+                f"longest {s['max_ms']:.2f} ms, in {s['frames_with_gc']} recent frames")
+        if "late_frames" in s:
+            text += f"; {s['late_with_gc']} of {s['late_frames']} late frames had a collection"
+        return text
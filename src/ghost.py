@@ -0,0 +1,189 @@
+# ghost.py
+#
+# Ghost racing: the best run on each level is kept as the player's
+# position and charge for every simulation step, and drawn as a
+# translucent square while the level is played again.
+#
+#   python main.py --ghost        race (and record) c.GHOST_DIR/<pack>/<W>x<H>/level<N>.ghost
+#
+# Ghost files are little-endian: a header (with the window size the run
+# was played at, since the whole level scales with it), then one record
+# per step. Positions are whole pixels (the top-left corner, as drawn), stored as
+# the change from the previous step; a step that moved further than a
+# delta can hold is stored in full.
+#   delta record  int8 dx, int8 dy, uint8 charge              3 bytes
+#   full record   int8 -128, int16 x, int16 y, uint8 charge   6 bytes
+# charge is 0 when not charging, else jump_charge scaled to 1..255.
+#
+# The file is streamed while playing: a small buffer is refilled from it
+# as the ghost advances, so only the header is read when the level starts.
+
+import os
+import re
+import struct
+
+import pygame
+
+import src.config as c
+from src.assets import bake
+
+GHOST_COLOR = (255, 255, 255)
+CHARGE_COLOR = (255, 215, 0)
+
+MAGIC = b"GPDG"
+FORMAT = 2
+HEADER = struct.Struct("<4sHHIIHH")   # magic, format, sim_fps, frames, coins, width, height
+DELTA = struct.Struct("<bbB")
+FULL = struct.Struct("<bhhB")
+FULL_MARK = -128
+FULL_BYTE = FULL_MARK & 0xFF
+READ_CHUNK = 4096   # bytes read from the file at a time (about 1300 steps)
+
+_surfaces = {}
+
+def ghost_surfaces(width, height):
+    """The ghost square and its charge fill, translucent and shared."""
+    surfs = _surfaces.get((width, height))
+    if surfs is None:
+        surfs = []
+        for color in (GHOST_COLOR, CHARGE_COLOR):
+            surf = pygame.Surface((width, height))
+            surf.fill(color)
+            surf = bake(surf)
+            surf.set_alpha(c.GHOST_ALPHA)
+            surfs.append(surf)
+        _surfaces[(width, height)] = surfs
+    return surfs
+
+def ghost_path(level_index, endless=False):
+    """Where the best run of a level in the session's pack is kept, one per window size."""
+    from src.levelpack import get_pack
+    pack = re.sub(r"[^\w.-]+", "_", get_pack().name)
+    name = "endless" if endless else f"level{level_index + 1}"
+    return os.path.join(c.GHOST_DIR, pack, f"{c.WIDTH}x{c.HEIGHT}", f"{name}.ghost")
+
+def charge_byte(player):
+    """The player's jump charge as stored in ghost files (and sent to spectators)."""
+    if not player.charging:
+        return 0
+    return max(1, min(255, round(player.jump_charge / c.MAX_JUMP_STRENGTH * 255)))
+
+class GhostRecorder:
+    """Encodes the player's state after every step of a run."""
+
+    def __init__(self):
+        self.data = bytearray()
+        self.frames = 0
+        self.x = self.y = None
+
+    def record(self, player):
+        x, y = round(player.x), round(player.y)
+        charge = charge_byte(player)
+        if self.x is not None and -127 <= x - self.x <= 127 and -127 <= y - self.y <= 127:
+            self.data += DELTA.pack(x - self.x, y - self.y, charge)
+        else:
+            x = max(-32768, min(32767, x))
+            y = max(-32768, min(32767, y))
+            self.data += FULL.pack(FULL_MARK, x, y, charge)
+        self.x, self.y = x, y
+        self.frames += 1
+
+    def save(self, path, coins):
+        """Writes the run, replacing path only once the new file is complete."""
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        tmp = path + ".tmp"
+        with open(tmp, "wb") as f:
+            f.write(HEADER.pack(MAGIC, FORMAT, c.SIM_FPS, self.frames, coins, c.WIDTH, c.HEIGHT))
+            f.write(self.data)
+        os.replace(tmp, path)
+
+def read_header(path):
+    """(frames, coins) of a ghost file, or None if there is none usable."""
+    try:
+        with open(path, "rb") as f:
+            head = f.read(HEADER.size)
+    except OSError:
+        return None
+    if len(head) < HEADER.size:
+        return None
+    magic, version, sim_fps, frames, coins, width, height = HEADER.unpack(head)
+    if magic != MAGIC or version != FORMAT or sim_fps != c.SIM_FPS:
+        return None
+    if (width, height) != (c.WIDTH, c.HEIGHT):
+        return None
+    return frames, coins
+
+def save_if_best(recorder, path, coins):
+    """
+    Keeps the run if it beats the stored one: it lasted more steps (a
+    completed level lasts all of them), or as long with more coins.
+    """
+    best = read_header(path)
+    if best is not None and (recorder.frames, coins) <= best:
+        return False
+    recorder.save(path, coins)
+    return True
+
+class Ghost:
+    """A stored run played back step by step, read from its file as it goes."""
+
+    def __init__(self, path, width, height):
+        self.file = open(path, "rb")
+        _, _, _, self.frames, self.coins, _, _ = HEADER.unpack(self.file.read(HEADER.size))
+        self.buf = b""
+        self.pos = 0
+        self.frame = 0
+        self.x = self.y = self.prev_x = self.prev_y = None
+        self.charge = 0
+        self.width = width
+        self.height = height
+        self.surface, self.charge_surface = ghost_surfaces(width, height)
+
+    def close(self):
+        self.file.close()
+
+    def _need(self, n):
+        if self.pos + n > len(self.buf):
+            self.buf = self.buf[self.pos:] + self.file.read(READ_CHUNK)
+            self.pos = 0
+
+    def advance(self):
+        """Moves to the next step; once the stored run is over the ghost disappears."""
+        if self.frame >= self.frames:
+            self.x = None
+            return
+        self._need(FULL.size)
+        size = FULL.size if self.pos < len(self.buf) and self.buf[self.pos] == FULL_BYTE else DELTA.size
+        if self.pos + size > len(self.buf):
+            # The file is shorter than its header says: the ghost stops there
+            self.frame = self.frames
+            self.x = None
+            return
+        if size == FULL.size:
+            _, x, y, self.charge = FULL.unpack_from(self.buf, self.pos)
+            self.pos += FULL.size
+        else:
+            dx, dy, self.charge = DELTA.unpack_from(self.buf, self.pos)
+            self.pos += DELTA.size
+            x, y = self.x + dx, self.y + dy
+        self.prev_x, self.prev_y = (x, y) if self.x is None else (self.x, self.y)
+        self.x, self.y = x, y
+        self.frame += 1
+
+    def draw(self, screen, alpha=1.0):
+        if self.x is None:
+            return
+        x = self.prev_x + (self.x - self.prev_x) * alpha
+        y = self.prev_y + (self.y - self.prev_y) * alpha
+        screen.blit(self.surface, (x, y))
+        if self.charge:
+            # Fills from the bottom as the jump charges
+            h = self.height * self.charge // 255
+            screen.blit(self.charge_surface, (x, y + self.height - h),
+                        (0, self.height - h, self.width, h))
+
+def load(path, width, height):
+    """The stored ghost at path, or None when there is no usable file."""
+    if read_header(path) is None:
+        return None
+    return Ghost(path, width, height)
@@ -0,0 +1,168 @@
+# gif.py
+#
+# Animated GIF decoding. pygame.image.load only returns the first frame, so
+# this decodes every frame (with Pillow when it is installed, otherwise with
+# the small LZW decoder below) into full-canvas RGBA surfaces.
+
+import numpy as np
+import pygame
+
+DEFAULT_DELAY_MS = 100  # GIFs with a 0 delay play at this rate, as browsers do
+
+def load_gif_frames(path):
+    """
+    Returns [(surface, duration_ms), ...], one per frame, each surface the
+    whole canvas with per-pixel alpha (a still image gives one frame).
+    """
+    try:
+        from PIL import Image, ImageSequence
+    except ImportError:
+        with open(path, "rb") as f:
+            return decode_gif(f.read())
+
+    frames = []
+    with Image.open(path) as im:
+        for frame in ImageSequence.Iterator(im):
+            rgba = frame.convert("RGBA")
+            surf = pygame.image.frombuffer(rgba.tobytes(), rgba.size, "RGBA").copy()
+            frames.append((surf, frame.info.get("duration") or DEFAULT_DELAY_MS))
+    return frames
+
+# ---------------------------------------------------------------------
+# PURE-PYTHON DECODER
+# ---------------------------------------------------------------------
+def _lzw_decode(data, min_code_size):
+    """GIF-flavoured variable-width LZW; returns the colour index bytes."""
+    clear = 1 << min_code_size
+    end = clear + 1
+    base = [bytes((i,)) for i in range(clear)] + [b"", b""]
+    table = list(base)
+    code_size = min_code_size + 1
+    out = bytearray()
+    prev = None
+    buf = bits = 0
+    for byte in data:
+        buf |= byte << bits
+        bits += 8
+        while bits >= code_size:
+            code = buf & ((1 << code_size) - 1)
+            buf >>= code_size
+            bits -= code_size
+            if code == clear:
+                table = list(base)
+                code_size = min_code_size + 1
+                prev = None
+                continue
+            if code == end:
+                return bytes(out)
+            if prev is None:
+                entry = table[code]
+            elif code < len(table):
+                entry = table[code]
+                table.append(prev + entry[:1])
+            else:
+                entry = prev + prev[:1]
+                table.append(entry)
+            out += entry
+            prev = entry
+            if len(table) == 1 << code_size and code_size < 12:
+                code_size += 1
+    return bytes(out)
+
+def _sub_blocks(data, pos):
+    """Concatenated data sub-blocks starting at pos; returns (bytes, next pos)."""
+    chunks = []
+    while True:
+        if pos >= len(data):
+            raise ValueError("GIF data ends inside a block")
+        size = data[pos]
+        pos += 1
+        if size == 0:
+            return b"".join(chunks), pos
+        chunks.append(data[pos:pos + size])
+        pos += size
+
+def _palette(data, pos, flags):
+    count = 2 << (flags & 0x07)
+    colors = np.frombuffer(data, np.uint8, count * 3, pos).reshape(count, 3)
+    return colors, pos + count * 3
+
+def _deinterlace(rows):
+    order = (list(range(0, len(rows), 8)) + list(range(4, len(rows), 8))
+             + list(range(2, len(rows), 4)) + list(range(1, len(rows), 2)))
+    out = np.empty_like(rows)
+    out[order] = rows
+    return out
+
+def decode_gif(data):
+    """Decodes GIF87a/89a bytes into [(surface, duration_ms), ...]."""
+    if data[:6] not in (b"GIF87a", b"GIF89a"):
+        raise ValueError("not a GIF file")
+    width = int.from_bytes(data[6:8], "little")
+    height = int.from_bytes(data[8:10], "little")
+    flags = data[10]
+    pos = 13
+    global_palette = None
+    if flags & 0x80:
+        global_palette, pos = _palette(data, pos, flags)
+
+    canvas = np.zeros((height, width, 4), np.uint8)
+    frames = []
+    delay, transparent, disposal = DEFAULT_DELAY_MS, None, 0
+
+    while pos < len(data):
+        block = data[pos]
+        pos += 1
+        if block == 0x3B:  # trailer
+            break
+
+        if block == 0x21:  # extension
+            label = data[pos]
+            payload, pos = _sub_blocks(data, pos + 1)
+            if label == 0xF9 and len(payload) >= 4:  # graphic control
+                disposal = (payload[0] >> 2) & 0x07
+                delay = int.from_bytes(payload[1:3], "little") * 10 or DEFAULT_DELAY_MS
+                transparent = payload[3] if payload[0] & 0x01 else None
+            continue
+
+        if block != 0x2C:
+            raise ValueError(f"unexpected GIF block 0x{block:02x}")
+
+        left, top, w, h = (int.from_bytes(data[pos + i:pos + i + 2], "little")
+                           for i in (0, 2, 4, 6))
+        image_flags = data[pos + 8]
+        pos += 9
+        palette = global_palette
+        if image_flags & 0x80:
+            palette, pos = _palette(data, pos, image_flags)
+        min_code_size = data[pos]
+        lzw, pos = _sub_blocks(data, pos + 1)
+
+        indices = np.frombuffer(_lzw_decode(lzw, min_code_size), np.uint8)
+        if len(indices) < w * h:
+            raise ValueError(f"GIF frame {len(frames) + 1} is truncated "
+                             f"({len(indices)} of {w * h} pixels)")
+        indices = indices[:w * h].reshape(h, w)
+        if image_flags & 0x40:
+            indices = _deinterlace(indices)
+
+        # Clip to the canvas; transparent pixels leave the canvas unchanged
+        h = min(h, height - top)
+        w = min(w, width - left)
+        indices = indices[:h, :w]
+        previous = canvas.copy() if disposal == 3 else None
+        region = canvas[top:top + h, left:left + w]
+        opaque = indices != transparent if transparent is not None else np.ones_like(indices, bool)
+        region[opaque, :3] = palette[indices[opaque]]
+        region[opaque, 3] = 255
+
+        surf = pygame.image.frombuffer(canvas.tobytes(), (width, height), "RGBA").copy()
+        frames.append((surf, delay))
+
+        if disposal == 2:
+            region[:] = 0
+        elif disposal == 3:
+            canvas = previous
+        delay, transparent, disposal = DEFAULT_DELAY_MS, None, 0
+
+    return frames
@@ -0,0 +1,22 @@
+# headless.py
+import os
+import pygame
+import src.config as c
+
+def init_headless():
+    """
+    Initializes pygame with dummy video/audio drivers so the game rules can
+    run without a window (bots, batch tools, CI). Call this before creating
+    a Game.
+    """
+    os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+    os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+    # SDL otherwise turns SIGTERM into a QUIT event, so pool workers never exit
+    os.environ.setdefault("SDL_NO_SIGNAL_HANDLERS", "1")
+    pygame.init()
+    if pygame.display.get_surface() is None:
+        pygame.display.set_mode((c.WIDTH, c.HEIGHT))
+
+def level_frames():
+    """Frames a level lasts at the nominal frame rate."""
+    return int(c.LEVEL_DURATION * c.FPS)
@@ -0,0 +1,73 @@
+# input_latency.py
+
+from collections import deque
+
+BUCKET_MS = 5        # histogram bucket width
+BUCKETS = 20         # 0-100 ms, plus one overflow bucket
+HISTORY = 1000       # samples kept for the percentiles
+
+class InputLatency:
+    """
+    Measures input-to-photon latency as far as the game can see it: from
+    the moment a jump input is read off the event queue to the present of
+    the first frame that shows its effect (charge starting, jump launching).
+
+    Game calls press(t) for every jump button event, effect() from the
+    jump handlers when the input changed the player, and presented(t) right
+    after pygame.display.update(). A press that does nothing (a jump while
+    airborne without a double jump) is replaced by the next one; a buffered
+    jump counts from the press that buffered it.
+    """
+
+    def __init__(self):
+        self.pending = None   # time of the last press still waiting for an effect
+        self.effects = []     # press times whose effect is in the next frame
+        self.samples = deque(maxlen=HISTORY)
+        self.counts = [0] * (BUCKETS + 1)
+
+    def press(self, t):
+        self.pending = t
+
+    def effect(self):
+        if self.pending is not None:
+            self.effects.append(self.pending)
+            self.pending = None
+
+    def presented(self, t):
+        for t0 in self.effects:
+            self.record(t - t0)
+        self.effects.clear()
+
+    def record(self, seconds):
+        ms = seconds * 1000
+        self.samples.append(ms)
+        self.counts[min(int(ms // BUCKET_MS), BUCKETS)] += 1
+
+    def stats(self):
+        """count (all time), mean / p50 / p95 / max over the recent samples, in ms."""
+        n = len(self.samples)
+        if n == 0:
+            return {"count": 0, "mean_ms": 0.0, "p50_ms": 0.0, "p95_ms": 0.0, "max_ms": 0.0}
+        ordered = sorted(self.samples)
+        return {
+            "count": sum(self.counts),
+            "mean_ms": sum(ordered) / n,
+            "p50_ms": ordered[n // 2],
+            "p95_ms": ordered[min(n - 1, int(n * 0.95))],
+            "max_ms": ordered[-1],
+        }
+
+    def histogram(self, width=40):
+        """Text histogram of every sample so far, one line per non-empty bucket."""
+        peak = max(self.counts) or 1
+        lines = []
+        for i, count in enumerate(self.counts):
+            if not count:
+                continue
+            if i == BUCKETS:
+                label = f">={BUCKETS * BUCKET_MS} ms"
+            else:
+                label = f"{i * BUCKET_MS}-{(i + 1) * BUCKET_MS} ms"
+            bar = "#" * max(1, round(width * count / peak))
+            lines.append(f"{label:>10} {count:>6} {bar}")
+        return lines
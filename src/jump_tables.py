@@ -0,0 +1,252 @@
+# jump_tables.py
+
+import numpy as np
+import src.config as c
+
+# One row per arc: a launch speed (row 0 = walking off an edge, then every
+# reachable charge value) or a double-jump branch of such an arc.
+ARC_DTYPE = np.dtype([
+    ("launch_speed", np.float32),
+    ("apex", np.float32),        # highest point above the launch height (px)
+    ("apex_frame", np.int32),
+    ("air_frames", np.int32),    # frames until back at (or below) launch height
+    ("distance", np.float32),    # air_frames * SPEED
+])
+
+def charge_values():
+    """
+    Every jump_charge a charged jump can be released with:
+    MIN_JUMP_STRENGTH, growing by CHARGE_RATE per held frame, capped at MAX.
+    """
+    steps = int(np.ceil((c.MAX_JUMP_STRENGTH - c.MIN_JUMP_STRENGTH) / c.CHARGE_RATE))
+    charges = c.MIN_JUMP_STRENGTH + c.CHARGE_RATE * np.arange(steps + 1, dtype=np.float64)
+    return np.minimum(charges, c.MAX_JUMP_STRENGTH)
+
+def arc_heights(launch_speed, frames):
+    """
+    Height above the launch point after 0..frames-1 frames, exactly as
+    Player.move integrates it (velocity first, then position).
+    """
+    k = np.arange(frames, dtype=np.float64)
+    return launch_speed * k - c.GRAVITY * k * (k + 1) / 2
+
+def arc_velocities(launch_speed, frames):
+    """Player.vel_y after 0..frames-1 frames (positive = falling)."""
+    k = np.arange(frames, dtype=np.float64)
+    return c.GRAVITY * k - launch_speed
+
+def _summarize(heights, out):
+    """Fills ARC_DTYPE fields (except launch_speed) for a stack of height rows."""
+    out["apex"] = heights.max(axis=-1)
+    out["apex_frame"] = heights.argmax(axis=-1)
+    below = heights[..., 1:] <= 0
+    air = below.argmax(axis=-1) + 1
+    air[~below.any(axis=-1)] = heights.shape[-1]
+    out["air_frames"] = air
+    out["distance"] = air * c.SPEED
+
+class JumpTable:
+    """
+    Precomputed trajectories for every launch the player can make.
+
+    heights[r, k]        height above launch after k frames of arc r
+    arcs[r]              ARC_DTYPE summary of arc r
+    double_jump[r, t]    ARC_DTYPE summary when the double jump from
+                         handle_instant_jump fires after t airborne frames
+                         (t = 0: no double jump, same as arcs[r])
+    landing[r, i]        frame at which arc r lands on a platform whose top is
+                         dy_values[i] px above the launch height (0 = never)
+    reach_min/max[i]     fewest / most airborne frames any arc or double-jump
+                         branch needs to land dy_values[i] px higher (0 = never)
+    drop_reach_min/max   the same, limited to falling without a jump (walking
+                         off an edge, or the spawn drop) plus its double jump
+
+    Horizontal distance is always frames * SPEED, since the world scrolls at a
+    constant speed while the player stays at default_x.
+    """
+
+    def __init__(self):
+        charges = charge_values()
+        self.launch_speeds = np.concatenate(([0.0], charges))
+        self.min_row = 1  # MIN_JUMP_STRENGTH: instant jumps and double jumps
+
+        # Long enough for the strongest jump, double-jumped at its apex, to
+        # fall a full screen below the launch height
+        top = self.launch_speeds[-1]
+        apex_frame = int(top // c.GRAVITY)
+        apex = arc_heights(top, apex_frame + 1)[-1]
+        fall = 2
+        while arc_heights(c.MIN_JUMP_STRENGTH, fall)[-1] > -(apex + c.HEIGHT):
+            fall += 1
+        frames = apex_frame + fall
+        self.frames = frames
+
+        self.heights = np.stack([arc_heights(v, frames) for v in self.launch_speeds])
+        self.velocities = np.stack([arc_velocities(v, frames) for v in self.launch_speeds])
+
+        self.arcs = np.zeros(len(self.launch_speeds), dtype=ARC_DTYPE)
+        self.arcs["launch_speed"] = self.launch_speeds
+        _summarize(self.heights, self.arcs)
+
+        self._build_double_jumps()
+        self._build_landings()
+
+    # -----------------------------------------------------------------
+    # DOUBLE-JUMP BRANCHES
+    # -----------------------------------------------------------------
+    def _build_double_jumps(self):
+        rows, frames = self.heights.shape
+        k = np.arange(frames)
+        t = np.arange(frames)
+        # Frames after the double jump fired (t = 0 means it never fires)
+        since = k[None, :] - t[:, None]
+        after = (since > 0) & (t[:, None] > 0)
+        idx = np.clip(since, 0, frames - 1)
+        dj_h = self.heights[self.min_row][idx]
+        dj_v = self.velocities[self.min_row][idx]
+
+        self.dj_heights = np.where(
+            after[None, :, :],
+            self.heights[:, t][:, :, None] + dj_h[None, :, :],
+            self.heights[:, None, :]
+        )
+        self.dj_velocities = np.where(after[None, :, :], dj_v[None, :, :],
+                                      self.velocities[:, None, :])
+
+        self.double_jump = np.zeros((rows, frames), dtype=ARC_DTYPE)
+        self.double_jump["launch_speed"] = self.launch_speeds[:, None]
+        _summarize(self.dj_heights, self.double_jump)
+
+    # -----------------------------------------------------------------
+    # LANDING TABLES
+    # -----------------------------------------------------------------
+    def _build_landings(self):
+        player_h = int(c.SQUARE_WIDTH_FRAC * c.WIDTH)
+        platform_h = int(c.PLATFORM_HEIGHT_FRAC * c.HEIGHT)
+        # Player.move lands when the rects overlap: dy - window < h < dy
+        self.window = player_h + platform_h
+
+        self.dy_min = -c.HEIGHT
+        # The overlap test snaps the player up onto platforms slightly above the apex
+        self.dy_max = int(np.ceil(self.dj_heights.max())) + self.window
+        self.dy_values = np.arange(self.dy_min, self.dy_max + 1)
+        n_dy = len(self.dy_values)
+
+        rows, frames = self.heights.shape
+        self.landing = np.zeros((rows, n_dy), dtype=np.int16)
+        for k in range(1, frames):
+            lo, hi = self._landing_intervals(self.heights[:, k], self.heights[:, k - 1],
+                                             self.velocities[:, k], self.velocities[:, k - 1])
+            for r in np.nonzero(hi >= lo)[0]:
+                seg = self.landing[r, lo[r]:hi[r] + 1]
+                seg[seg == 0] = k
+
+        # Envelopes over plain arcs and every double-jump branch. For a branch
+        # fired after t frames, dy values the plain arc already landed on by
+        # frame t are excluded (the player would be standing, not jumping).
+        h = self.dj_heights.reshape(-1, frames)
+        v = self.dj_velocities.reshape(-1, frames)
+        fired = np.tile(np.arange(frames), rows)
+        base = np.repeat(np.arange(rows), frames)
+        base_first_desc = np.argmax(self.velocities > 0, axis=1)[base]
+        excl_lo = np.floor(self.heights[base, fired]).astype(np.int64) + 1 - self.dy_min
+        excl_hi = (np.ceil(self.heights[base, base_first_desc] + self.window).astype(np.int64)
+                   - 1 - self.dy_min)
+        excl_hi[fired < base_first_desc] = -1
+
+        def covered(k, lo, hi):
+            diff = np.zeros(n_dy + 1, dtype=np.int32)
+            for a, b in ((lo, np.minimum(hi, excl_lo - 1)),
+                         (np.maximum(lo, excl_hi + 1), hi)):
+                # Exclusion only applies after the branch has fired
+                a = np.where(fired < k, a, lo)
+                b = np.where(fired < k, b, hi)
+                ok = b >= a
+                np.add.at(diff, a[ok], 1)
+                np.add.at(diff, b[ok] + 1, -1)
+            return np.cumsum(diff[:-1]) > 0
+
+        self.reach_min = np.zeros(n_dy, dtype=np.int16)
+        self.reach_max = np.zeros(n_dy, dtype=np.int16)
+        self.drop_reach_min = np.zeros(n_dy, dtype=np.int16)
+        self.drop_reach_max = np.zeros(n_dy, dtype=np.int16)
+        drop = base == 0
+        for k in range(1, frames):
+            lo, hi = self._landing_intervals(h[:, k], h[:, k - 1], v[:, k], v[:, k - 1])
+            hit = covered(k, lo, hi)
+            self.reach_min[hit & (self.reach_min == 0)] = k
+            self.reach_max[hit] = k
+            hit = covered(k, np.where(drop, lo, n_dy), np.where(drop, hi, -1))
+            self.drop_reach_min[hit & (self.drop_reach_min == 0)] = k
+            self.drop_reach_max[hit] = k
+
+    def _landing_intervals(self, h, h_prev, v, v_prev):
+        """
+        Index ranges (inclusive) into dy_values of platforms first landed on
+        at this frame. Empty where hi < lo.
+        """
+        lo = np.floor(h).astype(np.int64) + 1
+        hi = np.ceil(h + self.window).astype(np.int64) - 1
+        # Still falling from the previous frame: anything above h_prev was
+        # already landed on (or tunnelled through) earlier.
+        chained = v_prev > 0
+        hi = np.where(chained, np.minimum(hi, np.floor(h_prev).astype(np.int64)), hi)
+        hi = np.where(v > 0, hi, lo - 1)
+        lo = np.clip(lo - self.dy_min, 0, len(self.dy_values))
+        hi = np.clip(hi - self.dy_min, -1, len(self.dy_values) - 1)
+        return lo, hi
+
+    # -----------------------------------------------------------------
+    # O(1) LOOKUPS
+    # -----------------------------------------------------------------
+    def row(self, charge):
+        """Row index for a released jump_charge (0 = walking off an edge)."""
+        if charge <= 0:
+            return 0
+        r = int(round((charge - c.MIN_JUMP_STRENGTH) / c.CHARGE_RATE)) + self.min_row
+        return max(self.min_row, min(r, len(self.launch_speeds) - 1))
+
+    def dy_index(self, dy):
+        """Index into dy_values, or None when no arc can land that high or low."""
+        i = int(round(dy)) - self.dy_min
+        if i < 0 or i >= len(self.dy_values):
+            return None
+        return i
+
+    def height(self, charge, frame):
+        return self.heights[self.row(charge), min(frame, self.frames - 1)]
+
+    def landing_frame(self, charge, dy):
+        """Frames until a jump with this charge lands dy px higher (0 = never)."""
+        i = self.dy_index(dy)
+        if i is None:
+            return 0
+        return int(self.landing[self.row(charge), i])
+
+    def reach(self, dy):
+        """(min_frames, max_frames) any jump needs to land dy px higher; (0, 0) if impossible."""
+        i = self.dy_index(dy)
+        if i is None:
+            return 0, 0
+        return int(self.reach_min[i]), int(self.reach_max[i])
+
+    def drop_reach(self, dy):
+        """Like reach(), for a fall that starts without a jump."""
+        i = self.dy_index(dy)
+        if i is None:
+            return 0, 0
+        return int(self.drop_reach_min[i]), int(self.drop_reach_max[i])
+
+    def reach_distance(self, dy):
+        """(min_px, max_px) horizontal distance covered while landing dy px higher."""
+        lo, hi = self.reach(dy)
+        return lo * c.SPEED, hi * c.SPEED
+
+_TABLE = None
+
+def get_jump_table():
+    """Builds the tables on first use and shares them afterwards."""
+    global _TABLE
+    if _TABLE is None:
+        _TABLE = JumpTable()
+    return _TABLE
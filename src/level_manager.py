@@ -4,44 +4,84 @@ import pygame
 import random
 
 import src.config as c
-import src.levels_config as lvl
 
-from src.game_platform import Platform
-from src.obstacle import Obstacle
-from src.coin import StarCoin
+from src.levelpack import get_pack
+from src.player import landing_rects_for
+from src.game_platform import platform_pool
+from src.obstacle import obstacle_pool
+from src.coin import StarCoin, coin_pool
+from src.spatial_hash import SpatialHash
+
+def spawn_settings(level_data):
+    """Spawn parameters from a LEVELS-style dict, with defaults filled in."""
+    return {
+        "safe_gap_min": level_data.get("safe_gap_min", 50),
+        "safe_gap_max": level_data.get("safe_gap_max", 140),
+        "vertical_offset_min": level_data.get("vertical_offset_min", -10),
+        "vertical_offset_max": level_data.get("vertical_offset_max", 10),
+        "min_py": level_data.get("min_platform_y", 550),
+        "max_py": level_data.get("max_platform_y", 600),
+        "obstacle_chance": level_data.get("obstacle_spawn_chance", 0.3),
+        "obstacle_max": level_data.get("obstacle_max_per_platform", 1),
+        "coin_chance": level_data.get("coin_chance", 0.3),
+    }
 
 class LevelManager:
-    def __init__(self, pokemon_images, coin_image):
+    def __init__(self, pokemon_images, coin_image, level_data=None, level_index=0):
         self.pokemon_images = pokemon_images
         self.coin_image = coin_image
+        StarCoin.set_image(coin_image)
         
         self.platforms = []
         self.obstacles = []
         self.star_coins = []
 
+        # Obstacles and coins by world position (x + scroll), for collision
+        # and placement checks; cells as wide as a platform
+        cell = int(c.PLATFORM_WIDTH_FRAC * c.WIDTH)
+        self.obstacle_grid = SpatialHash(cell)
+        self.coin_grid = SpatialHash(cell)
+        self.scroll = 0.0   # px the layout has moved left since it was generated
+        self.landing_rects = []   # see update_landing_rects
+
         self.coins_spawned = 0
-        # Use the CURRENT_LEVEL from levels_config
-        self.level_index = lvl.CURRENT_LEVEL
+        self.next_coin_id = 0   # see add_coin
+        self.endless = False
+        self.level_index = level_index
 
         # Generate the level data
-        self.generate_seeded_level(self.level_index)
+        self.generate_seeded_level(self.level_index, level_data)
 
-    def generate_seeded_level(self, level_index):
+    def generate_seeded_level(self, level_index, level_data=None):
         """
-        Generates platforms, obstacles, and coins based on random seed + level parameters.
+        Generates platforms, obstacles, and coins based on random seed + level parameters,
+        or places them as listed in the level's explicit "layout" (see src/levelpack.py).
+        The level comes from the session's level pack; tools pass their own
+        level_data dict (same keys as LEVELS) to skip the lookup.
+        The previous layout's entities go back to their pools and are reused.
         """
-        self.platforms.clear()
-        self.obstacles.clear()
-        self.star_coins.clear()
+        self.release()
         self.coins_spawned = 0
 
-        # Validate index
-        if level_index < 0 or level_index >= len(lvl.LEVELS):
-            print(f"Warning: level_index {level_index} out of range. Defaulting to 0.")
-            level_index = 0
+        if level_data is None:
+            pack = get_pack()
+            # Validate index
+            if level_index < 0 or level_index >= len(pack):
+                print(f"Warning: level_index {level_index} out of range. Defaulting to 0.")
+                level_index = 0
 
-        level_data = lvl.LEVELS[level_index]
-        print(f"Generating level: {level_data.get('name', 'Unknown')}")
+            level_data = pack.level(level_index)
+            print(f"Generating level: {level_data.get('name', 'Unknown')}")
+        self.level_name = level_data.get("name", "Unknown")
+
+        if level_data.get("endless"):
+            self.start_endless(level_data)
+            return
+        self.endless = False
+
+        if "layout" in level_data:
+            self.place_layout(level_data["layout"])
+            return
 
         # 1) Seed
         seed_val = level_data.get("seed", 0)
@@ -51,77 +91,178 @@ class LevelManager:
         platform_count = int(c.LEVEL_DURATION)
 
         # 3) Retrieve spawn parameters
-        safe_gap_min = level_data.get("safe_gap_min", 50)
-        safe_gap_max = level_data.get("safe_gap_max", 140)
-        vertical_offset_min = level_data.get("vertical_offset_min", -10)
-        vertical_offset_max = level_data.get("vertical_offset_max", 10)
-        min_py = level_data.get("min_platform_y", 550)
-        max_py = level_data.get("max_platform_y", 600)
-
-        obstacle_chance = level_data.get("obstacle_spawn_chance", 0.3)
-        obstacle_max = level_data.get("obstacle_max_per_platform", 1)
-        coin_chance = level_data.get("coin_chance", 0.3)
+        self.spawn = spawn_settings(level_data)
 
         # 4) First platform
-        first_y = random.randint(min_py, max_py)
-        first_platform = Platform(100, first_y)
-        self.platforms.append(first_platform)
+        self.add_first_platform()
 
         # 5) Generate more platforms
         for _ in range(platform_count - 1):
-            last_plat = self.platforms[-1]
-            gap = random.randint(safe_gap_min, safe_gap_max)
-            new_x = last_plat.x + last_plat.width + gap
-            offset = random.randint(vertical_offset_min, vertical_offset_max)
-            new_y = last_plat.y + offset
-            new_y = max(min_py, min(new_y, max_py))
-
-            p = Platform(new_x, new_y)
-            self.platforms.append(p)
-
-            # Maybe spawn obstacles
-            if random.random() < obstacle_chance:
-                num_obs = random.randint(1, obstacle_max)  
-                for _ in range(num_obs):
-                    obs = Obstacle(0, 0, self.pokemon_images)
-                    obs.x = p.x + random.randint(0, max(0, p.width - obs.width))
-                    obs.y = p.y - obs.height
-                    self.obstacles.append(obs)
-
-            # Maybe spawn coin
-            if random.random() < coin_chance:
-                c_obj = StarCoin(0, 0, self.coin_image)
-                attempts = 5
-                placed = False
-                while attempts > 0 and not placed:
-                    coin_x = p.x + random.randint(0, max(0, p.width - c_obj.width))
-                    coin_y = p.y - c_obj.height - 10
-                    coin_rect = pygame.Rect(coin_x, coin_y, c_obj.width, c_obj.height)
-
-                    overlap = False
-                    # Check obstacles on the same platform to avoid overlap
-                    for obs in self.obstacles:
-                        if (obs.x >= p.x and
-                            obs.x <= (p.x + p.width)):
-                            obs_rect = pygame.Rect(obs.x, obs.y, obs.width, obs.height)
-                            if coin_rect.colliderect(obs_rect):
-                                overlap = True
-                                break
-
-                    if not overlap:
-                        c_obj.x = coin_x
-                        c_obj.y = coin_y
-                        self.star_coins.append(c_obj)
-                        self.coins_spawned += 1
-                        placed = True
-                    attempts -= 1
+            self.add_next_platform()
+
+    def place_layout(self, layout):
+        """Places the platforms, obstacles and coins of an explicit layout."""
+        for x, y in layout["platforms"]:
+            self.platforms.append(platform_pool.acquire(x, y))
+        for x, y, sprite in layout["obstacles"]:
+            self.add_obstacle(obstacle_pool.acquire(x, y, self.pokemon_images,
+                                                    self.pokemon_images[sprite]))
+        for x, y in layout["coins"]:
+            self.add_coin(coin_pool.acquire(x, y))
+        self.coins_spawned = len(layout["coins"])
+
+    def add_first_platform(self):
+        first_y = random.randint(self.spawn["min_py"], self.spawn["max_py"])
+        first_platform = platform_pool.acquire(100, first_y)
+        self.platforms.append(first_platform)
+
+    def add_next_platform(self):
+        """Places one platform after the last one, with its obstacles and coin."""
+        spawn = self.spawn
+        last_plat = self.platforms[-1]
+        gap = random.randint(spawn["safe_gap_min"], spawn["safe_gap_max"])
+        new_x = last_plat.x + last_plat.width + gap
+        offset = random.randint(spawn["vertical_offset_min"], spawn["vertical_offset_max"])
+        new_y = last_plat.y + offset
+        new_y = max(spawn["min_py"], min(new_y, spawn["max_py"]))
+
+        p = platform_pool.acquire(new_x, new_y)
+        self.platforms.append(p)
+
+        # Maybe spawn obstacles
+        if random.random() < spawn["obstacle_chance"]:
+            num_obs = random.randint(1, spawn["obstacle_max"])
+            for _ in range(num_obs):
+                obs = obstacle_pool.acquire(0, 0, self.pokemon_images)
+                obs.x = p.x + random.randint(0, max(0, p.width - obs.width))
+                obs.y = p.y - obs.height
+                self.add_obstacle(obs)
+
+        # Maybe spawn coin
+        if random.random() < spawn["coin_chance"]:
+            c_obj = coin_pool.acquire(0, 0)
+            attempts = 5
+            placed = False
+            while attempts > 0 and not placed:
+                coin_x = p.x + random.randint(0, max(0, p.width - c_obj.width))
+                coin_y = p.y - c_obj.height - 10
+                coin_rect = pygame.Rect(coin_x, coin_y, c_obj.width, c_obj.height)
+
+                overlap = False
+                # Check obstacles on the same platform to avoid overlap
+                for obs in self.obstacles_near(coin_rect):
+                    if (obs.x >= p.x and
+                        obs.x <= (p.x + p.width)):
+                        obs_rect = pygame.Rect(obs.x, obs.y, obs.width, obs.height)
+                        if coin_rect.colliderect(obs_rect):
+                            overlap = True
+                            break
+
+                if not overlap:
+                    c_obj.x = coin_x
+                    c_obj.y = coin_y
+                    self.add_coin(c_obj)
+                    self.coins_spawned += 1
+                    placed = True
+                attempts -= 1
+            if not placed:
+                coin_pool.release(c_obj)
+
+    # -----------------------------------------------------------------
+    # ENDLESS MODE
+    # -----------------------------------------------------------------
+    def start_endless(self, level_data):
+        """
+        Endless mode: instead of the whole level up front, platforms are
+        generated in chunks of ENDLESS_CHUNK_PLATFORMS just ahead of the screen
+        (stream_chunks) while update_* drops everything that scrolled off.
+        Each chunk reseeds from (seed, chunk index), so a seed always
+        produces the same run no matter how long it lasts.
+        """
+        self.endless = True
+        self.endless_seed = level_data.get("seed", 0)
+        self.chunk_index = 0
+        self.spawn = spawn_settings(level_data)
+
+        random.seed(f"{self.endless_seed}:{self.chunk_index}")
+        self.add_first_platform()
+        self.stream_chunks()
+
+    def stream_chunks(self):
+        """Generates chunks until the level reaches ENDLESS_LOOKAHEAD px past the screen."""
+        if not self.endless:
+            return
+        while True:
+            last = self.platforms[-1]
+            if last.x + last.width >= c.WIDTH + c.ENDLESS_LOOKAHEAD:
+                break
+            self.chunk_index += 1
+            random.seed(f"{self.endless_seed}:{self.chunk_index}")
+            for _ in range(c.ENDLESS_CHUNK_PLATFORMS):
+                self.add_next_platform()
+
+    def release(self):
+        """Returns every platform, obstacle and coin to its pool and empties the level."""
+        platform_pool.release_all(self.platforms)
+        obstacle_pool.release_all(self.obstacles)
+        coin_pool.release_all(self.star_coins)
+        self.platforms.clear()
+        self.obstacles.clear()
+        self.star_coins.clear()
+        self.obstacle_grid.clear()
+        self.coin_grid.clear()
+        self.scroll = 0.0
+        self.landing_rects = []
+        self.next_coin_id = 0
+
+    # -----------------------------------------------------------------
+    # SPATIAL QUERIES
+    # -----------------------------------------------------------------
+    # Candidates come from the grid cells around the rect (widened by a
+    # pixel each way, as pygame.Rect truncates the float positions); the
+    # callers then test them exactly as a scan of the whole list would.
+    def add_obstacle(self, obs):
+        self.obstacles.append(obs)
+        self.obstacle_grid.insert(obs, obs.x + self.scroll, obs.y, obs.width, obs.height)
+
+    def add_coin(self, coin):
+        # Coins are numbered in the order the level places them, which its
+        # seed (or layout) fixes, so spectators can tell which were collected
+        coin.id = self.next_coin_id
+        self.next_coin_id += 1
+        self.star_coins.append(coin)
+        self.coin_grid.insert(coin, coin.x + self.scroll, coin.y, coin.width, coin.height)
+
+    def obstacles_near(self, rect):
+        return self.obstacle_grid.query(rect.x + self.scroll - 1, rect.y - 1,
+                                        rect.width + 2, rect.height + 2)
+
+    def coins_near(self, rect):
+        return self.coin_grid.query(rect.x + self.scroll - 1, rect.y - 1,
+                                    rect.width + 2, rect.height + 2)
+
+    def coin_by_id(self, coin_id):
+        """The coin numbered coin_id if it is still in the level, else None."""
+        for coin in self.star_coins:
+            if coin.id == coin_id:
+                return coin
+        return None
+
+    def remove_coin(self, coin):
+        """Takes a collected coin out of the level (back to its pool)."""
+        self.star_coins.remove(coin)
+        self.coin_grid.remove(coin)
+        coin_pool.release(coin)
 
     def update_platforms(self):
         """Move each platform left and remove if off-screen."""
+        # Everything moves by c.SPEED each step; world positions stay put
+        self.scroll += c.SPEED
         for p in self.platforms[:]:
             p.move()
             if p.off_screen():
                 self.platforms.remove(p)
+                platform_pool.release(p)
 
     def update_obstacles(self):
         """Move each obstacle left and remove if off-screen."""
@@ -129,19 +270,45 @@ class LevelManager:
             obs.move()
             if obs.off_screen():
                 self.obstacles.remove(obs)
+                self.obstacle_grid.remove(obs)
+                obstacle_pool.release(obs)
 
     def update_coins(self):
         """Move each coin left and remove if off-screen."""
         for ccoin in self.star_coins[:]:
             ccoin.x -= c.SPEED
             if (ccoin.x + ccoin.width) < 0:
-                self.star_coins.remove(ccoin)
+                self.remove_coin(ccoin)
+
+    def update_landing_rects(self):
+        """
+        The rects players land on (Player.move), rebuilt once per step after
+        the platforms move and shared by every player in versus mode.
+        """
+        self.landing_rects = landing_rects_for(self.platforms)
+
+    def draw_list(self, offset_x=0, coin_image=None):
+        """
+        (surface, position) pairs for every on-screen platform, obstacle and
+        coin, in drawing order, to submit in one Surface.blits call. Levels
+        are generated far past the right edge, so culling skips most of them.
+        Obstacles and coins are (atlas sheet, position, sprite rect) items;
+        coin_image, if given, is drawn for every coin (the animation frame).
+        """
+        right = c.WIDTH - offset_x
+        batch = [(p.image, (p.x + offset_x, p.y)) for p in self.platforms if p.x < right]
+        batch += [(o.image.sheet, (o.x + offset_x, o.y), o.image.rect)
+                  for o in self.obstacles if o.x < right]
+        coin_image = coin_image or StarCoin.image
+        sheet, rect = coin_image.sheet, coin_image.rect
+        batch += [(sheet, (s.x + offset_x, s.y), rect) for s in self.star_coins if s.x < right]
+        return batch
 
     def check_obstacle_collisions(self, player_rect):
         """
         Returns True if the player rect intersects any obstacle (with some collision tolerance).
         """
-        for obstacle in self.obstacles:
+        for obstacle in self.obstacles_near(player_rect):
             obs_rect = pygame.Rect(obstacle.x, obstacle.y, obstacle.width, obstacle.height)
             inflated = obs_rect.inflate(-c.COLLISION_TOLERANCE*2, -c.COLLISION_TOLERANCE*2)
             if player_rect.colliderect(inflated):
@@ -0,0 +1,270 @@
+# levelpack.py
+#
+# Level packs: a directory of level files behind one small index, so a
+# cabinet can ship hundreds of levels and only read the one being played.
+#
+#   levels/<pack>/pack.json     the index, the only file read at startup:
+#       {"format": 1, "name": "...",
+#        "levels": [{"name": "Level 1", "file": "001.json"}, ...]}
+#   levels/<pack>/001.json      one level's parameters (LEVELS keys); a
+#                               .toml file works too on Python 3.11+
+#   levels/<pack>/001.layout    optional explicit layout (see read_layout),
+#                               named by the level's "layout" key
+#
+# Every level file is checked against LEVEL_SCHEMA when it is first loaded.
+#
+#   python main.py --level-pack levels/mypack
+#   python -m src.levelpack export levels/mypack [--layouts]
+#   python -m src.levelpack check levels/mypack
+
+import argparse
+import json
+import os
+import struct
+
+try:
+    import tomllib   # Python 3.11+
+except ImportError:
+    tomllib = None
+
+import src.config as c
+import src.levels_config as lvl
+
+FORMAT = 1
+INDEX_FILE = "pack.json"
+
+class LevelPackError(ValueError):
+    """A pack, level file or layout that does not match the format."""
+
+# key -> (accepted types, lowest value); every key is optional
+LEVEL_SCHEMA = {
+    "name": ((str,), None),
+    "seed": ((int, str), None),
+    "safe_gap_min": ((int,), 0),
+    "safe_gap_max": ((int,), 0),
+    "vertical_offset_min": ((int,), None),
+    "vertical_offset_max": ((int,), None),
+    "min_platform_y": ((int,), 0),
+    "max_platform_y": ((int,), 0),
+    "obstacle_spawn_chance": ((int, float), 0),
+    "obstacle_max_per_platform": ((int,), 1),
+    "coin_chance": ((int, float), 0),
+    "layout": ((str,), None),
+}
+CHANCES = ("obstacle_spawn_chance", "coin_chance")
+RANGES = [("safe_gap_min", "safe_gap_max"),
+          ("vertical_offset_min", "vertical_offset_max"),
+          ("min_platform_y", "max_platform_y")]
+
+def validate_level(params, where="level"):
+    """Raises LevelPackError unless params is a valid level parameter dict."""
+    if not isinstance(params, dict):
+        raise LevelPackError(f"{where}: expected a table of parameters")
+    for key, value in params.items():
+        if key not in LEVEL_SCHEMA:
+            raise LevelPackError(f"{where}: unknown key {key!r}")
+        types, lowest = LEVEL_SCHEMA[key]
+        # bool is an int to isinstance, never a valid level value
+        if isinstance(value, bool) or not isinstance(value, types):
+            names = " or ".join(t.__name__ for t in types)
+            raise LevelPackError(f"{where}: {key} must be {names}, not {value!r}")
+        if lowest is not None and value < lowest:
+            raise LevelPackError(f"{where}: {key} must be at least {lowest}, not {value!r}")
+    for key in CHANCES:
+        if params.get(key, 0) > 1:
+            raise LevelPackError(f"{where}: {key} is a probability, not {params[key]!r}")
+    for low, high in RANGES:
+        if low in params and high in params and params[low] > params[high]:
+            raise LevelPackError(f"{where}: {low} is above {high}")
+
+# ---------------------------------------------------------------------
+# EXPLICIT LAYOUTS
+# ---------------------------------------------------------------------
+# Little-endian: a header, then (x, y) of each platform, (x, y, Pokemon
+# index) of each obstacle and (x, y) of each coin, top-left corners in px.
+LAYOUT_MAGIC = b"GPDL"
+LAYOUT_HEADER = struct.Struct("<4sHxxIII")
+POINT = struct.Struct("<ff")
+OBSTACLE = struct.Struct("<ffB3x")
+
+def write_layout(path, platforms, obstacles, coins):
+    """platforms and coins: [(x, y)]; obstacles: [(x, y, pokemon index)]."""
+    with open(path, "wb") as f:
+        f.write(LAYOUT_HEADER.pack(LAYOUT_MAGIC, FORMAT, len(platforms), len(obstacles), len(coins)))
+        f.writelines(POINT.pack(x, y) for x, y in platforms)
+        f.writelines(OBSTACLE.pack(x, y, i) for x, y, i in obstacles)
+        f.writelines(POINT.pack(x, y) for x, y in coins)
+
+def read_layout(path):
+    """{"platforms": [(x, y)], "obstacles": [(x, y, pokemon index)], "coins": [(x, y)]}."""
+    with open(path, "rb") as f:
+        data = f.read()
+    if len(data) < LAYOUT_HEADER.size:
+        raise LevelPackError(f"{path}: too short for a layout")
+    magic, version, n_plat, n_obs, n_coins = LAYOUT_HEADER.unpack_from(data)
+    if magic != LAYOUT_MAGIC or version != FORMAT:
+        raise LevelPackError(f"{path}: not a version {FORMAT} layout")
+    sizes = [n_plat * POINT.size, n_obs * OBSTACLE.size, n_coins * POINT.size]
+    if len(data) != LAYOUT_HEADER.size + sum(sizes):
+        raise LevelPackError(f"{path}: size does not match its counts")
+    if n_plat == 0:
+        raise LevelPackError(f"{path}: a layout needs at least one platform")
+
+    pos = LAYOUT_HEADER.size
+    sections = []
+    for record, size in zip((POINT, OBSTACLE, POINT), sizes):
+        sections.append(list(record.iter_unpack(data[pos:pos + size])))
+        pos += size
+    platforms, obstacles, coins = sections
+    from src.assets import POKEMON
+    if any(i >= len(POKEMON) for _, _, i in obstacles):
+        raise LevelPackError(f"{path}: obstacle sprite index out of range")
+    return {"platforms": platforms, "obstacles": obstacles, "coins": coins}
+
+# ---------------------------------------------------------------------
+# PACKS
+# ---------------------------------------------------------------------
+class LevelPack:
+    """
+    A pack directory. Only the index is read on creation; level(i) reads,
+    validates and caches one level file (and its layout) on first use.
+    """
+
+    def __init__(self, path):
+        self.path = path
+        index_path = os.path.join(path, INDEX_FILE)
+        try:
+            with open(index_path, "r", encoding="utf-8") as f:
+                index = json.load(f)
+        except (OSError, json.JSONDecodeError) as e:
+            raise LevelPackError(f"{index_path}: {e}") from e
+        if not isinstance(index, dict) or index.get("format") != FORMAT:
+            raise LevelPackError(f"{index_path}: not a format {FORMAT} level pack index")
+        entries = index.get("levels")
+        if not isinstance(entries, list) or not entries:
+            raise LevelPackError(f"{index_path}: 'levels' must be a non-empty list")
+        for i, entry in enumerate(entries):
+            if not isinstance(entry, dict) or not isinstance(entry.get("file"), str):
+                raise LevelPackError(f"{index_path}: level {i + 1} needs a 'file'")
+            if entry["file"].endswith(".toml") and tomllib is None:
+                raise LevelPackError(f"{index_path}: level {i + 1}: TOML level files need Python 3.11+")
+        self.name = index.get("name", os.path.basename(os.path.normpath(path)))
+        self.entries = entries
+        self._levels = {}
+
+    def __len__(self):
+        return len(self.entries)
+
+    def name_of(self, index):
+        """A level's name from the index alone."""
+        return self.entries[index].get("name", f"Level {index + 1}")
+
+    def level(self, index):
+        params = self._levels.get(index)
+        if params is None:
+            params = self._levels[index] = self._load(index)
+        return params
+
+    def _load(self, index):
+        entry = self.entries[index]
+        where = os.path.join(self.path, entry["file"])
+        try:
+            if where.endswith(".toml"):
+                with open(where, "rb") as f:
+                    params = tomllib.load(f)
+            else:
+                with open(where, "r", encoding="utf-8") as f:
+                    params = json.load(f)
+        except (OSError, ValueError) as e:
+            raise LevelPackError(f"{where}: {e}") from e
+        validate_level(params, where)
+
+        params = dict(params)
+        params.setdefault("name", self.name_of(index))
+        if "layout" in params:
+            params["layout"] = read_layout(os.path.join(self.path, params["layout"]))
+        return params
+
+class BuiltinPack:
+    """The levels in src/levels_config.py, when no pack directory is configured."""
+
+    name = "Built-in"
+
+    def __len__(self):
+        return len(lvl.LEVELS)
+
+    def name_of(self, index):
+        return lvl.LEVELS[index].get("name", f"Level {index + 1}")
+
+    def level(self, index):
+        return lvl.LEVELS[index]
+
+_pack = None
+
+def get_pack():
+    """The session's levels: the pack at c.LEVEL_PACK, or the built-in ones."""
+    global _pack
+    if _pack is None:
+        _pack = LevelPack(c.LEVEL_PACK) if c.LEVEL_PACK else BuiltinPack()
+    return _pack
+
+# ---------------------------------------------------------------------
+# COMMAND LINE
+# ---------------------------------------------------------------------
+def export(path, layouts=False):
+    """Writes the built-in levels as a pack, with their generated layouts if asked."""
+    os.makedirs(path, exist_ok=True)
+    entries = []
+    for i, params in enumerate(lvl.LEVELS):
+        params = dict(params)
+        stem = f"{i + 1:03d}"
+        if layouts:
+            params["layout"] = f"{stem}.layout"
+            _write_generated_layout(os.path.join(path, params["layout"]), params)
+        with open(os.path.join(path, f"{stem}.json"), "w", encoding="utf-8") as f:
+            json.dump(params, f, indent=2)
+        entries.append({"name": params.get("name", f"Level {i + 1}"), "file": f"{stem}.json"})
+    with open(os.path.join(path, INDEX_FILE), "w", encoding="utf-8") as f:
+        json.dump({"format": FORMAT, "name": os.path.basename(os.path.normpath(path)),
+                   "levels": entries}, f, indent=2)
+    return len(entries)
+
+def _write_generated_layout(path, params):
+    from src.assets import load_images
+    from src.level_manager import LevelManager
+    images = load_images(convert=False)
+    lm = LevelManager(images['pokemon_images'], images['coin_image'],
+                      level_data={k: v for k, v in params.items() if k != "layout"})
+    sprites = images['pokemon_images']
+    write_layout(path,
+                 [(p.x, p.y) for p in lm.platforms],
+                 [(o.x, o.y, sprites.index(o.image)) for o in lm.obstacles],
+                 [(s.x, s.y) for s in lm.star_coins])
+    lm.release()
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Create and check level packs.")
+    commands = parser.add_subparsers(dest="command", required=True)
+    export_cmd = commands.add_parser("export", help="write the built-in levels as a pack")
+    export_cmd.add_argument("path")
+    export_cmd.add_argument("--layouts", action="store_true",
+                            help="also store each generated layout explicitly")
+    check_cmd = commands.add_parser("check", help="load and validate every level of a pack")
+    check_cmd.add_argument("path")
+    args = parser.parse_args(argv)
+
+    if args.command == "export":
+        count = export(args.path, args.layouts)
+        print(f"Wrote {count} levels to {args.path}")
+        return
+
+    try:
+        pack = LevelPack(args.path)
+        for i in range(len(pack)):
+            pack.level(i)
+    except LevelPackError as e:
+        raise SystemExit(f"Invalid level pack: {e}")
+    print(f"{pack.name}: {len(pack)} levels OK")
+
+if __name__ == "__main__":
+    main()
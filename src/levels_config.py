@@ -1,7 +1,5 @@
 # levels_config.py
 
-CURRENT_LEVEL = 0
-
 LEVELS = [
     {
         "name": "Level 1 (Easy)",
@@ -69,3 +67,19 @@ LEVELS = [
         "coin_chance": 0.3,
     }
 ]
+
+# Parameters for endless mode (see LevelManager.start_endless)
+ENDLESS_LEVEL = {
+    "name": "Endless",
+    "endless": True,
+    "seed": 9001,
+    "safe_gap_min": 60,
+    "safe_gap_max": 150,
+    "vertical_offset_min": -75,
+    "vertical_offset_max": 75,
+    "min_platform_y": 400,
+    "max_platform_y": 700,
+    "obstacle_spawn_chance": 0.45,
+    "obstacle_max_per_platform": 2,
+    "coin_chance": 0.4,
+}
@@ -46,20 +46,20 @@ def handle_charged_jump_release(game) -> None:
     if game.player.charging:
         if game.player.on_ground:
             game.player.vel_y = -game.player.jump_charge
-            game.boing_sound.play()
+            game.audio.play("boing")
         game.player.charging = False
         game.player.jump_charge = 0
 
 def handle_instant_jump(game) -> None:
     if coyote_ground_frames_for(game, 'instant') > 0:
         game.player.vel_y = -c.MIN_JUMP_STRENGTH
-        game.boing_sound.play()
+        game.audio.play("boing")
         set_jump_buffer_frames(game, 'instant', 0)
     else:
         # mid-air, possibly double jump
         if not game.player.on_ground and game.player.can_double_jump:
             game.player.vel_y = -c.MIN_JUMP_STRENGTH
             game.player.can_double_jump = False
-            game.boing_sound.play()
+            game.audio.play("boing")
         else:
             set_jump_buffer_frames(game, 'instant', c.JUMP_BUFFER_FRAMES)
@@ -2,20 +2,28 @@
 import pygame
 import random
 import src.config as c
+from src.pool import Pool
 
 class Obstacle:
-    def __init__(self, x, y, pokemon_images):
-        self.image = random.choice(pokemon_images)
+    __slots__ = ("x", "y", "image", "width", "height")
+
+    def __init__(self, x, y, pokemon_images, image=None):
+        self.reset(x, y, pokemon_images, image)
+
+    def reset(self, x, y, pokemon_images, image=None):
+        # image: a given sprite (explicit layouts) instead of a random one
+        self.image = image if image is not None else random.choice(pokemon_images)
         self.width, self.height = self.image.get_size()
         self.x = x
         self.y = y
-        self.speed = c.SPEED
 
     def move(self):
-        self.x -= self.speed
+        self.x -= c.SPEED
 
-    def draw(self, screen):
-        screen.blit(self.image, (self.x, self.y))
+    def draw(self, screen, offset_x=0):
+        self.image.draw(screen, (self.x + offset_x, self.y))
 
     def off_screen(self):
         return (self.x + self.width) < 0
+
+obstacle_pool = Pool("obstacle", Obstacle)
@@ -1,46 +1,79 @@
 # player.py
 import pygame
 import src.config as c
+from src.assets import bake
+
+PLAYER_COLOR = (0, 0, 255)
+
+# Pre-rendered square, shared by every Player of the same size and colour
+_surfaces = {}
+
+def player_surface(width, height, color=PLAYER_COLOR):
+    surf = _surfaces.get((width, height, color))
+    if surf is None:
+        surf = pygame.Surface((width, height))
+        surf.fill(color)
+        surf = bake(surf)
+        _surfaces[(width, height, color)] = surf
+    return surf
+
+def landing_rects_for(platforms):
+    """Each platform's rect with a slight horizontal tolerance, in the same order."""
+    rects = []
+    for platform in platforms:
+        rect = pygame.Rect(platform.x, platform.y, platform.width, platform.height)
+        rect.x -= c.PLATFORM_EDGE_TOLERANCE
+        rect.width += 2 * c.PLATFORM_EDGE_TOLERANCE
+        rects.append(rect)
+    return rects
 
 class Player:
-    def __init__(self):
+    __slots__ = ("width", "height", "x", "y", "default_x", "prev_x", "prev_y",
+                 "vel_y", "on_ground", "charging", "jump_charge", "can_double_jump", "color")
+
+    def __init__(self, x=100, color=PLAYER_COLOR):
         side = int(c.SQUARE_WIDTH_FRAC * c.WIDTH)
         self.width = side
         self.height = side
 
         # Starting position
-        self.x = 100
+        self.x = x
         self.y = 320
         # Keep track of the resting/default X for nudging logic
         self.default_x = self.x
+        # Position before the last simulation step, for interpolated drawing
+        self.prev_x = self.x
+        self.prev_y = self.y
 
         self.vel_y = 0
         self.on_ground = True
         self.charging = False
         self.jump_charge = 0
         self.can_double_jump = True
+        self.color = color
 
-    def move(self, platforms):
+    def move(self, platforms, landing_rects=None):
+        """
+        landing_rects: landing_rects(platforms), which LevelManager builds
+        once per step for every player; made here when not given.
+        """
         self.vel_y += c.GRAVITY
         self.y += self.vel_y
         self.on_ground = False
 
-        player_rect = pygame.Rect(self.x, self.y, self.width, self.height)
-
-        for platform in platforms:
-            platform_rect = pygame.Rect(platform.x, platform.y,
-                                        platform.width, platform.height)
-            # Slight horizontal tolerance
-            platform_rect.x -= c.PLATFORM_EDGE_TOLERANCE
-            platform_rect.width += 2 * c.PLATFORM_EDGE_TOLERANCE
-
-            if self.vel_y > 0 and player_rect.colliderect(platform_rect):
-                self.y = platform.y - self.height
+        if self.vel_y > 0:
+            if landing_rects is None:
+                landing_rects = landing_rects_for(platforms)
+            # Lands on the first platform it overlaps
+            i = pygame.Rect(self.x, self.y, self.width, self.height).collidelist(landing_rects)
+            if i != -1:
+                self.y = platforms[i].y - self.height
                 self.vel_y = 0
                 self.on_ground = True
                 self.can_double_jump = True
-                player_rect.y = self.y
 
-    def draw(self, screen):
-        pygame.draw.rect(screen, (0, 0, 255),
-                         (self.x, self.y, self.width, self.height))
+    def draw(self, screen, alpha=1.0):
+        # alpha: fraction of the current step elapsed (see Game.run)
+        x = self.prev_x + (self.x - self.prev_x) * alpha
+        y = self.prev_y + (self.y - self.prev_y) * alpha
+        screen.blit(player_surface(self.width, self.height, self.color), (x, y))
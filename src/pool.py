@@ -0,0 +1,53 @@
+# pool.py
+#
+# Free lists for the entities a level makes and drops all the time:
+# platforms, obstacles, coins and bubbles. An entity class with a
+# reset(...) method taking its constructor arguments can be pooled.
+
+POOLS = {}   # name -> Pool, for stats()
+
+class Pool:
+    """
+    acquire(*args) returns a released object reset with args (a hit) or a
+    new cls(*args) (a miss); release(obj) puts one back. Objects must not
+    be used after release.
+    """
+
+    def __init__(self, name, cls):
+        self.cls = cls
+        self.free = []
+        self.hits = 0
+        self.misses = 0
+        POOLS[name] = self
+
+    def acquire(self, *args):
+        if self.free:
+            obj = self.free.pop()
+            obj.reset(*args)
+            self.hits += 1
+            return obj
+        self.misses += 1
+        return self.cls(*args)
+
+    def release(self, obj):
+        self.free.append(obj)
+
+    def release_all(self, objs):
+        self.free.extend(objs)
+
+    def stats(self):
+        acquired = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / acquired if acquired else 0.0,
+            "free": len(self.free),
+        }
+
+def stats():
+    """{pool name: Pool.stats()} for every pool."""
+    return {name: pool.stats() for name, pool in POOLS.items()}
+
+def summary():
+    return ", ".join(f"{name} {s['hit_rate']:.0%} of {s['hits'] + s['misses']}"
+                     for name, s in stats().items())
@@ -0,0 +1,153 @@
+# renderer.py
+#
+# Drawing backends. Everything on screen goes through the renderer returned
+# by get_renderer(). Its methods mirror the Surface calls the game already
+# makes (fill, blit, blits), so entity draw(screen, ...) methods accept
+# either a renderer or a plain Surface.
+#
+#   software  (default) draws on the pygame.display surface
+#   gpu       pygame._sdl2.video Renderer + Textures, for cabinets with an
+#             accelerated driver; python main.py --renderer gpu
+
+import weakref
+import pygame
+
+import src.config as c
+
+class SoftwareRenderer:
+    """Draws onto the display surface (or any given Surface)."""
+
+    name = "software"
+
+    def __init__(self, surface=None):
+        self._surface = surface
+
+    @property
+    def surface(self):
+        # Looked up each time: set_mode may have replaced the display surface
+        return self._surface if self._surface is not None else pygame.display.get_surface()
+
+    def get_size(self):
+        return self.surface.get_size()
+
+    def fill(self, color, rect=None):
+        self.surface.fill(color, rect)
+
+    def draw_rect(self, color, rect, width=0):
+        pygame.draw.rect(self.surface, color, rect, width)
+
+    def blit(self, source, dest, area=None):
+        self.surface.blit(source, dest, area)
+
+    def blits(self, items, doreturn=False):
+        self.surface.blits(items, doreturn=False)
+
+    def present(self):
+        pygame.display.update()
+
+    def to_surface(self):
+        """The current frame as a Surface (for screenshots and pixel observations)."""
+        return self.surface
+
+class GPURenderer:
+    """
+    pygame._sdl2.video backend. It opens its own window, since SDL cannot
+    attach a renderer to a window that pygame.display already made a
+    surface for. Surfaces are uploaded once to a Texture and cached for as
+    long as the Surface lives, so baked sprites, tiles and the atlas cost
+    one upload; text rendered every frame is uploaded every frame.
+
+    accelerated=False picks SDL's software render driver, which also works
+    with the dummy video driver (CI).
+    """
+
+    name = "gpu"
+
+    def __init__(self, size, fullscreen=False, vsync=False, accelerated=True):
+        from pygame._sdl2.video import Window, Renderer, Texture
+        self._texture_from = Texture.from_surface
+        if fullscreen:
+            self.window = Window(c.WINDOW_TITLE, size=size, fullscreen_desktop=True)
+        else:
+            self.window = Window(c.WINDOW_TITLE, size=size)
+        self.renderer = Renderer(self.window, accelerated=1 if accelerated else 0,
+                                 vsync=vsync)
+        self.textures = weakref.WeakKeyDictionary()
+
+    def get_size(self):
+        return self.window.size
+
+    def texture(self, surf):
+        tex = self.textures.get(surf)
+        if tex is None:
+            tex = self._texture_from(self.renderer, surf)
+            self.textures[surf] = tex
+        return tex
+
+    def fill(self, color, rect=None):
+        self.renderer.draw_color = pygame.Color(color)
+        if rect is None:
+            self.renderer.clear()
+        else:
+            self.renderer.fill_rect(rect)
+
+    def draw_rect(self, color, rect, width=0):
+        self.renderer.draw_color = pygame.Color(color)
+        if width == 0:
+            self.renderer.fill_rect(rect)
+            return
+        rect = pygame.Rect(rect)
+        for i in range(width):
+            self.renderer.draw_rect(rect.inflate(-2 * i, -2 * i))
+
+    def blit(self, source, dest, area=None):
+        tex = self.texture(source)
+        if area is None:
+            tex.draw(dstrect=dest)
+        else:
+            tex.draw(srcrect=area, dstrect=(dest[0], dest[1], area[2], area[3]))
+
+    def blits(self, items, doreturn=False):
+        for item in items:
+            self.blit(*item)
+
+    def present(self):
+        self.renderer.present()
+
+    def to_surface(self):
+        return self.renderer.to_surface()
+
+RENDERERS = {
+    "software": SoftwareRenderer,
+    "gpu": GPURenderer,
+}
+
+_renderer = None
+
+def init_renderer(name, size, fullscreen=False):
+    """
+    Creates the renderer for the whole session (main.py, at startup). For
+    "software" the caller has already set the display mode; "gpu" opens its
+    own window. A GPU renderer that cannot start falls back to software
+    (returns None so the caller sets a display mode instead).
+    """
+    global _renderer
+    if name not in RENDERERS:
+        raise ValueError(f"Unknown renderer {name!r}; choose from {', '.join(RENDERERS)}")
+    if name == "gpu":
+        try:
+            _renderer = GPURenderer(size, fullscreen, vsync=c.VSYNC)
+        except (pygame.error, ImportError) as e:
+            print(f"Warning: GPU renderer unavailable ({e}); using the software renderer.")
+            c.RENDERER = "software"
+            return None
+    else:
+        _renderer = SoftwareRenderer()
+    return _renderer
+
+def get_renderer():
+    """The session renderer; tools that never called init_renderer get software."""
+    global _renderer
+    if _renderer is None:
+        _renderer = SoftwareRenderer()
+    return _renderer
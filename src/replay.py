@@ -0,0 +1,177 @@
+# replay.py
+#
+# Session recordings. Game.step is deterministic given the level, the
+# random state when the run started (bubbles and endless chunks draw from
+# it) and the inputs, so a replay stores just those: every input with the
+# step it arrived before. Playing the inputs back reproduces the run frame
+# for frame, which the video exporter relies on.
+#
+#   python main.py --record        saves c.REPLAY_DIR/<time>-level<N>.json after each run
+#
+# Replay files are JSON:
+#   {"format": 1, "level_index": 0, "level_name": "...", "level_pack": null,
+#    "endless": false, "sim_fps": 30, "level_duration": 40, "size": [1200, 800],
+#    "lives": 10, "baseline_coins": 0, "random_state": [...],
+#    "inputs": [[step, action, value], ...],
+#    "result": {"frames": 1200, "death": null, "coins": 12}}
+#
+# Actions: "press" / "release" (charge button; value is whether a charge
+# button is still held afterwards), "instant" (value unused) and "axis"
+# (the joystick nudge axis changed to value).
+
+import json
+import os
+import random
+import time
+
+import src.config as c
+
+FORMAT = 1
+ACTIONS = ("press", "release", "instant", "axis")
+
+class ReplayError(ValueError):
+    """A replay file that cannot be played back in this build."""
+
+class Recorder:
+    """Collects one run's inputs; Game.run creates one when c.RECORD_REPLAYS is set."""
+
+    def __init__(self, game):
+        self.replay = {
+            "format": FORMAT,
+            "level_index": game.current_level_index,
+            "level_name": game.level_manager.level_name,
+            "level_pack": c.LEVEL_PACK,
+            "endless": game.level_manager.endless,
+            "sim_fps": c.SIM_FPS,
+            "level_duration": c.LEVEL_DURATION,
+            # Sprites, platforms and the player scale with the window
+            "size": [c.WIDTH, c.HEIGHT],
+            "lives": game.lives,
+            "baseline_coins": game.baseline_coins,
+            "random_state": random.getstate(),
+            "inputs": [],
+        }
+
+    def input(self, game, action, value=None):
+        self.replay["inputs"].append([game.frames, action, value])
+
+    def finish(self, game, death):
+        self.replay["result"] = {"frames": game.frames, "death": death,
+                                 "coins": game.current_level_coins}
+        return self.replay
+
+def save(replay, directory=None):
+    """Writes a finished recording; returns its path."""
+    directory = directory or c.REPLAY_DIR
+    os.makedirs(directory, exist_ok=True)
+    stamp = time.strftime("%Y%m%d-%H%M%S")
+    path = os.path.join(directory, f"{stamp}-level{replay['level_index'] + 1}.json")
+    n = 1
+    while os.path.exists(path):
+        n += 1
+        path = os.path.join(directory, f"{stamp}-level{replay['level_index'] + 1}-{n}.json")
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(replay, f, separators=(",", ":"))
+    return path
+
+def load(path):
+    """Reads a replay file and checks it can be played back with the current config."""
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            replay = json.load(f)
+    except (OSError, json.JSONDecodeError) as e:
+        raise ReplayError(f"{path}: {e}") from e
+    if not isinstance(replay, dict) or replay.get("format") != FORMAT:
+        raise ReplayError(f"{path}: not a format {FORMAT} replay")
+    if replay.get("sim_fps") != c.SIM_FPS:
+        raise ReplayError(f"{path}: recorded at {replay.get('sim_fps')} steps/s, "
+                          f"this build runs {c.SIM_FPS}")
+    if any(action not in ACTIONS for _, action, _ in replay.get("inputs", ())):
+        raise ReplayError(f"{path}: unknown input action")
+    version, internal, gauss = replay["random_state"]
+    replay["random_state"] = (version, tuple(internal), gauss)
+    return replay
+
+def recorded_size(replay):
+    """(width, height) of the window the run was played in; replays from before it was stored say nothing."""
+    return tuple(replay.get("size") or (c.WIDTH, c.HEIGHT))
+
+def new_game(replay):
+    """
+    A Game set up as the recorded run started: same level (and pack), lives
+    and banked coins, and the random state restored. The caller drives it
+    with ReplayInput instead of process_events. The window (c.WIDTH,
+    c.HEIGHT) must be the recorded size: set it before pygame starts.
+    """
+    from src.game_manager import Game
+    size = recorded_size(replay)
+    if size != (c.WIDTH, c.HEIGHT):
+        raise ReplayError(f"recorded in a {size[0]}x{size[1]} window, "
+                          f"playing in {c.WIDTH}x{c.HEIGHT}")
+    if replay.get("level_pack") and not c.LEVEL_PACK:
+        c.LEVEL_PACK = replay["level_pack"]
+    c.ENDLESS_MODE = replay["endless"]
+    c.LEVEL_DURATION = replay["level_duration"]
+    game = Game(replay["level_index"])
+    if game.level_manager.level_name != replay["level_name"]:
+        print(f"Warning: replay recorded on {replay['level_name']!r}, "
+              f"playing {game.level_manager.level_name!r}.")
+    game.joystick = None
+    game.lives = replay["lives"]
+    game.baseline_coins = replay["baseline_coins"]
+    random.setstate(replay["random_state"])
+    return game
+
+class ReplayInput:
+    """Feeds a replay's inputs to a Game, step by step."""
+
+    def __init__(self, replay):
+        self.inputs = replay["inputs"]
+        self.next = 0
+
+    def apply(self, game):
+        """Call where run() calls process_events: applies the inputs due before this step."""
+        inputs = self.inputs
+        while self.next < len(inputs) and inputs[self.next][0] <= game.frames:
+            _, action, value = inputs[self.next]
+            self.next += 1
+            if action == "press":
+                game.virtual_charge_held = value
+                game.handle_charged_jump_press()
+            elif action == "release":
+                game.virtual_charge_held = value
+                game.handle_charged_jump_release()
+            elif action == "instant":
+                game.handle_instant_jump()
+            else:
+                game.nudge_axis = value
+
+def play(replay, draw=None):
+    """
+    Plays a replay back as run() would, with draw(game) called after each
+    step if given, and returns the result as Recorder.finish records it.
+    """
+    game = new_game(replay)
+    inputs = ReplayInput(replay)
+    level_steps = int(c.LEVEL_DURATION * c.SIM_FPS)
+    death = None
+    try:
+        while death is None:
+            if game.frames >= level_steps and not game.level_manager.endless:
+                break
+            if game.frames >= replay["result"]["frames"]:
+                break
+            inputs.apply(game)
+            game.update_bubbles()
+            death = game.step()
+            if draw is not None:
+                draw(game)
+        return {"frames": game.frames, "death": death, "coins": game.current_level_coins}
+    finally:
+        game.release()
+
+def check(replay):
+    """Plays a replay without drawing; ReplayError unless it ends as recorded."""
+    result = play(replay)
+    if result != replay["result"]:
+        raise ReplayError(f"replay diverged: recorded {replay['result']}, replayed {result}")
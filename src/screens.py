@@ -4,7 +4,7 @@ import pygame
 import sys
 
 import src.config as c
-import src.levels_config as lvl
+from src.levelpack import get_pack
 import src.scoreboard as sb  # If you're using scoreboard saving
 # Otherwise remove references if you don't want a persistent scoreboard
 
@@ -14,8 +14,9 @@ def show_completion_screen(game):
         True, c.RED
     )
     over_rect = over_text.get_rect(center=(c.WIDTH // 2, c.HEIGHT // 2))
-    game.screen.blit(over_text, over_rect)
-    pygame.display.update()
+    game.draw_frame()
+    game.renderer.blit(over_text, over_rect)
+    game.renderer.present()
 
     waiting = True
     while waiting:
@@ -30,9 +31,10 @@ def show_completion_screen(game):
                     waiting = False
 
     # Move to next level or end
-    if game.current_level_index < len(lvl.LEVELS) - 1:
-        lvl.CURRENT_LEVEL += 1
-        from src.game_manager import main
+    if game.current_level_index < len(get_pack()) - 1:
+        from src.game_manager import Game, main
+        Game.persistent_level_index = game.current_level_index + 1
+        game.release()
         main()
     else:
         show_final_message(game, "All levels completed! Thanks for playing.")
@@ -46,8 +48,9 @@ def show_game_over_screen(game):
         True, c.RED
     )
     over_rect = over_text.get_rect(center=(c.WIDTH // 2, c.HEIGHT // 2))
-    game.screen.blit(over_text, over_rect)
-    pygame.display.update()
+    game.draw_frame()
+    game.renderer.blit(over_text, over_rect)
+    game.renderer.present()
     
     waiting = True
     while waiting:
@@ -61,6 +64,7 @@ def show_game_over_screen(game):
                 if event.button == 3:
                     waiting = False
 
+    game.release()
     from src.game_manager import main
     main()
 
@@ -83,13 +87,48 @@ def show_out_of_lives_screen(game):
     entries = sb.add_score(initials, final_coins)
     show_scoreboard(game, entries)
 
-    # Reset to level 1
-    lvl.CURRENT_LEVEL = 0
-
     from src.game_manager import Game, main
+
+    # Reset to level 1
+    Game.persistent_level_index = 0
     Game.persistent_lives = 10
     Game.persistent_baseline_coins = 0  # If you want to start from 0 coins next run
 
+    game.release()
+    main()
+
+def show_versus_result_screen(game, winner):
+    """
+    Called when a versus round ends => announce the winner, then the next
+    round on the next level (back to the first after the last).
+    """
+    if winner is None:
+        msg = "Draw!"
+    else:
+        msg = f"Player {winner + 1} wins the round!"
+    score = " - ".join(str(w) for w in game.wins)
+    over_text = game.font.render(f"{msg} ({score}) Press any key or Y for the next round.",
+                                 True, c.RED)
+    over_rect = over_text.get_rect(center=(c.WIDTH // 2, c.HEIGHT // 2))
+    game.draw_frame()
+    game.renderer.blit(over_text, over_rect)
+    game.renderer.present()
+
+    waiting = True
+    while waiting:
+        for event in pygame.event.get():
+            if event.type == pygame.QUIT:
+                pygame.quit()
+                sys.exit()
+            if event.type == pygame.KEYDOWN:
+                waiting = False
+            elif event.type == pygame.JOYBUTTONDOWN:
+                if event.button == 3:
+                    waiting = False
+
+    from src.game_manager import Game, main
+    Game.persistent_level_index = (game.current_level_index + 1) % len(get_pack())
+    game.release()
     main()
 
 def prompt_for_initials(game):
@@ -98,20 +137,20 @@ def prompt_for_initials(game):
     """
     entered = ""
     while True:
-        game.screen.fill((0, 0, 0))
+        game.renderer.fill((0, 0, 0))
         prompt = game.font.render("Enter your initials (up to 3 letters), then Press Enter:", True, c.WHITE)
         prompt_rect = prompt.get_rect(center=(c.WIDTH // 2, 150))
-        game.screen.blit(prompt, prompt_rect)
+        game.renderer.blit(prompt, prompt_rect)
 
         initials_surf = game.font.render(entered, True, c.WHITE)
         initials_rect = initials_surf.get_rect(center=(c.WIDTH // 2, 250))
-        game.screen.blit(initials_surf, initials_rect)
+        game.renderer.blit(initials_surf, initials_rect)
 
         instructions = game.font.render("[Backspace=delete | Enter=confirm]", True, (200,200,200))
         instructions_rect = instructions.get_rect(center=(c.WIDTH // 2, 350))
-        game.screen.blit(instructions, instructions_rect)
+        game.renderer.blit(instructions, instructions_rect)
 
-        pygame.display.update()
+        game.renderer.present()
 
         for event in pygame.event.get():
             if event.type == pygame.QUIT:
@@ -149,19 +188,19 @@ def show_scoreboard(game, entries):
     """
     Display the top scoreboard entries on screen.
     """
-    game.screen.fill((0, 0, 0))
+    game.renderer.fill((0, 0, 0))
     title_text = game.font.render("TOP SCORES", True, c.WHITE)
     title_rect = title_text.get_rect(center=(c.WIDTH // 2, 50))
-    game.screen.blit(title_text, title_rect)
+    game.renderer.blit(title_text, title_rect)
 
     y_start = 150
     for i, entry in enumerate(entries):
         rank = i + 1
         line = f"{rank}. {entry['name']}  -  {entry['score']} coins"
         line_surf = game.font.render(line, True, c.WHITE)
-        game.screen.blit(line_surf, (100, y_start + i * 40))
+        game.renderer.blit(line_surf, (100, y_start + i * 40))
 
-    pygame.display.update()
+    game.renderer.present()
 
     # Wait for user to press a key or button
     waiting = True
@@ -179,8 +218,9 @@ def show_final_message(game, msg):
     """
     over_text = game.font.render(msg, True, c.RED)
     over_rect = over_text.get_rect(center=(c.WIDTH // 2, c.HEIGHT // 2))
-    game.screen.blit(over_text, over_rect)
-    pygame.display.update()
+    game.draw_frame()
+    game.renderer.blit(over_text, over_rect)
+    game.renderer.present()
 
     waiting = True
     while waiting:
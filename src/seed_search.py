@@ -0,0 +1,158 @@
+# seed_search.py
+#
+# Sweeps seed ranges for a level's parameters across all cores and ranks them.
+#
+#   python -m src.seed_search --level 3 --seeds 0:100000
+#   python -m src.seed_search --params my_level.json --seeds 0:20000 --target 0.6
+
+import argparse
+import heapq
+import json
+import os
+import time
+from multiprocessing import Pool
+
+import src.levels_config as lvl
+from src.jump_tables import get_jump_table
+from src.solvability import check_level, goal_x, parse_seed_range
+
+CHUNK_SIZE = 250
+
+# Per-process state, filled by _init_worker
+_worker = {}
+
+def score_layout(platforms, obstacles, star_coins, table):
+    """
+    Summarizes a generated layout (up to where the timer ends the level):
+        solvable      from the solvability checker
+        difficulty    mean of required / maximum jump distance per gap (0..1+)
+        coin_density  coins per platform
+        min_spacing   smallest clear run between neighbouring obstacles (px)
+        issues        number of solvability issues
+    """
+    target = goal_x()
+    in_play = [p for p in platforms if p.x <= target] or platforms[:1]
+
+    tightness = []
+    for prev, p in zip(in_play, in_play[1:]):
+        gap = p.x - (prev.x + prev.width)
+        _, reach_max = table.reach_distance(prev.y - p.y)
+        tightness.append(gap / reach_max if reach_max else 2.0)
+    difficulty = sum(tightness) / len(tightness) if tightness else 0.0
+
+    end_x = in_play[-1].x + in_play[-1].width
+    coins = sum(1 for coin in star_coins if coin.x <= end_x)
+    obs_x = sorted((o.x, o.x + o.width) for o in obstacles if o.x <= end_x)
+    spacing = [b[0] - a[1] for a, b in zip(obs_x, obs_x[1:])]
+
+    report = check_level(platforms, obstacles, table)
+    return {
+        "solvable": report["solvable"],
+        "difficulty": difficulty,
+        "coin_density": coins / len(in_play),
+        "min_spacing": min(spacing) if spacing else end_x,
+        "issues": len(report["issues"]),
+    }
+
+def rank_key(metrics, target=None):
+    """Higher is better: solvable first, then difficulty (or closeness to target)."""
+    if target is None:
+        fit = metrics["difficulty"]
+    else:
+        fit = -abs(metrics["difficulty"] - target)
+    return (metrics["solvable"], round(fit, 3), metrics["coin_density"],
+            metrics["min_spacing"])
+
+def _init_worker(params):
+    # Headless: images only need their sizes, so no display is required
+    from src.assets import load_images
+    _worker["images"] = load_images(convert=False)
+    _worker["table"] = get_jump_table()
+    _worker["params"] = params
+
+def _score_seeds(args):
+    """Scores a chunk of seeds; returns (counts, top entries) to keep IPC small."""
+    from src.level_manager import LevelManager
+    seeds, top_n, target = args
+    images = _worker["images"]
+    table = _worker["table"]
+    params = _worker["params"]
+
+    best = []
+    solvable = 0
+    for seed in seeds:
+        lm = LevelManager(images['pokemon_images'], images['coin_image'],
+                          level_data=dict(params, seed=seed))
+        metrics = score_layout(lm.platforms, lm.obstacles, lm.star_coins, table)
+        metrics["seed"] = seed
+        solvable += metrics["solvable"]
+        entry = (rank_key(metrics, target), seed, metrics)
+        if len(best) < top_n:
+            heapq.heappush(best, entry)
+        elif entry > best[0]:
+            heapq.heapreplace(best, entry)
+    return len(seeds), solvable, best
+
+def search(params, seeds, workers=None, top_n=20, target=None):
+    """
+    Scores every seed in `seeds` for the parameter dict `params`.
+    Returns (ranked list of metric dicts, seeds checked, solvable count).
+    """
+    seeds = list(seeds)
+    chunks = [(seeds[i:i + CHUNK_SIZE], top_n, target)
+              for i in range(0, len(seeds), CHUNK_SIZE)]
+
+    best = []
+    checked = solvable = 0
+    with Pool(processes=workers, initializer=_init_worker, initargs=(params,)) as pool:
+        for n, n_ok, chunk_best in pool.imap_unordered(_score_seeds, chunks):
+            checked += n
+            solvable += n_ok
+            for entry in chunk_best:
+                if len(best) < top_n:
+                    heapq.heappush(best, entry)
+                elif entry > best[0]:
+                    heapq.heapreplace(best, entry)
+
+    ranked = [metrics for _, _, metrics in sorted(best, reverse=True)]
+    return ranked, checked, solvable
+
+def print_table(ranked):
+    print(f"{'rank':>4} {'seed':>8} {'solvable':>8} {'difficulty':>10} "
+          f"{'coins/plat':>10} {'min gap':>8} {'issues':>6}")
+    for rank, m in enumerate(ranked, start=1):
+        print(f"{rank:>4} {m['seed']:>8} {('yes' if m['solvable'] else 'no'):>8} "
+              f"{m['difficulty']:>10.3f} {m['coin_density']:>10.2f} "
+              f"{m['min_spacing']:>8} {m['issues']:>6}")
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Rank level seeds across all cores.")
+    source = parser.add_mutually_exclusive_group(required=True)
+    source.add_argument("--level", type=int, help="1-based level number from levels_config")
+    source.add_argument("--params", help="JSON file with a level parameter dict")
+    parser.add_argument("--seeds", type=parse_seed_range, default=range(0, 10000),
+                        help="start:stop seed range (default 0:10000)")
+    parser.add_argument("--target", type=float,
+                        help="rank by closeness to this difficulty instead of hardest first")
+    parser.add_argument("--top", type=int, default=20)
+    parser.add_argument("--workers", type=int, default=os.cpu_count())
+    args = parser.parse_args(argv)
+
+    if args.level is not None:
+        params = dict(lvl.LEVELS[args.level - 1])
+    else:
+        with open(args.params, "r") as f:
+            params = json.load(f)
+
+    started = time.perf_counter()
+    ranked, checked, solvable = search(params, args.seeds, args.workers,
+                                       args.top, args.target)
+    elapsed = time.perf_counter() - started
+
+    print(f"{params.get('name', 'custom')}: {checked} seeds in {elapsed:.1f}s "
+          f"({checked / max(elapsed, 1e-9):.0f} seeds/s, {args.workers} workers), "
+          f"{solvable} solvable")
+    print_table(ranked)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,252 @@
+# solvability.py
+#
+# Reachability analysis for generated levels.
+#
+#   python -m src.solvability                      # configured seed of every level
+#   python -m src.solvability --level 5 --seeds 0:5000
+#
+# The analysis is optimistic (it ignores charge-up time, mid-air obstacle hits
+# and the joystick nudge), so every problem it reports is a real one.
+
+import argparse
+import bisect
+import time
+
+import src.config as c
+import src.levels_config as lvl
+from src.jump_tables import get_jump_table
+
+START_X = 100       # Player.x / default_x
+START_Y = 320       # Player.y at spawn
+LOOKAHEAD = 4       # platforms ahead considered as jump targets
+
+def goal_x():
+    """World x of the player when the level timer runs out."""
+    return START_X + c.LEVEL_DURATION * c.FPS * c.SPEED
+
+def _player_side():
+    return int(c.SQUARE_WIDTH_FRAC * c.WIDTH)
+
+def _spike_top():
+    return c.HEIGHT - int(c.SPIKE_HEIGHT_FRAC * c.HEIGHT)
+
+def _segments(platforms, obstacles, use_obstacles=True):
+    """
+    Splits each platform into the ranges of player x where standing is safe.
+    Returns a list of (platform_index, lo, hi) sorted by platform then x.
+    """
+    side = _player_side()
+    tol = c.PLATFORM_EDGE_TOLERANCE
+    ct = c.COLLISION_TOLERANCE
+
+    obs_sorted = sorted(obstacles, key=lambda o: o.x) if use_obstacles else []
+    obs_x = [o.x for o in obs_sorted]
+    max_obs_w = max((o.width for o in obs_sorted), default=0)
+
+    segments = []
+    for i, p in enumerate(platforms):
+        lo = p.x - tol - side + 1
+        hi = p.x + p.width + tol - 1
+
+        # Player standing here occupies y in [p.y - side, p.y)
+        blocked = []
+        start = bisect.bisect_left(obs_x, lo - max_obs_w)
+        end = bisect.bisect_right(obs_x, hi)
+        for o in obs_sorted[start:end]:
+            top, bottom = o.y + ct, o.y + o.height - ct
+            if bottom > p.y - side and top < p.y:
+                blocked.append((o.x + ct - side + 1, o.x + o.width - ct - 1))
+        blocked.sort()
+
+        for b_lo, b_hi in blocked:
+            if b_lo > lo:
+                segments.append((i, lo, min(hi, b_lo - 1)))
+            lo = max(lo, b_hi + 1)
+            if lo > hi:
+                break
+        if lo <= hi:
+            segments.append((i, lo, hi))
+    return segments
+
+def _reachable(platforms, segments, table):
+    """
+    Earliest arrival x for every segment (None = unreachable), in the same
+    order as segments.
+    """
+    spike_top = _spike_top()
+    side = _player_side()
+    arrival = [None] * len(segments)
+
+    # Spawn: the player starts in the air at START_Y, with the double jump
+    for n, (i, lo, hi) in enumerate(segments):
+        p = platforms[i]
+        if p.y >= spike_top:
+            continue
+        f_min, f_max = table.drop_reach((START_Y + side) - p.y)
+        if not f_max:
+            continue
+        land_lo = max(lo, START_X + f_min * c.SPEED)
+        if land_lo <= min(hi, START_X + f_max * c.SPEED):
+            arrival[n] = land_lo
+
+    first_of = {}
+    for n, (i, _, _) in enumerate(segments):
+        first_of.setdefault(i, n)
+
+    for n, (i, lo, hi) in enumerate(segments):
+        a = arrival[n]
+        if a is None:
+            continue
+        src_y = platforms[i].y
+        last = min(len(platforms) - 1, i + LOOKAHEAD)
+        m = n + 1
+        end = first_of.get(last + 1, len(segments))
+        while m < end:
+            j, t_lo, t_hi = segments[m]
+            m += 1
+            if platforms[j].y >= spike_top:
+                continue
+            f_min, f_max = table.reach(src_y - platforms[j].y)
+            if not f_max:
+                continue
+            land_lo = max(t_lo, a + f_min * c.SPEED)
+            land_hi = min(t_hi, hi + f_max * c.SPEED)
+            if land_lo <= land_hi and (arrival[m - 1] is None or land_lo < arrival[m - 1]):
+                arrival[m - 1] = land_lo
+    return arrival
+
+def _airborne_reach(table, drop):
+    """Frames the longest arc stays up before falling `drop` px below launch."""
+    h = table.dj_heights[-1, int(table.arcs[-1]["apex_frame"])]
+    below = h <= -drop
+    return int(below.argmax()) if below.any() else table.frames
+
+def check_level(platforms, obstacles, table=None):
+    """
+    Returns a report dict:
+        solvable      True if the player can survive until the timer runs out
+        issues        list of {"kind", "platform", "detail"} dicts
+        furthest_x    furthest player x that can be reached safely
+        goal_x        player x when the timer runs out
+    Issue kinds: "start", "below_spikes", "gap", "obstacle", "dead_end".
+    """
+    if table is None:
+        table = get_jump_table()
+    spike_top = _spike_top()
+    target = goal_x()
+    issues = []
+
+    segments = _segments(platforms, obstacles)
+    arrival = _reachable(platforms, segments, table)
+
+    # Same analysis with obstacles removed separates gaps from obstacles
+    plain = _segments(platforms, obstacles, use_obstacles=False)
+    plain_arrival = _reachable(platforms, plain, table)
+    plain_ok = {i for (i, _, _), a in zip(plain, plain_arrival) if a is not None}
+
+    if not any(a is not None for a in arrival):
+        issues.append({"kind": "start", "platform": 0,
+                       "detail": "player cannot land safely at spawn"})
+
+    reached = {i for (i, _, _), a in zip(segments, arrival) if a is not None}
+    for i, p in enumerate(platforms):
+        if p.x > target:
+            break
+        if p.y >= spike_top:
+            issues.append({"kind": "below_spikes", "platform": i,
+                           "detail": f"y={p.y} is at or below the spikes ({spike_top})"})
+        elif i not in plain_ok and (i - 1) in plain_ok:
+            prev = platforms[i - 1]
+            gap = p.x - (prev.x + prev.width)
+            issues.append({"kind": "gap", "platform": i,
+                           "detail": f"gap {gap}px, rise {prev.y - p.y}px from platform {i - 1}"})
+        elif i in plain_ok and i not in reached and (i - 1) in reached:
+            issues.append({"kind": "obstacle", "platform": i,
+                           "detail": "only unreachable because of obstacle placement"})
+
+    furthest = None
+    solvable = False
+    for (i, lo, hi), a in zip(segments, arrival):
+        if a is None:
+            continue
+        air = _airborne_reach(table, spike_top - platforms[i].y)
+        reach = hi + air * c.SPEED
+        if furthest is None or hi > furthest[1]:
+            furthest = (i, hi)
+        if reach >= target:
+            solvable = True
+    if not solvable and furthest is not None:
+        issues.append({"kind": "dead_end", "platform": furthest[0],
+                       "detail": f"no safe way forward after x={furthest[1]}"})
+
+    return {
+        "solvable": solvable,
+        "issues": issues,
+        "furthest_x": furthest[1] if furthest else None,
+        "goal_x": target,
+    }
+
+def check_level_manager(level_manager, table=None):
+    return check_level(level_manager.platforms, level_manager.obstacles, table)
+
+# ---------------------------------------------------------------------
+# BATCH TOOL
+# ---------------------------------------------------------------------
+def parse_seed_range(text):
+    """'0:5000' -> range(0, 5000); '42' -> [42]."""
+    if ":" in text:
+        start, stop = text.split(":", 1)
+        return range(int(start), int(stop))
+    return [int(text)]
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Check generated levels for impossible jumps.")
+    parser.add_argument("--level", type=int, action="append",
+                        help="1-based level number (repeatable, default: all)")
+    parser.add_argument("--seeds", type=parse_seed_range,
+                        help="seed or start:stop range (default: the configured seed)")
+    parser.add_argument("--show", type=int, default=10,
+                        help="failing seeds to list per level")
+    args = parser.parse_args(argv)
+
+    # Imported here so the analysis above stays importable without pygame
+    from src.assets import load_images
+    from src.level_manager import LevelManager
+
+    images = load_images(convert=False)
+    table = get_jump_table()
+
+    levels = args.level or range(1, len(lvl.LEVELS) + 1)
+    for number in levels:
+        params = lvl.LEVELS[number - 1]
+        seeds = args.seeds if args.seeds is not None else [params.get("seed", 0)]
+
+        started = time.perf_counter()
+        failing = []
+        kinds = {}
+        for seed in seeds:
+            lm = LevelManager(images['pokemon_images'], images['coin_image'],
+                              level_data=dict(params, seed=seed))
+            report = check_level_manager(lm, table)
+            for issue in report["issues"]:
+                kinds[issue["kind"]] = kinds.get(issue["kind"], 0) + 1
+            if not report["solvable"]:
+                failing.append((seed, report))
+        elapsed = time.perf_counter() - started
+
+        total = len(seeds)
+        print(f"{params.get('name', number)}: {total - len(failing)}/{total} solvable "
+              f"({elapsed:.2f}s, {total / max(elapsed, 1e-9):.0f} seeds/s)")
+        if kinds:
+            print("  issues: " + ", ".join(f"{k}={v}" for k, v in sorted(kinds.items())))
+        for seed, report in failing[:args.show]:
+            # The issue just past where the player gets stuck explains it best
+            stuck = report["issues"][-1]["platform"]
+            first = next((i for i in report["issues"]
+                          if i["kind"] != "dead_end" and i["platform"] > stuck),
+                         report["issues"][0])
+            print(f"  seed {seed}: {first['kind']} at platform {first['platform']} "
+                  f"({first['detail']})")
+
+if __name__ == "__main__":
+    main()
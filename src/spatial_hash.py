@@ -0,0 +1,51 @@
+# spatial_hash.py
+
+class SpatialHash:
+    """
+    Uniform grid of square cells over world coordinates: each object is
+    listed in every cell its rect touches, so the objects near a rect are
+    found by looking at a cell or two instead of scanning them all.
+
+    LevelManager keeps one for obstacles and one for coins in world
+    coordinates (screen x plus the distance scrolled), which never change
+    as the level scrolls, so nothing is re-hashed while playing.
+    """
+
+    def __init__(self, cell_size):
+        self.cell_size = cell_size
+        self.cells = {}    # (column, row) -> [objects]
+        self.where = {}    # object -> the cells it is listed in
+
+    def _keys(self, x, y, w, h):
+        size = self.cell_size
+        return [(col, row)
+                for col in range(int(x // size), int((x + w) // size) + 1)
+                for row in range(int(y // size), int((y + h) // size) + 1)]
+
+    def insert(self, obj, x, y, w, h):
+        keys = self._keys(x, y, w, h)
+        for key in keys:
+            self.cells.setdefault(key, []).append(obj)
+        self.where[obj] = keys
+
+    def remove(self, obj):
+        for key in self.where.pop(obj):
+            bucket = self.cells[key]
+            bucket.remove(obj)
+            if not bucket:
+                del self.cells[key]
+
+    def query(self, x, y, w, h):
+        """Objects listed in any cell the rect touches (a superset of those overlapping it)."""
+        found = {}
+        for key in self._keys(x, y, w, h):
+            for obj in self.cells.get(key, ()):
+                found[obj] = None
+        return list(found)
+
+    def clear(self):
+        self.cells.clear()
+        self.where.clear()
+
+    def __len__(self):
+        return len(self.where)
@@ -0,0 +1,537 @@
+# spectate.py
+#
+# Spectator streaming: a second screen watching a cabinet. With --spectate
+# the game publishes its state after every simulation step over TCP, and
+# `python -m src.spectate` draws it. Only what the level can't reproduce is
+# sent: the spectator generates the same level from its seed (or layout)
+# and scrolls it one step for every step played, so a frame carries the
+# players and the ids of the coins they collected (LevelManager.add_coin).
+# The world scrolls c.SPEED px per step under a fixed view, so the step
+# count is also the camera offset.
+#
+#   python main.py --spectate [PORT]          listens on c.SPECTATE_HOST
+#   python -m src.spectate --host HOST [--port PORT]
+#
+# Each message starts with a kind byte:
+#   b"L", uint32 n, n bytes of JSON   a level starts: level_index, level_name,
+#                                     level_pack, endless, level_duration, sim_fps,
+#                                     size, players, lives, baseline_coins, wins
+#   b"E", uint32 n, n bytes of JSON   it ended: complete, death
+#   b"F", uint8 steps                 steps played since the spectator's previous
+#                                     frame (255: the uint32 step number follows),
+#         then per player a uint8 of flags and the fields they mark, in order:
+#     X 0x01, Y 0x02   int8 change in x / y in whole pixels, or int16 positions with WIDE 0x08
+#     CHARGE 0x04      uint8 jump charge, as in ghost files
+#     OUT 0x10         (no field) the player is out of the round, in versus mode
+#     COINS 0x20       uint8 n, then n uint32 ids of coins the player collected
+# A player who didn't move costs one byte, so most frames are 3 bytes.
+#
+# The game never waits for a spectator. Publisher.frame() appends a snapshot
+# to a deque (or drops it when c.SPECTATE_QUEUE are already waiting), which
+# wakes nobody; a background thread drains it every SEND_INTERVAL_S, encodes
+# each snapshot for each spectator against what that spectator last got, and
+# sends it on a non-blocking socket. A spectator more than
+# c.SPECTATE_BACKLOG bytes behind misses frames until it catches up; the
+# next frame it gets covers every step and coin since, so it jumps ahead.
+
+import argparse
+import json
+import socket
+import struct
+import sys
+import threading
+import time
+from collections import deque
+
+import pygame
+
+import src.config as c
+from src.ghost import charge_byte
+
+X, Y, CHARGE, WIDE, OUT, COINS = 0x01, 0x02, 0x04, 0x08, 0x10, 0x20
+STEP_MARK = 255          # steps byte meaning a full step number follows
+MAX_COINS = 255          # coin ids per player in one frame; the rest go in the next
+LENGTH = struct.Struct("<I")
+STEP = struct.Struct("<I")
+DELTA = struct.Struct("<b")
+POSITION = struct.Struct("<h")
+SEND_INTERVAL_S = 0.02   # how often the sender thread wakes (the game's queue, new spectators)
+CONNECT_RETRY_S = 1.0
+
+def _message(kind, info):
+    data = json.dumps(info, separators=(",", ":")).encode()
+    return kind + LENGTH.pack(len(data)) + data
+
+def snapshot(game):
+    """
+    (step number, per player (x, y, charge, out, coin ids, how many of
+    them)), taken on the game thread; the encoding is left to the sender.
+    """
+    return game.frames, [
+        (round(seat.player.x), round(seat.player.y), charge_byte(seat.player),
+         game.seat_out(n), seat.collected_coins, len(seat.collected_coins))
+        for n, seat in enumerate(game.seats)
+    ]
+
+# ---------------------------------------------------------------------
+# FRAMES
+# ---------------------------------------------------------------------
+class SentState:
+    """What one spectator has been sent this level: frames are encoded against it."""
+
+    def __init__(self, players=0):
+        self.reset(players)
+
+    def reset(self, players):
+        """A new level with this many players: the next frame is sent in full."""
+        self.step = 0
+        self.last = [None] * players        # (x, y, charge) per player
+        self.coins_sent = [0] * players
+
+def encode_frame(sent, step, players):
+    """One frame for a spectator, from a snapshot's step and players; updates sent."""
+    out = bytearray(b"F")
+    steps = step - sent.step
+    if 0 < steps < STEP_MARK:
+        out.append(steps)
+    else:
+        out.append(STEP_MARK)
+        out += STEP.pack(step)
+    sent.step = step
+    for n, (x, y, charge, out_of_round, coins, count) in enumerate(players):
+        x = max(-32768, min(32767, x))
+        y = max(-32768, min(32767, y))
+        last = sent.last[n]
+        if last is None:
+            flags = X | Y | WIDE | CHARGE
+        else:
+            dx, dy = x - last[0], y - last[1]
+            flags = (X if dx else 0) | (Y if dy else 0) | (CHARGE if charge != last[2] else 0)
+            if not (-128 <= dx <= 127 and -128 <= dy <= 127):
+                flags |= WIDE
+        if out_of_round:
+            flags |= OUT
+        first = sent.coins_sent[n]
+        new_coins = coins[first:min(count, first + MAX_COINS)]
+        if new_coins:
+            flags |= COINS
+
+        out.append(flags)
+        if flags & X:
+            out += POSITION.pack(x) if flags & WIDE else DELTA.pack(dx)
+        if flags & Y:
+            out += POSITION.pack(y) if flags & WIDE else DELTA.pack(dy)
+        if flags & CHARGE:
+            out.append(charge)
+        if new_coins:
+            out.append(len(new_coins))
+            out += struct.pack(f"<{len(new_coins)}I", *new_coins)
+        sent.last[n] = (x, y, charge)
+        sent.coins_sent[n] = first + len(new_coins)
+    return out
+
+def decode_frame(buf, pos, step, last):
+    """
+    Reads the frame whose steps byte is at buf[pos], given the step number
+    and each player's (x, y, charge) before it. Returns (position after it,
+    step number, per player (x, y, charge, out, coin ids)), or None when
+    buf doesn't hold the whole frame yet.
+    """
+    try:
+        steps = buf[pos]
+        pos += 1
+        if steps == STEP_MARK:
+            (step,) = STEP.unpack_from(buf, pos)
+            pos += STEP.size
+        else:
+            step += steps
+        players = []
+        for x, y, charge in last:
+            flags = buf[pos]
+            pos += 1
+            field = POSITION if flags & WIDE else DELTA
+            if flags & X:
+                (v,) = field.unpack_from(buf, pos)
+                x = v if flags & WIDE else x + v
+                pos += field.size
+            if flags & Y:
+                (v,) = field.unpack_from(buf, pos)
+                y = v if flags & WIDE else y + v
+                pos += field.size
+            if flags & CHARGE:
+                charge = buf[pos]
+                pos += 1
+            coins = ()
+            if flags & COINS:
+                n = buf[pos]
+                coins = struct.unpack_from(f"<{n}I", buf, pos + 1)
+                pos += 1 + 4 * n
+            players.append((x, y, charge, bool(flags & OUT), coins))
+    except (IndexError, struct.error):
+        return None
+    return pos, step, players
+
+# ---------------------------------------------------------------------
+# PUBLISHING (the game)
+# ---------------------------------------------------------------------
+class _Connection(SentState):
+    def __init__(self, sock, players):
+        super().__init__(players)
+        self.sock = sock
+        self.out = bytearray()   # encoded, not yet accepted by the socket
+        self.skipped = None      # the latest snapshot missed while too far behind
+
+    def send_skipped(self):
+        if self.skipped is not None:
+            self.out += encode_frame(self, *self.skipped)
+            self.skipped = None
+
+class Publisher:
+    """
+    Serves spectators from a background thread. The game thread calls
+    level(), frame() and end() and never waits on the network.
+    """
+
+    def __init__(self, host=None, port=None, queue_size=None, backlog=None):
+        host = c.SPECTATE_HOST if host is None else host
+        port = c.SPECTATE_PORT if port is None else port
+        self.listener = socket.create_server((host, port))
+        self.listener.setblocking(False)
+        self.address = self.listener.getsockname()[:2]
+        self.queue_size = c.SPECTATE_QUEUE if queue_size is None else queue_size
+        self.backlog = c.SPECTATE_BACKLOG if backlog is None else backlog
+        self.queue = deque()
+        # Game thread
+        self.published = 0
+        self.dropped = 0      # snapshots dropped with the queue full
+        # Sender thread
+        self.connections = []
+        self.intro = []       # this level's messages so far, for spectators joining
+        self.players = 0
+        self.missed = 0       # frames not sent to spectators too far behind
+        self.sent = 0         # bytes
+        self.thread = threading.Thread(target=self._serve, name="spectate", daemon=True)
+        self.thread.start()
+
+    def level(self, game) -> None:
+        """A level starts (Game.run): spectators build it too."""
+        lm = game.level_manager
+        info = {
+            "level_index": game.current_level_index,
+            "level_name": lm.level_name,
+            "level_pack": c.LEVEL_PACK,
+            "endless": lm.endless,
+            "level_duration": c.LEVEL_DURATION,
+            "sim_fps": c.SIM_FPS,
+            "size": [c.WIDTH, c.HEIGHT],
+            "players": len(game.seats),
+            "lives": game.lives,
+            "baseline_coins": game.baseline_coins,
+            "wins": list(getattr(game, "wins", [])),
+        }
+        self.queue.append(("level", _message(b"L", info), len(game.seats)))
+
+    def frame(self, game) -> None:
+        """Publishes the state after a step; dropped if the sender is that far behind."""
+        if len(self.queue) >= self.queue_size:
+            self.dropped += 1
+            return
+        self.queue.append(("frame",) + snapshot(game))
+        self.published += 1
+
+    def end(self, game, death) -> None:
+        info = {"complete": game.level_complete, "death": death}
+        self.queue.append(("end", _message(b"E", info)))
+
+    def close(self) -> None:
+        """Stops the sender thread and disconnects every spectator."""
+        self.queue.append(("stop",))
+        self.thread.join()
+
+    def summary(self):
+        return (f"{self.published} frames published, {self.dropped} dropped with the queue full; "
+                f"{self.sent} bytes to {len(self.connections)} spectators, "
+                f"{self.missed} frames missed by spectators behind")
+
+    # -----------------------------------------------------------------
+    # SENDER THREAD
+    # -----------------------------------------------------------------
+    def _serve(self):
+        running = True
+        while running:
+            time.sleep(SEND_INTERVAL_S)
+            while running and self.queue:
+                item = self.queue.popleft()
+                if item[0] == "stop":
+                    running = False
+                else:
+                    self._handle(item)
+            self._accept()
+            self._flush()
+        for conn in self.connections:
+            conn.sock.close()
+        self.listener.close()
+
+    def _handle(self, item):
+        kind = item[0]
+        if kind == "frame":
+            _, step, players = item
+            for conn in self.connections:
+                if len(conn.out) > self.backlog:
+                    conn.skipped = (step, players)
+                    self.missed += 1
+                else:
+                    conn.skipped = None
+                    conn.out += encode_frame(conn, step, players)
+        elif kind == "level":
+            _, message, self.players = item
+            self.intro = [message]
+            for conn in self.connections:
+                conn.out += message
+                conn.reset(self.players)
+                conn.skipped = None
+        else:
+            self.intro.append(item[1])
+            for conn in self.connections:
+                # The level's final state before its end, however far behind
+                conn.send_skipped()
+                conn.out += item[1]
+
+    def _accept(self):
+        while True:
+            try:
+                sock, _ = self.listener.accept()
+            except (BlockingIOError, InterruptedError):
+                return
+            sock.setblocking(False)
+            sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+            conn = _Connection(sock, self.players)
+            for message in self.intro:
+                conn.out += message
+            self.connections.append(conn)
+
+    def _flush(self):
+        for conn in self.connections[:]:
+            if not conn.out:
+                continue
+            try:
+                n = conn.sock.send(conn.out)
+            except (BlockingIOError, InterruptedError):
+                continue
+            except OSError:
+                # Gone (closed or reset)
+                conn.sock.close()
+                self.connections.remove(conn)
+                continue
+            del conn.out[:n]
+            self.sent += n
+            if len(conn.out) <= self.backlog:
+                # Caught up: straight to the latest state
+                conn.send_skipped()
+
+_publisher = None
+
+def get_publisher():
+    """The session's Publisher; the first call starts listening (OSError if it can't)."""
+    global _publisher
+    if _publisher is None:
+        _publisher = Publisher()
+    return _publisher
+
+# ---------------------------------------------------------------------
+# WATCHING (the spectator)
+# ---------------------------------------------------------------------
+class Viewer:
+    """
+    The spectator's screen: a Game built for each level the cabinet
+    starts, whose level is stepped and players placed by the frames.
+    """
+
+    def __init__(self, host, port):
+        from src.frame_pacing import FramePacer
+        from src.renderer import get_renderer
+        self.address = (host, port)
+        self.sock = None
+        self.buf = bytearray()
+        self.next_connect = 0.0
+        self.game = None
+        self.last = []          # each player's (x, y, charge) in the last frame
+        self.ended = None       # shown over the last frame once the level is over
+        self.received = 0.0     # perf_counter() when the last frame arrived
+        self.renderer = get_renderer()
+        self.font = pygame.font.Font(None, 36)
+        self.pacer = FramePacer()
+
+    def connect(self, now):
+        self.next_connect = now + CONNECT_RETRY_S
+        try:
+            sock = socket.create_connection(self.address, timeout=CONNECT_RETRY_S)
+        except OSError:
+            return
+        sock.setblocking(False)
+        self.sock = sock
+        print(f"Spectating {self.address[0]}:{self.address[1]}")
+
+    def disconnect(self):
+        self.sock.close()
+        self.sock = None
+        self.buf.clear()
+        self.ended = None
+
+    def receive(self):
+        while True:
+            try:
+                data = self.sock.recv(65536)
+            except (BlockingIOError, InterruptedError):
+                break
+            except OSError:
+                data = b""
+            if not data:
+                self.disconnect()
+                return
+            self.buf += data
+        self.read_messages()
+
+    def read_messages(self):
+        buf = self.buf
+        pos = 0
+        while pos < len(buf):
+            kind = buf[pos:pos + 1]
+            if kind in (b"L", b"E"):
+                if pos + 1 + LENGTH.size > len(buf):
+                    break
+                (n,) = LENGTH.unpack_from(buf, pos + 1)
+                start = pos + 1 + LENGTH.size
+                if start + n > len(buf):
+                    break
+                info = json.loads(bytes(buf[start:start + n]))
+                pos = start + n
+                if kind == b"L":
+                    self.start_level(info)
+                else:
+                    self.end_level(info)
+            elif kind == b"F" and self.game is not None:
+                frame = decode_frame(buf, pos + 1, self.game.frames, self.last)
+                if frame is None:
+                    break
+                pos, step, players = frame
+                self.apply_frame(step, players)
+            else:
+                print("Unexpected data from the game; reconnecting.")
+                self.disconnect()
+                return
+        del buf[:pos]
+
+    def start_level(self, info):
+        """Builds the level the cabinet started, as replay.new_game does."""
+        from src.game_manager import Game
+        if info["sim_fps"] != c.SIM_FPS:
+            sys.exit(f"The game runs {info['sim_fps']} steps/s, this build {c.SIM_FPS}.")
+        size = tuple(info["size"])
+        if size != (c.WIDTH, c.HEIGHT):
+            if self.game is not None:
+                sys.exit(f"The game's window changed size to {size[0]}x{size[1]}.")
+            # Nothing loaded yet at the old size: match the cabinet's window
+            c.WIDTH, c.HEIGHT = size
+            pygame.display.set_mode(size)
+        if self.game is not None:
+            self.game.release()
+        if info["level_pack"] and not c.LEVEL_PACK:
+            c.LEVEL_PACK = info["level_pack"]
+        c.ENDLESS_MODE = info["endless"]
+        c.LEVEL_DURATION = info["level_duration"]
+        players = info["players"]
+        if players > 1:
+            from src.versus import VersusGame
+            VersusGame.persistent_wins = info["wins"]
+            game = VersusGame(info["level_index"], players)
+        else:
+            game = Game(info["level_index"])
+        if game.level_manager.level_name != info["level_name"]:
+            print(f"Warning: the game is playing {info['level_name']!r}, "
+                  f"this level pack has {game.level_manager.level_name!r} there.")
+        game.lives = info["lives"]
+        game.baseline_coins = info["baseline_coins"]
+        self.game = game
+        self.last = [(0, 0, 0)] * players
+        self.ended = None
+
+    def end_level(self, info):
+        if len(self.game.seats) > 1:
+            self.ended = "Round over"
+        elif info["complete"]:
+            self.ended = "Level complete!"
+        else:
+            self.ended = f"Game over ({info['death']})" if info["death"] else "Game over"
+
+    def apply_frame(self, step, players):
+        game = self.game
+        lm = game.level_manager
+        # Steps this spectator missed are played too: the level only moves by steps
+        while game.frames < step:
+            game.update_objects()
+            game.update_bubbles()
+            game.frames += 1
+        for n, (seat, (x, y, charge, out, coins)) in enumerate(zip(game.seats, players)):
+            player = seat.player
+            player.prev_x, player.prev_y = player.x, player.y
+            player.x, player.y = x, y
+            player.charging = charge > 0
+            player.jump_charge = charge / 255 * c.MAX_JUMP_STRENGTH
+            for coin_id in coins:
+                coin = lm.coin_by_id(coin_id)
+                if coin is not None:
+                    lm.remove_coin(coin)
+            seat.current_level_coins += len(coins)
+            if len(game.seats) > 1:
+                game.deaths[n] = "out" if out else None
+        self.last = [(x, y, charge) for x, y, charge, _, _ in players]
+        self.received = time.perf_counter()
+
+    def draw(self):
+        if self.game is None:
+            self.renderer.fill(c.LIGHT_BLUE)
+        else:
+            # Part way to the next frame, as it should arrive one step later
+            alpha = 1.0 if self.ended else min((time.perf_counter() - self.received) * c.SIM_FPS, 1.0)
+            self.game.draw_frame(alpha)
+        message = self.ended
+        if self.sock is None:
+            message = f"Waiting for the game at {self.address[0]}:{self.address[1]}"
+        if message:
+            text = self.font.render(message, True, c.RED)
+            self.renderer.blit(text, text.get_rect(center=(c.WIDTH // 2, c.HEIGHT // 2)))
+        self.renderer.present()
+
+    def run(self):
+        while True:
+            for event in pygame.event.get():
+                if event.type == pygame.QUIT or (event.type == pygame.KEYDOWN
+                                                 and event.key == pygame.K_ESCAPE):
+                    return
+            if self.sock is None and time.perf_counter() >= self.next_connect:
+                self.connect(time.perf_counter())
+            if self.sock is not None:
+                self.receive()
+            self.draw()
+            self.pacer.wait()
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Watch a game started with --spectate.")
+    parser.add_argument("--host", default=c.SPECTATE_HOST)
+    parser.add_argument("--port", type=int, default=c.SPECTATE_PORT)
+    parser.add_argument("--level-pack", help="the game's level pack, if not at the path it uses")
+    args = parser.parse_args(argv)
+    if args.level_pack:
+        c.LEVEL_PACK = args.level_pack
+
+    from src.renderer import init_renderer
+    pygame.init()
+    pygame.display.set_mode((c.WIDTH, c.HEIGHT))
+    pygame.display.set_caption(f"{c.WINDOW_TITLE} (spectating)")
+    init_renderer("software", (c.WIDTH, c.HEIGHT))
+    Viewer(args.host, args.port).run()
+    pygame.quit()
+
+if __name__ == "__main__":
+    main()
@@ -1,22 +1,31 @@
 # spikes.py
 import pygame
 import src.config as c
+from src.assets import bake, COLORKEY
 
 class Spikes:
     def __init__(self):
         self.height = int(c.SPIKE_HEIGHT_FRAC * c.HEIGHT)
         self.y = c.HEIGHT - self.height
+        self.image = self.render_strip()
 
-    def draw(self, screen):
+    def render_strip(self):
+        """The whole row of spikes, drawn once into a colorkeyed strip."""
+        strip = pygame.Surface((c.WIDTH, self.height + 1))
+        strip.fill(COLORKEY)
         spike_width = c.WIDTH // c.SPIKE_COUNT
         for i in range(c.SPIKE_COUNT):
             left_x = i * spike_width
             right_x = (i + 1) * spike_width
             apex_x = left_x + (spike_width // 2)
-            apex_y = self.y
 
-            base_left = (left_x,  self.y + self.height)
-            base_right = (right_x, self.y + self.height)
-            apex = (apex_x, apex_y)
+            base_left = (left_x, self.height)
+            base_right = (right_x, self.height)
+            apex = (apex_x, 0)
+
+            pygame.draw.polygon(strip, c.SPIKE_COLOR, [base_left, base_right, apex])
+        strip.set_colorkey(COLORKEY)
+        return bake(strip)
 
-            pygame.draw.polygon(screen, c.SPIKE_COLOR, [base_left, base_right, apex])
+    def draw(self, screen):
+        screen.blit(self.image, (0, self.y))
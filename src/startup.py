@@ -0,0 +1,55 @@
+# startup.py
+#
+# Startup timeline: main.py marks each phase (pygame import, window,
+# assets, ...) and Game.run reports the first presented frame. Work that
+# does not need to be ready for that frame (music) is registered with
+# after_first_frame and runs right after it.
+#
+#   python main.py --startup-stats    prints the timeline after the first frame
+
+import time
+
+_started = time.perf_counter()   # main.py imports this module first
+_marks = []                      # [(label, seconds since start)]
+_deferred = []
+_first_frame = None
+
+def mark(label):
+    """Records that a startup phase ended now (ignored after the first frame)."""
+    if _first_frame is None:
+        _marks.append((label, time.perf_counter() - _started))
+
+def after_first_frame(fn):
+    """Runs fn() once the first frame is on screen (immediately if it already is)."""
+    if _first_frame is None:
+        _deferred.append(fn)
+    else:
+        fn()
+
+def first_frame():
+    """
+    Game.run calls this after every present; only the first call counts.
+    Returns True that one time.
+    """
+    global _first_frame
+    if _first_frame is not None:
+        return False
+    mark("first frame")
+    _first_frame = _marks[-1][1]
+    for fn in _deferred:
+        fn()
+    _deferred.clear()
+    return True
+
+def time_to_first_frame():
+    """Seconds from the start of main.py to the first present, or None."""
+    return _first_frame
+
+def report():
+    """The timeline as lines of text: each phase, its duration and the running total."""
+    lines = []
+    previous = 0.0
+    for label, t in _marks:
+        lines.append(f"  {label:<22}{(t - previous) * 1000:8.1f} ms{t * 1000:9.1f} ms")
+        previous = t
+    return lines
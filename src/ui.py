@@ -1,8 +1,7 @@
 # ui.py
 
-import pygame
 import src.config as c
-import src.levels_config as lvl
+from src.levelpack import get_pack
 
 def draw_black_bar_behind_spikes(game):
     spike_height = int(c.SPIKE_HEIGHT_FRAC * c.HEIGHT)
@@ -12,50 +11,87 @@ def draw_black_bar_behind_spikes(game):
         black_bar_top = 0
         black_bar_height = c.HEIGHT
 
-    pygame.draw.rect(
-        game.screen,
+    game.renderer.fill(
         c.SPIKE_BG_COLOR,
         (0, black_bar_top, c.WIDTH, black_bar_height)
     )
 
-def draw_powerup_bar(game):
+def draw_powerup_bar(game, player=None, slot=0, color=(255, 0, 0)):
+    """Jump charge of player (game.player by default); slot counts bars in from the right."""
+    player = player or game.player
     bar_max_height = c.HEIGHT / 6
     bar_width = 30
 
-    fraction = game.player.jump_charge / c.MAX_JUMP_STRENGTH
+    fraction = player.jump_charge / c.MAX_JUMP_STRENGTH
     fraction = max(0, min(fraction, 1))
 
     fill_height = bar_max_height * fraction
-    bar_x = c.WIDTH - bar_width - 10
+    bar_x = c.WIDTH - (bar_width + 10) * (slot + 1)
     bar_y = c.HEIGHT - 10 - bar_max_height
 
     # Outline
-    pygame.draw.rect(game.screen, (0, 0, 0),
-                     (bar_x, bar_y, bar_width, bar_max_height), 2)
+    game.renderer.draw_rect((0, 0, 0),
+                            (bar_x, bar_y, bar_width, bar_max_height), 2)
     # Fill
     fill_rect = (bar_x, bar_y + (bar_max_height - fill_height), bar_width, fill_height)
-    pygame.draw.rect(game.screen, (255, 0, 0), fill_rect)
+    game.renderer.draw_rect(color, fill_rect)
+
+def draw_timer_and_level(game, remaining_time):
+    endless = game.level_manager.endless
+
+    # Timer (distance travelled in endless mode)
+    if endless:
+        timer_text = game.font.render(f"Distance: {int(game.frames * c.SPEED) // 100}", True, c.BLACK)
+    else:
+        timer_text = game.font.render(f"Time: {int(remaining_time)}", True, c.BLACK)
+    game.renderer.blit(timer_text, (10, 10))
+
+    # Show level out of total
+    if endless:
+        level_label = "Endless"
+    else:
+        level_label = f"Level: {game.current_level_index + 1} / {len(get_pack())}"
+    level_text = game.font.render(level_label, True, c.BLACK)
+    level_rect = level_text.get_rect(center=(c.WIDTH // 2, 20))
+    game.renderer.blit(level_text, level_rect)
 
 def draw_hud_text(game, remaining_time):
-    # Timer
-    timer_text = game.font.render(f"Time: {int(remaining_time)}", True, c.BLACK)
-    game.screen.blit(timer_text, (10, 10))
+    draw_timer_and_level(game, remaining_time)
 
     # Combine baseline_coins + current_level_coins for display
     total_coins = game.baseline_coins + game.current_level_coins
 
     coin_text = game.font.render(f"Coins: {total_coins}", True, c.BLACK)
     coin_rect_disp = coin_text.get_rect(topright=(c.WIDTH - 10, 10))
-    game.screen.blit(coin_text, coin_rect_disp)
-
-    # Show level out of total
-    level_text = game.font.render(
-        f"Level: {game.current_level_index + 1} / {len(lvl.LEVELS)}",
-        True, c.BLACK
-    )
-    level_rect = level_text.get_rect(center=(c.WIDTH // 2, 20))
-    game.screen.blit(level_text, level_rect)
+    game.renderer.blit(coin_text, coin_rect_disp)
 
     # Lives
     lives_text = game.font.render(f"Lives: {game.lives}", True, c.BLACK)
-    game.screen.blit(lives_text, (10, 50))
+    game.renderer.blit(lives_text, (10, 50))
+
+def draw_versus_hud(game, remaining_time):
+    """Timer and level, then each player's coins and rounds won in the player's colour."""
+    draw_timer_and_level(game, remaining_time)
+    for i, seat in enumerate(game.seats):
+        status = "out" if game.deaths[i] else f"{seat.current_level_coins} coins"
+        text = game.font.render(f"P{i + 1}: {status} ({game.wins[i]} won)", True, seat.player.color)
+        game.renderer.blit(text, text.get_rect(topright=(c.WIDTH - 10, 10 + 30 * i)))
+
+def draw_frame_stats(game):
+    # Refreshed twice a second: re-rendering the text every frame costs more than it tells
+    if game.pacer.frames % 30 == 0 or not hasattr(game, "frame_stats_text"):
+        s = game.pacer.stats()
+        game.frame_stats_text = game.font.render(
+            f"{s['fps']:.0f} fps  jitter {s['jitter_ms']:.1f} ms  "
+            f"p99 {s['p99_ms']:.1f} ms  late {s['late']}",
+            True, c.BLACK
+        )
+    game.renderer.blit(game.frame_stats_text, (10, 90))
+
+def draw_input_latency(game):
+    s = game.latency.stats()
+    text = game.font.render(
+        f"input {s['p50_ms']:.0f} ms  p95 {s['p95_ms']:.0f} ms  ({s['count']})",
+        True, c.BLACK
+    )
+    game.renderer.blit(text, (10, 130))
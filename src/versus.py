@@ -0,0 +1,161 @@
+# versus.py
+#
+# Local versus: two or more players race the same level at once. The
+# platforms, obstacles and coins are shared and move once per step however
+# many play; each player has their own square, jump timers and coins (a
+# coin goes to whoever reaches it first). A player who dies is out for the
+# round, which ends when everyone is out or the timer runs out. The winner
+# lasted longest, then collected the most coins.
+#
+#   python main.py --versus [N]      N players, 2 by default
+#
+# Player 1: Space charges, X jumps, or the first joystick.
+# Player 2: Enter charges, Right Shift jumps, or the second joystick.
+# Further players use the joysticks after that.
+
+import pygame
+
+import src.config as c
+from src.game_manager import Game, PlayerControls, get_joysticks
+from src.player import Player
+from src.screens import show_versus_result_screen
+from src.ui import draw_powerup_bar, draw_versus_hud
+
+PLAYER_COLORS = [(0, 0, 255), (255, 140, 0), (160, 0, 200), (0, 150, 0)]
+KEYS = [(pygame.K_SPACE, pygame.K_x), (pygame.K_RETURN, pygame.K_RSHIFT)]   # (charge, jump)
+START_SPACING = 40   # px between the players' starting positions
+
+def seat_player(number):
+    return Player(100 + START_SPACING * number, PLAYER_COLORS[number % len(PLAYER_COLORS)])
+
+class Seat(PlayerControls):
+    """
+    A player after the first: their own controls on the Game's level, audio
+    and input latency tracker, so every seat's jumps count in its stats.
+    """
+
+    def __init__(self, game, number, joystick=None):
+        self.number = number
+        self.audio = game.audio
+        self.level_manager = game.level_manager
+        self.latency = game.latency
+        self.joystick = joystick
+        self.recorder = None
+        self.reset_controls()
+
+    def make_player(self):
+        return seat_player(self.number)
+
+class VersusGame(Game):
+    """
+    A Game whose first player is itself (as in single player) plus a Seat
+    for each other player. step() moves the level once, then steps every
+    player still in the round.
+    """
+
+    records_runs = False
+    persistent_wins = []   # rounds won by each player, across rounds
+
+    def __init__(self, level_index=None, players=None):
+        players = players or c.VERSUS_PLAYERS
+        super().__init__(level_index)
+        joysticks = get_joysticks()
+        self.seats = [self] + [Seat(self, n, joysticks[n] if n < len(joysticks) else None)
+                               for n in range(1, players)]
+        self.seat_of_joystick = {j.get_instance_id(): n for n, j in enumerate(joysticks[:players])}
+        self.deaths = [None] * players
+        self.lasted = [0] * players    # steps each player survived this round
+        if len(VersusGame.persistent_wins) != players:
+            VersusGame.persistent_wins = [0] * players
+        self.wins = VersusGame.persistent_wins
+
+    def make_player(self):
+        return seat_player(0)
+
+    def reset(self, level_data=None) -> None:
+        super().reset(level_data)
+        for seat in self.seats[1:]:
+            seat.reset_controls()
+        self.deaths = [None] * len(self.seats)
+        self.lasted = [0] * len(self.seats)
+
+    # -----------------------------------------------------------------
+    # INPUT
+    # -----------------------------------------------------------------
+    def handle_event(self, event, now) -> None:
+        """Routes each key and joystick button to its player's controls."""
+        if event.type in (pygame.KEYDOWN, pygame.KEYUP):
+            for n, (charge, jump) in enumerate(KEYS[:len(self.seats)]):
+                if self.deaths[n] is not None:
+                    continue
+                seat = self.seats[n]
+                if event.key == charge:
+                    if event.type == pygame.KEYDOWN:
+                        seat.charge_pressed("key", now)
+                    else:
+                        seat.charge_released("key", now)
+                elif event.key == jump and event.type == pygame.KEYDOWN:
+                    seat.instant_pressed(now)
+        elif event.type in (pygame.JOYBUTTONDOWN, pygame.JOYBUTTONUP):
+            n = self.seat_of_joystick.get(event.instance_id)
+            if n is None or self.deaths[n] is not None:
+                return
+            seat = self.seats[n]
+            if event.button == 0:
+                if event.type == pygame.JOYBUTTONDOWN:
+                    seat.charge_pressed("joy", now)
+                else:
+                    seat.charge_released("joy", now)
+            elif event.button == 2 and event.type == pygame.JOYBUTTONDOWN:
+                seat.instant_pressed(now)
+
+    # -----------------------------------------------------------------
+    # SIMULATION STEP
+    # -----------------------------------------------------------------
+    def step(self):
+        """
+        The level's entities move once for everyone, then each player still
+        in the round takes their step. Returns the last cause of death once
+        every player is out, else None.
+        """
+        self.audio.new_frame()
+        self.update_objects()
+        death = None
+        for n, seat in enumerate(self.seats):
+            if self.deaths[n] is None:
+                death = self.deaths[n] = seat.step_player()
+                self.lasted[n] = self.frames + 1
+        self.frames += 1
+        if all(d is not None for d in self.deaths):
+            return death
+        return None
+
+    def winner(self):
+        """Index of the round's winner (lasted longest, then most coins), or None on a draw."""
+        scores = [(self.lasted[n], seat.current_level_coins) for n, seat in enumerate(self.seats)]
+        best = max(scores)
+        if scores.count(best) > 1:
+            return None
+        return scores.index(best)
+
+    def seat_out(self, n) -> bool:
+        return self.deaths[n] is not None
+
+    def finish_level(self) -> None:
+        winner = self.winner()
+        if winner is not None:
+            self.wins[winner] += 1
+        show_versus_result_screen(self, winner)
+
+    # -----------------------------------------------------------------
+    # DRAWING
+    # -----------------------------------------------------------------
+    def draw_players(self, alpha: float = 1.0) -> None:
+        for n, seat in enumerate(self.seats):
+            if self.deaths[n] is None:
+                seat.player.draw(self.renderer, alpha)
+
+    def draw_hud(self, remaining_time: float) -> None:
+        draw_versus_hud(self, remaining_time)
+        for n, seat in enumerate(self.seats):
+            draw_powerup_bar(self, seat.player, n, seat.player.color)
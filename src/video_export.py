@@ -0,0 +1,213 @@
+# video_export.py
+#
+# Turns a replay (src/replay.py) into video frames, offline and headless.
+# The main process replays the run at full speed and draws every frame
+# straight into a slot of a shared-memory ring (the slot's Surface is a
+# pygame.image.frombuffer view of it, so nothing is copied); a pool of
+# worker processes encodes finished slots and hands them back.
+#
+#   png   OUT/000001.png, ... (one file per frame)
+#   yuv   OUT as raw I420 (yuv420p, BT.601), each worker writing its frames
+#         at their offset, e.g.
+#         ffmpeg -f rawvideo -pix_fmt yuv420p -s 1200x800 -r 30 -i OUT out.mp4
+#
+#   python -m src.video_export replays/run.json frames/
+#   python -m src.video_export replays/run.json run.yuv --format yuv --fps 60
+
+import argparse
+import multiprocessing as mp
+import os
+import sys
+import time
+from multiprocessing import shared_memory
+
+import src.config as c
+
+FORMATS = ("png", "yuv")
+PIXEL_FORMAT = "RGBX"   # 4 bytes per pixel; blits into it need no conversion
+
+def _frame_bytes(size):
+    return size[0] * size[1] * len(PIXEL_FORMAT)
+
+# ---------------------------------------------------------------------
+# ENCODING (worker processes)
+# ---------------------------------------------------------------------
+def rgbx_to_i420(rgbx, size):
+    """
+    (Y, U, V) planes of one frame: BT.601 limited range in 8-bit fixed
+    point, chroma from each 2x2 block's summed RGB.
+    """
+    import numpy as np
+    w, h = size
+    px = np.frombuffer(rgbx, dtype=np.uint8).reshape(h, w, 4)
+    r, g, b = (px[..., i].astype(np.uint16) for i in range(3))
+    # At most 220 * 255 + 128: fits uint16 without widening the full-size planes
+    y = ((66 * r + 129 * g + 25 * b + 128) >> 8) + 16
+
+    def block_sum(p):
+        return (p[0::2, 0::2] + p[1::2, 0::2] + p[0::2, 1::2] + p[1::2, 1::2]).astype(np.int32)
+    r, g, b = block_sum(r), block_sum(g), block_sum(b)
+    u = ((-38 * r - 74 * g + 112 * b + 512) >> 10) + 128
+    v = ((112 * r - 94 * g - 18 * b + 512) >> 10) + 128
+    return [p.astype(np.uint8) for p in (y, u, v)]
+
+def _encode_worker(shm_name, size, fmt, out, tasks, done):
+    """Encodes (slot, frame) tasks until it gets None; reports each slot back on done."""
+    import pygame
+    shm = shared_memory.SharedMemory(name=shm_name)
+    frame_bytes = _frame_bytes(size)
+    fd = None   # opened with the first frame: out is only created once the replay checks out
+    try:
+        while True:
+            task = tasks.get()
+            if task is None:
+                break
+            slot, frame = task
+            view = shm.buf[slot * frame_bytes:(slot + 1) * frame_bytes]
+            try:
+                if fmt == "png":
+                    surf = pygame.image.frombuffer(view, size, PIXEL_FORMAT)
+                    pygame.image.save(surf, os.path.join(out, f"{frame + 1:06d}.png"))
+                    del surf
+                else:
+                    if fd is None:
+                        fd = os.open(out, os.O_WRONLY)
+                    planes = b"".join(p.tobytes() for p in rgbx_to_i420(view, size))
+                    os.pwrite(fd, planes, frame * len(planes))
+                error = None
+            except Exception as e:
+                error = f"frame {frame + 1}: {e!r}"
+            finally:
+                view.release()
+            done.put((slot, error))
+    finally:
+        if fd is not None:
+            os.close(fd)
+        shm.close()
+
+# ---------------------------------------------------------------------
+# EXPORT (main process)
+# ---------------------------------------------------------------------
+def export(replay_path, out, fmt="png", fps=None, workers=None, slots=None):
+    """
+    Replays the run and writes its frames; fps must be a multiple of
+    c.SIM_FPS (extra frames are drawn between steps, as run() does).
+    Frames are the size of the window the run was recorded in. A replay
+    that doesn't end as recorded raises replay.ReplayError before anything
+    is written. Returns a dict with frames, wall seconds and the result.
+    """
+    import src.replay as replay
+
+    if fmt not in FORMATS:
+        raise ValueError(f"Unknown format {fmt!r}; choose from {', '.join(FORMATS)}")
+    fps = fps or c.SIM_FPS
+    if fps % c.SIM_FPS:
+        raise ValueError(f"fps must be a multiple of the simulation rate ({c.SIM_FPS})")
+    per_step = fps // c.SIM_FPS
+    workers = workers or os.cpu_count()
+    slots = slots or 2 * workers
+
+    rec = replay.load(replay_path)
+    # Before pygame starts: the whole game is laid out for the window's size
+    size = replay.recorded_size(rec)
+    c.WIDTH, c.HEIGHT = size
+    if fmt == "yuv" and (size[0] % 2 or size[1] % 2):
+        raise ValueError("yuv420p needs an even frame size")
+
+    frame_bytes = _frame_bytes(size)
+    shm = shared_memory.SharedMemory(create=True, size=slots * frame_bytes)
+    tasks, done = mp.Queue(), mp.Queue()
+    procs = [mp.Process(target=_encode_worker, args=(shm.name, size, fmt, out, tasks, done),
+                        daemon=True)
+             for _ in range(workers)]
+    for p in procs:
+        p.start()
+
+    # Workers are forked before pygame starts, so they only load what encoding needs
+    from src.headless import init_headless
+    init_headless()
+    import pygame
+    from src.renderer import SoftwareRenderer
+
+    # One renderer per slot, drawing straight into the shared buffer
+    views = [shm.buf[i * frame_bytes:(i + 1) * frame_bytes] for i in range(slots)]
+    renderers = [SoftwareRenderer(pygame.image.frombuffer(v, size, PIXEL_FORMAT)) for v in views]
+    free = list(range(slots))
+    errors = []
+
+    def next_slot():
+        while not free:
+            slot, error = done.get()
+            free.append(slot)
+            if error:
+                errors.append(error)
+        return free.pop()
+
+    started = time.perf_counter()
+    frame = 0
+
+    def draw(game):
+        nonlocal frame
+        for i in range(1, per_step + 1):
+            slot = next_slot()
+            if errors:
+                raise RuntimeError(f"Encoding failed: {errors[0]}")
+            game.renderer = renderers[slot]
+            game.draw_frame(i / per_step)
+            tasks.put((slot, frame))
+            frame += 1
+
+    try:
+        # A quick run without drawing first, so a diverged replay writes nothing
+        replay.check(rec)
+        if fmt == "yuv":
+            open(out, "wb").close()
+        else:
+            os.makedirs(out, exist_ok=True)
+        result = replay.play(rec, draw)
+        while len(free) < slots:
+            slot, error = done.get()
+            free.append(slot)
+            if error:
+                errors.append(error)
+        wall = time.perf_counter() - started
+    finally:
+        for _ in procs:
+            tasks.put(None)
+        for p in procs:
+            p.join()
+        del renderers
+        for v in views:
+            v.release()
+        shm.close()
+        shm.unlink()
+
+    if errors:
+        raise RuntimeError(f"Encoding failed: {errors[0]}")
+    return {"frames": frame, "fps": fps, "wall": wall, "result": result}
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Export a replay as video frames.")
+    parser.add_argument("replay", help="replay file (python main.py --record)")
+    parser.add_argument("out", help="directory for png, file for yuv")
+    parser.add_argument("--format", choices=FORMATS, default="png")
+    parser.add_argument("--fps", type=int, default=c.SIM_FPS,
+                        help=f"frames per second of video, a multiple of {c.SIM_FPS}")
+    parser.add_argument("--workers", type=int, default=os.cpu_count(), help="encoding processes")
+    parser.add_argument("--slots", type=int, help="shared frame buffers (default 2 per worker)")
+    args = parser.parse_args(argv)
+
+    import src.replay as replay
+    try:
+        s = export(args.replay, args.out, args.format, args.fps, args.workers, args.slots)
+    except replay.ReplayError as e:
+        sys.exit(f"Cannot export {args.replay}: {e}")
+    video_s = s["frames"] / s["fps"]
+    print(f"Exported {s['frames']} frames ({video_s:.1f} s of video) in {s['wall']:.1f} s: "
+          f"{s['frames'] / s['wall']:.0f} frames/s, {video_s / s['wall']:.1f}x real time")
+    if args.format == "yuv":
+        print(f"ffmpeg -f rawvideo -pix_fmt yuv420p -s {c.WIDTH}x{c.HEIGHT} -r {s['fps']} "
+              f"-i {args.out} out.mp4")
+
+if __name__ == "__main__":
+    main()